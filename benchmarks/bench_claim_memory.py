@@ -0,0 +1,37 @@
+"""
+Measures the memory held per decoded claim for the default dataclasses and the
+slotted Compact* variants.
+
+    PYTHONPATH=. python benchmarks/bench_claim_memory.py [count]
+"""
+import sys
+import tracemalloc
+
+from hawkeye_sdk_for_python.utils import type_claim
+from payload import synthetic_payload
+
+
+def bytes_per_claim(payload: list[dict], compact: bool) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    claims = [type_claim(item, compact=compact) for item in payload]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del claims
+    return allocated / len(payload)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    payload = synthetic_payload(count)
+    default = bytes_per_claim(payload, compact=False)
+    compact = bytes_per_claim(payload, compact=True)
+    print(f"claims:            {count}")
+    print(f"Claim:             {default:,.0f} bytes/claim")
+    print(f"CompactClaim:      {compact:,.0f} bytes/claim")
+    print(f"saving:            {1 - compact / default:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compares summing settlement and fee fields over Claim objects against the
+columnar exports, over a synthetic get_claims payload. The timings include
+decoding the payload into objects or columns.
+
+    PYTHONPATH=. python benchmarks/bench_claims_table.py [count]
+"""
+import sys
+import time
+
+from hawkeye_sdk_for_python.columnar import claims_to_arrow, claims_to_numpy
+from hawkeye_sdk_for_python.utils import type_claim
+from payload import synthetic_payload
+
+FIELDS = ("estimateamount", "dv_amt", "settlement_pd", "settlement_dv", "administrativefee")
+
+
+def sum_objects(payload: list[dict]) -> float:
+    claims = [type_claim(item) for item in payload]
+    return sum(getattr(claim, name) or 0.0 for claim in claims for name in FIELDS)
+
+
+def sum_numpy(payload: list[dict]) -> float:
+    import numpy as np
+    arrays = claims_to_numpy(payload)
+    return float(sum(np.nansum(arrays[name]) for name in FIELDS))
+
+
+def sum_arrow(payload: list[dict]) -> float:
+    import pyarrow.compute as pc
+    table = claims_to_arrow(payload)
+    return sum(pc.sum(table[name]).as_py() or 0.0 for name in FIELDS)
+
+
+def timed(func, payload: list[dict]) -> tuple[float, float]:
+    started = time.perf_counter()
+    total = func(payload)
+    return time.perf_counter() - started, total
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    payload = synthetic_payload(count)
+    for name, func in (("Claim objects", sum_objects), ("numpy", sum_numpy), ("pyarrow", sum_arrow)):
+        try:
+            seconds, total = timed(func, payload)
+        except ImportError as exc:
+            print(f"{name:<14} skipped: {exc}")
+            continue
+        print(f"{name:<14} {seconds:.3f}s  total={total:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
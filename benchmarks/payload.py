@@ -0,0 +1,23 @@
+"""Synthetic get_claims payloads shared by the benchmarks."""
+from hawkeye_sdk_for_python.types import Claim
+
+
+def synthetic_claim(n: int) -> dict:
+    return {
+        field_name: (n if field_name == "filenumber" else None)
+        for field_name in Claim.__dataclass_fields__
+        if field_name not in ("docfiles", "logtrail")
+    } | {
+        "customername": "Test Company - City, ST",
+        "rentername": "John Doe",
+        "insurancecompany": "Test Insurance Co.",
+        "vin": "1ABCD23E45FG67890",
+        "vehyear": 2022,
+        "estimateamount": 2933.95,
+        "docfiles": [{"doctype": "Images", "dateadded": "2024-12-23", "user": "test", "notes": "", "filename": f"{n}-{i}.jpg"} for i in range(3)],
+        "logtrail": [{"date": "2024-12-23", "activity": "Claim created", "user": "test"} for _ in range(2)],
+    }
+
+
+def synthetic_payload(count: int) -> list[dict]:
+    return [synthetic_claim(n) for n in range(count)]
@@ -1,3 +1,12 @@
-from .client import HawkeyeClient
+from .client import HawkeyeClient, AsyncHawkeyeClient
+from .cache import ResponseCache, CacheStats
+from .compression import CompressionSettings, TransferStats
+from .diskcache import DiskCache
+from .instrumentation import RequestEvent, MetricsCollector, OpenTelemetryHook
+from .ratelimit import RateLimiter, TokenBucket
+from .outbox import Outbox, OutboxEntry
+from .collection import ClaimCollection
+from .mirror import ClaimsMirror, SyncStats
+from .writebehind import WriteBehindQueue, AsyncWriteBehindQueue
 from .types import *
-from .exceptions import *
\ No newline at end of file
+from .exceptions import *
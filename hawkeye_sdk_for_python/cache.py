@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+import httpx
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    revalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class Validators:
+    """The HTTP validators of a cached response, sent back as If-None-Match and If-Modified-Since."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> Optional["Validators"]:
+        """Returns the response's ETag and Last-Modified headers, or None if it carries neither."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        return cls(etag, last_modified) if etag or last_modified else None
+
+    def request_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    A bounded, thread-safe, in-memory cache of decoded API results with per-entry TTL and LRU eviction.
+     The same instance can be shared by several clients. Cached objects are returned as-is, so callers
+     should treat them as read-only. An entry stored with validators (ETag or Last-Modified) is kept after it
+     expires, until it is evicted, so it can be revalidated with a conditional request instead of refetched.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 300.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            maxsize (int): The maximum number of entries kept. The least recently used entry is evicted first.
+            ttl (float, optional): Seconds an entry stays valid. None keeps entries until they are evicted or invalidated.
+            clock (Callable, optional): Monotonic time source, replaceable for testing.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any, Optional[Validators]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value, validators = entry
+            if expires_at <= self._clock():
+                if validators is None:
+                    del self._entries[key]
+                    self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, validators: Optional[Validators] = None):
+        """Stores value under key, evicting the least recently used entry if the cache is full."""
+        with self._lock:
+            self._entries[key] = (self._expires_at(), value, validators)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def stale(self, key: Hashable) -> Optional[tuple[Any, Validators]]:
+        """Returns the value and validators stored under key, fresh or expired, or None if it has no validators."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] is None:
+                return None
+            return entry[1], entry[2]
+
+    def revalidate(self, key: Hashable, validators: Optional[Validators] = None):
+        """Restarts the TTL of key after the server confirmed it is unchanged, updating its validators if given."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            self._entries[key] = (self._expires_at(), entry[1], validators or entry[2])
+            self._entries.move_to_end(key)
+            self.stats.revalidations += 1
+
+    def _expires_at(self) -> float:
+        return self._clock() + self.ttl if self.ttl is not None else float("inf")
+
+    def invalidate(self, key: Hashable):
+        """Drops the entry for key, if any."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def claim_key(filenumber: Any) -> tuple:
+    """Cache key of a single claim. Filenumbers are normalised so 123 and "123" share an entry."""
+    return ("claim", str(filenumber))
+
+def claims_key(include_inactive: bool) -> tuple:
+    """Cache key of the full claims list, which is always revalidated before it is reused."""
+    return ("claims", bool(include_inactive))
+
+def inscompanies_key(query: str, limit: int) -> tuple:
+    """Cache key of an insurance company lookup."""
+    return ("inscompanies", query, limit)
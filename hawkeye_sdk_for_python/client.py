@@ -1,43 +1,265 @@
 import httpx
-from .types import ClientSettings
+from typing import Callable, Iterable, Optional, Union
+from .types import ClientSettings, RetryPolicy, TransportSettings
 from .constants import BASE_URL, DEV_BASE_URL
-from .modules import ClaimsModule, DocfilesModule, LogtrailsModule, InsCompaniesModule
+from .serialization import get_json_codec
+from .cache import ResponseCache
+from .compression import CompressionSettings, TransferStats
+from .diskcache import DiskCache
+from .instrumentation import RequestEvent
+from .outbox import Outbox
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .ratelimit import RateLimiter
+from .transports import (
+    RetryTransport,
+    AsyncRetryTransport,
+    RateLimitTransport,
+    AsyncRateLimitTransport,
+    CompressionTransport,
+    AsyncCompressionTransport,
+    InstrumentedTransport,
+    AsyncInstrumentedTransport,
+)
+from .modules import (
+    ClaimsModule,
+    DocfilesModule,
+    LogtrailsModule,
+    InsCompaniesModule,
+    AsyncClaimsModule,
+    AsyncDocfilesModule,
+    AsyncLogtrailsModule,
+    AsyncInsCompaniesModule,
+    OutboxModule,
+    AsyncOutboxModule,
+)
+
+
+def _client_settings(auth_token: str, debug_mode: bool, **options) -> tuple[ClientSettings, dict]:
+    """Builds the settings and default headers shared by the sync and async clients."""
+    base_url = DEV_BASE_URL if debug_mode else BASE_URL
+    settings = ClientSettings(
+        auth_token=auth_token,
+        dev_env=debug_mode,
+        base_url=base_url,
+        **options,
+    )
+    headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {auth_token}",
+            }
+    if settings.compression is not None:
+        headers["Accept-Encoding"] = settings.compression.accept_encoding_header()
+    return settings, headers
+
+def _transfer_stats(settings: ClientSettings) -> TransferStats:
+    """Returns the transfer statistics compressed requests are counted in, creating them if settings has none."""
+    if settings.transfer_stats is None:
+        settings.transfer_stats = TransferStats()
+    return settings.transfer_stats
+
+def _build_transport(settings: ClientSettings) -> httpx.BaseTransport:
+    """Wraps the configured transport with the client-level request policies."""
+    transport = settings.transport.build_transport()
+    if settings.compression is not None:
+        transport = CompressionTransport(transport, settings.compression, _transfer_stats(settings))
+    if settings.hooks:
+        transport = InstrumentedTransport(transport)
+    if settings.rate_limiter is not None:
+        transport = RateLimitTransport(transport, settings.rate_limiter)
+    if settings.retry is not None:
+        transport = RetryTransport(transport, settings.retry)
+    return transport
+
+def _build_async_transport(settings: ClientSettings) -> httpx.AsyncBaseTransport:
+    """Async counterpart of _build_transport."""
+    transport = settings.transport.build_async_transport()
+    if settings.compression is not None:
+        transport = AsyncCompressionTransport(transport, settings.compression, _transfer_stats(settings))
+    if settings.hooks:
+        transport = AsyncInstrumentedTransport(transport)
+    if settings.rate_limiter is not None:
+        transport = AsyncRateLimitTransport(transport, settings.rate_limiter)
+    if settings.retry is not None:
+        transport = AsyncRetryTransport(transport, settings.retry)
+    return transport
 
 
 class HawkeyeClient:
-    def __init__(self, auth_token: str, debug_mode: bool = False):
+    def __init__(
+            self,
+            auth_token: str,
+            debug_mode: bool = False,
+            compact_records: bool = False,
+            json_backend: str = "stdlib",
+            transport_settings: Optional[TransportSettings] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            cache: Optional[Union[ResponseCache, DiskCache]] = None,
+            outbox: Optional[Outbox] = None,
+            coalesce_reads: bool = True,
+            compression: Optional[CompressionSettings] = None,
+            hooks: Optional[Iterable[Callable[[RequestEvent], None]]] = None,
+            ):
         """
         Initializes the Hawkeye API client with the provided authentication token and debug mode setting.
         Args:
             auth_token (str): The authentication token for API access.
             debug_mode (bool, optional): If True, uses the development environment. Defaults to False.
+            compact_records (bool, optional): If True, claims are returned as slotted CompactClaim records
+             (with CompactDocFile and CompactLogTrail children) that use far less memory. Defaults to False.
+            json_backend (str, optional): JSON library for request and response bodies: "stdlib", "orjson",
+             "msgspec", or "auto" to pick the fastest one installed. Defaults to "stdlib".
+            transport_settings (TransportSettings, optional): Connection pool limits, keep-alive expiry, HTTP/2,
+             per-phase timeouts and an optional custom transport. Defaults to TransportSettings().
+            retry_policy (RetryPolicy, optional): Retries 429/5xx responses and transport errors with exponential
+             backoff, jitter and Retry-After support. Defaults to None (no retries).
+            rate_limiter (RateLimiter, optional): Token-bucket budgets applied to every request, including each
+             retry attempt. May be shared with other clients. Defaults to None (no client-side limit).
+            cache (ResponseCache, optional): In-memory TTL/LRU cache for get_single_claim and get_insurance_companies.
+             Writes to a filenumber drop its cached claim. Responses with an ETag or Last-Modified header are revalidated
+             with conditional requests once they expire, and get_claims reuses its decoded list on 304 Not Modified.
+             Pass a DiskCache instead to keep results across processes. Defaults to None (no caching).
+            outbox (Outbox, optional): Durable SQLite outbox behind client.outbox, whose writes are committed locally
+             and replayed to the API in the background. Defaults to None (client.outbox is None).
+            coalesce_reads (bool, optional): If True, concurrent get_single_claim calls for one filenumber, and concurrent
+             get_insurance_companies calls for one query, share a single in-flight request and its result. Defaults to True.
+            compression (CompressionSettings, optional): Accept-Encoding negotiation (gzip, deflate, and br or zstd when their
+             decoders are installed) and optional gzip request bodies. Bytes on the wire and after decoding are then counted
+             per endpoint in client.transfer_stats. Defaults to None (httpx's default Accept-Encoding, no accounting).
+            hooks (Iterable[Callable], optional): Called with a RequestEvent after every module call, with its operation,
+             endpoint, status, timings, bytes, retries and decode/typing time. See MetricsCollector and OpenTelemetryHook.
+             Defaults to None (no instrumentation).
         """
-        base_url = DEV_BASE_URL if debug_mode else BASE_URL
-        headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {auth_token}",
-                }
-        
-        self.settings = ClientSettings(
-            auth_token=auth_token,
-            dev_env=debug_mode,
-            base_url=base_url,
+        self.settings, headers = _client_settings(
+            auth_token,
+            debug_mode,
+            compact_records=compact_records,
+            json_codec=get_json_codec(json_backend),
+            transport=transport_settings or TransportSettings(),
+            retry=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            outbox=outbox,
+            single_flight=SingleFlight() if coalesce_reads else None,
+            compression=compression,
+            transfer_stats=TransferStats() if compression is not None else None,
+            hooks=tuple(hooks or ()),
         )
         self._http_client = httpx.Client(
-                base_url=base_url,
+                base_url=self.settings.base_url,
+                headers=headers,
+                timeout=self.settings.transport.timeout(),
+                transport=_build_transport(self.settings),
+                )
+        self.claims = ClaimsModule(self._http_client, self.settings)
+        self.docfiles = DocfilesModule(self._http_client, self.settings)
+        self.logtrails = LogtrailsModule(self._http_client, self.settings)
+        self.inscompanies = InsCompaniesModule(self._http_client, self.settings)
+        self.transfer_stats = self.settings.transfer_stats
+        self.outbox = OutboxModule(self._http_client, self.settings) if outbox is not None else None
+        if self.outbox is not None:
+            self.outbox.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Posts any buffered log trail entries, stops the outbox drainer and closes the underlying connection pool."""
+        self.logtrails.disable_write_behind()
+        if self.outbox is not None:
+            self.outbox.stop()
+        self._http_client.close()
+
+
+class AsyncHawkeyeClient:
+    def __init__(
+            self,
+            auth_token: str,
+            debug_mode: bool = False,
+            compact_records: bool = False,
+            json_backend: str = "stdlib",
+            transport_settings: Optional[TransportSettings] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            cache: Optional[Union[ResponseCache, DiskCache]] = None,
+            outbox: Optional[Outbox] = None,
+            coalesce_reads: bool = True,
+            compression: Optional[CompressionSettings] = None,
+            hooks: Optional[Iterable[Callable[[RequestEvent], None]]] = None,
+            ):
+        """
+        Initializes the asyncio-native Hawkeye API client. All module methods are coroutines that share
+         a single httpx.AsyncClient connection pool, so many calls can run concurrently from one event loop.
+        Args:
+            auth_token (str): The authentication token for API access.
+            debug_mode (bool, optional): If True, uses the development environment. Defaults to False.
+            compact_records (bool, optional): If True, claims are returned as slotted CompactClaim records
+             (with CompactDocFile and CompactLogTrail children) that use far less memory. Defaults to False.
+            json_backend (str, optional): JSON library for request and response bodies: "stdlib", "orjson",
+             "msgspec", or "auto" to pick the fastest one installed. Defaults to "stdlib".
+            transport_settings (TransportSettings, optional): Connection pool limits, keep-alive expiry, HTTP/2,
+             per-phase timeouts and an optional custom transport. Defaults to TransportSettings().
+            retry_policy (RetryPolicy, optional): Retries 429/5xx responses and transport errors with exponential
+             backoff, jitter and Retry-After support. Defaults to None (no retries).
+            rate_limiter (RateLimiter, optional): Token-bucket budgets applied to every request, including each
+             retry attempt. May be shared with other clients. Defaults to None (no client-side limit).
+            cache (ResponseCache, optional): In-memory TTL/LRU cache for get_single_claim and get_insurance_companies.
+             Writes to a filenumber drop its cached claim. Responses with an ETag or Last-Modified header are revalidated
+             with conditional requests once they expire, and get_claims reuses its decoded list on 304 Not Modified.
+             Pass a DiskCache instead to keep results across processes. Defaults to None (no caching).
+            outbox (Outbox, optional): Durable SQLite outbox behind client.outbox, whose writes are committed locally
+             and replayed to the API in the background. Defaults to None (client.outbox is None).
+            coalesce_reads (bool, optional): If True, concurrent get_single_claim calls for one filenumber, and concurrent
+             get_insurance_companies calls for one query, share a single in-flight request and its result. Defaults to True.
+            compression (CompressionSettings, optional): Accept-Encoding negotiation (gzip, deflate, and br or zstd when their
+             decoders are installed) and optional gzip request bodies. Bytes on the wire and after decoding are then counted
+             per endpoint in client.transfer_stats. Defaults to None (httpx's default Accept-Encoding, no accounting).
+            hooks (Iterable[Callable], optional): Called with a RequestEvent after every module call, with its operation,
+             endpoint, status, timings, bytes, retries and decode/typing time. See MetricsCollector and OpenTelemetryHook.
+             Defaults to None (no instrumentation).
+        """
+        self.settings, headers = _client_settings(
+            auth_token,
+            debug_mode,
+            compact_records=compact_records,
+            json_codec=get_json_codec(json_backend),
+            transport=transport_settings or TransportSettings(),
+            retry=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            outbox=outbox,
+            single_flight=AsyncSingleFlight() if coalesce_reads else None,
+            compression=compression,
+            transfer_stats=TransferStats() if compression is not None else None,
+            hooks=tuple(hooks or ()),
+        )
+        self._http_client = httpx.AsyncClient(
+                base_url=self.settings.base_url,
                 headers=headers,
-                timeout=60.0,
+                timeout=self.settings.transport.timeout(),
+                transport=_build_async_transport(self.settings),
                 )
-        self.claims = ClaimsModule(self._http_client)
-        self.docfiles = DocfilesModule(self._http_client)
-        self.logtrails = LogtrailsModule(self._http_client)
-        self.inscompanies = InsCompaniesModule(self._http_client)
+        self.claims = AsyncClaimsModule(self._http_client, self.settings)
+        self.docfiles = AsyncDocfilesModule(self._http_client, self.settings)
+        self.logtrails = AsyncLogtrailsModule(self._http_client, self.settings)
+        self.inscompanies = AsyncInsCompaniesModule(self._http_client, self.settings)
+        self.transfer_stats = self.settings.transfer_stats
+        self.outbox = AsyncOutboxModule(self._http_client, self.settings) if outbox is not None else None
 
-        def __enter__(self):
-            return self
+    async def __aenter__(self):
+        if self.outbox is not None:
+            self.outbox.start()
+        return self
 
-        def __exit__(self, exc_type, exc_value, traceback):
-            self._http_client.close()
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
 
-        def close(self):
-            self._http_client.close()
+    async def aclose(self):
+        """Posts any buffered log trail entries, stops the outbox drainer and closes the underlying connection pool."""
+        await self.logtrails.disable_write_behind()
+        if self.outbox is not None:
+            await self.outbox.stop()
+        await self._http_client.aclose()
@@ -0,0 +1,167 @@
+import operator
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Iterator, Optional, Union, overload
+
+from .types import Claim
+
+INDEXED_FIELDS = ("filenumber", "vin", "claimnumber", "clientclaimno", "ranumber", "platenumber")
+
+_DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d", "%m/%d/%Y %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S")
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "between": lambda value, bounds: bounds[0] <= value <= bounds[1],
+    "in": lambda value, options: value in options,
+}
+
+def parse_date(value: Any) -> Optional[date]:
+    """Parses the date formats the API uses (MM/DD/YYYY or ISO), returning None for blanks and unparseable values."""
+    if value is None or isinstance(value, date):
+        return value.date() if isinstance(value, datetime) else value
+    text = str(value).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+def _index_key(value: Any) -> Any:
+    """Identifiers are matched ignoring case and surrounding whitespace, and 123 matches "123"."""
+    return None if value is None else str(value).strip().upper()
+
+def _is_date_field(name: str) -> bool:
+    return "date" in name
+
+
+class ClaimCollection(Sequence):
+    """
+    An immutable list of claims with hash indexes on identifier fields (filenumber, vin, claimnumber,
+     clientclaimno, ranumber, platenumber). Each index is built the first time it is used, after which
+     a lookup costs O(1) instead of a scan of every claim.
+    """
+
+    def __init__(self, claims: Iterable[Claim] = ()):
+        self._claims = list(claims)
+        self._indexes: dict[str, dict[Any, list[Claim]]] = {}
+
+    @overload
+    def __getitem__(self, index: int) -> Claim: ...
+    @overload
+    def __getitem__(self, index: slice) -> "ClaimCollection": ...
+    def __getitem__(self, index: Union[int, slice]) -> Union[Claim, "ClaimCollection"]:
+        if isinstance(index, slice):
+            return ClaimCollection(self._claims[index])
+        return self._claims[index]
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    def __iter__(self) -> Iterator[Claim]:
+        return iter(self._claims)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ClaimCollection):
+            return self._claims == other._claims
+        return isinstance(other, list) and self._claims == other
+
+    def __repr__(self) -> str:
+        return f"ClaimCollection({len(self._claims)} claims)"
+
+    def _index(self, field: str) -> dict[Any, list[Claim]]:
+        index = self._indexes.get(field)
+        if index is None:
+            index = {}
+            for claim in self._claims:
+                key = _index_key(getattr(claim, field))
+                if key is not None:
+                    index.setdefault(key, []).append(claim)
+            self._indexes[field] = index
+        return index
+
+    def find(self, field: str, value: Any) -> list[Claim]:
+        """
+        Returns every claim whose identifier field matches value.
+        Args:
+            field (str): One of filenumber, vin, claimnumber, clientclaimno, ranumber or platenumber.
+            value (Any): The identifier to look up, matched ignoring case and surrounding whitespace.
+        Returns:
+            list[Claim]: The matching claims, in collection order.
+        """
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"{field} is not an indexed field. Use one of: {', '.join(INDEXED_FIELDS)}.")
+        return list(self._index(field).get(_index_key(value), ()))
+
+    def get(self, field: str, value: Any) -> Optional[Claim]:
+        """Returns the first claim whose identifier field matches value, or None."""
+        matches = self.find(field, value)
+        return matches[0] if matches else None
+
+    def by_vin(self, vin: str) -> list[Claim]:
+        """Returns the claims for a VIN, e.g. to match an inbound invoice."""
+        return self.find("vin", vin)
+
+    def filter(self, **conditions: Any) -> "ClaimCollection":
+        """
+        Returns the claims matching every condition. A condition is field=value for equality, or
+         field__op=value with op one of eq, ne, lt, lte, gt, gte, between (a (low, high) tuple, inclusive) and in.
+         Fields whose name contains "date" are compared as dates, so bounds may be date objects or date strings.
+         Identifier fields are matched like find, through their index. Claims whose field is None never match
+         a comparison.
+        Example:
+            claims.filter(insurancecompany="GEICO", dateofloss__between=("01/01/2025", "03/31/2025"), estimateamount__gte=1000)
+        """
+        candidates: Iterable[Claim] = self._claims
+        tests = []
+        for condition, expected in conditions.items():
+            field, _, op = condition.partition("__")
+            op = op or "eq"
+            if op not in _OPERATORS:
+                raise ValueError(f"Unknown operator {op!r} in {condition!r}.")
+            if op == "eq" and field in INDEXED_FIELDS:
+                if candidates is self._claims:
+                    candidates = self._index(field).get(_index_key(expected), ())
+                else:
+                    tests.append((field, lambda value, key: _index_key(value) == key, _index_key(expected)))
+                continue
+            tests.append((field, _OPERATORS[op], self._comparable(field, op, expected)))
+
+        def matches(claim: Claim) -> bool:
+            for field, compare, expected in tests:
+                value = getattr(claim, field)
+                if _is_date_field(field):
+                    value = parse_date(value)
+                if value is None and compare is not operator.eq and compare is not operator.ne:
+                    return False
+                if not compare(value, expected):
+                    return False
+            return True
+
+        return ClaimCollection(claim for claim in candidates if matches(claim))
+
+    @staticmethod
+    def _comparable(field: str, op: str, expected: Any) -> Any:
+        if not _is_date_field(field):
+            return expected
+        if op == "between":
+            return tuple(parse_date(bound) for bound in expected)
+        if op == "in":
+            return {parse_date(option) for option in expected}
+        return parse_date(expected)
+
+    def group_by(self, field: str) -> dict[Any, "ClaimCollection"]:
+        """Groups the claims by the value of a field, e.g. insurancecompany or hc_adj, keeping collection order."""
+        groups: dict[Any, list[Claim]] = {}
+        for claim in self._claims:
+            groups.setdefault(getattr(claim, field), []).append(claim)
+        return {key: ClaimCollection(claims) for key, claims in groups.items()}
+
+    def sum(self, field: str) -> float:
+        """Adds up a numeric field, skipping claims where it is None."""
+        return sum(value for value in (getattr(claim, field) for claim in self._claims) if value is not None)
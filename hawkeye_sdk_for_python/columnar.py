@@ -0,0 +1,126 @@
+from dataclasses import fields
+from datetime import date
+from typing import Any, Iterable, Optional, get_args
+
+from .collection import parse_date
+from .types import Claim
+
+_CHILDREN = ("docfiles", "logtrail")
+
+def _column_kind(name: str, annotation: Any) -> str:
+    args = get_args(annotation) or (annotation,)
+    if bool in args:
+        return "bool"
+    if int in args:
+        return "int"
+    if float in args:
+        return "float"
+    return "date" if "date" in name else "str"
+
+COLUMN_KINDS: dict[str, str] = {f.name: _column_kind(f.name, f.type) for f in fields(Claim) if f.name not in _CHILDREN}
+
+# Python types a value must have to fit a column kind. The API does not always send what Claim declares:
+# liabilityaccepted and liabilitydenied are annotated as flags but carry dates.
+_KIND_TYPES = {"bool": (bool,), "int": (int,), "float": (int, float), "date": (str,)}
+
+def _fits(kind: str, value: Any) -> bool:
+    accepted = _KIND_TYPES.get(kind)
+    if accepted is None or value is None:
+        return True
+    return isinstance(value, accepted) and (kind == "bool" or not isinstance(value, bool))
+
+def _typed_columns(portal_json: Iterable[dict]) -> tuple[dict[str, list], dict[str, str]]:
+    """
+    Transposes the payload and settles the kind of each column. A column keeps its annotated kind only if
+     every value fits it; otherwise it falls back to "str", with non-null values converted to text.
+    """
+    rows = portal_json if isinstance(portal_json, list) else list(portal_json)
+    columns = {name: [row.get(name) for row in rows] for name in COLUMN_KINDS}
+    kinds = {}
+    for name, kind in COLUMN_KINDS.items():
+        values = columns[name]
+        if not all(_fits(kind, value) for value in values):
+            kind = "str"
+            columns[name] = [None if value is None else str(value) for value in values]
+        elif kind == "date":
+            columns[name] = _parse_dates(values)
+        kinds[name] = kind
+    return columns, kinds
+
+def claims_to_columns(portal_json: Iterable[dict]) -> dict[str, list]:
+    """
+    Transposes claim objects as returned by the API into one list per Claim field, without building
+     Claim objects. Date fields are parsed into datetime.date; docfiles and logtrail are left out. A field
+     whose values do not match its Claim annotation, such as dates sent in a flag, is returned as text.
+    """
+    return _typed_columns(portal_json)[0]
+
+def _parse_dates(values: list) -> list[Optional[date]]:
+    """Parses a column of date strings, parsing each distinct string once."""
+    parsed: dict[Any, Optional[date]] = {}
+    result = []
+    for value in values:
+        if value not in parsed:
+            parsed[value] = parse_date(value) if value not in (None, "") else None
+        result.append(parsed[value])
+    return result
+
+def claims_to_numpy(portal_json: Iterable[dict]) -> dict[str, Any]:
+    """
+    Builds a dict of NumPy arrays, one per Claim field, straight from the API payload.
+     Amount fields are float64 and int fields int64, with NaN standing in for missing values (an int column
+     with gaps becomes float64). Flags are bool arrays where missing counts as False, dates are
+     datetime64[D] with NaT for missing or unparseable values, and text fields are object arrays.
+     Fields whose values do not match their annotation are object arrays of text.
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError("claims_to_numpy requires the numpy package: pip install numpy") from exc
+
+    arrays = {}
+    columns, kinds = _typed_columns(portal_json)
+    for name, values in columns.items():
+        kind = kinds[name]
+        if kind == "float" or (kind == "int" and None in values):
+            arrays[name] = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        elif kind == "int":
+            arrays[name] = np.array(values, dtype=np.int64)
+        elif kind == "bool":
+            arrays[name] = np.array([bool(value) for value in values], dtype=np.bool_)
+        elif kind == "date":
+            arrays[name] = np.array(["NaT" if value is None else value.isoformat() for value in values], dtype="datetime64[D]")
+        else:
+            arrays[name] = np.array(values, dtype=object)
+    return arrays
+
+def claims_to_arrow(portal_json: Iterable[dict]) -> Any:
+    """
+    Builds a pyarrow Table with one typed column per Claim field, straight from the API payload.
+     Amounts are float64, int fields int64, flags bool, dates date32 and text string, with missing values
+     kept as nulls. Fields whose values do not match their annotation are string columns.
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise ImportError("claims_to_arrow requires the pyarrow package: pip install pyarrow") from exc
+
+    types = {"float": pa.float64(), "int": pa.int64(), "bool": pa.bool_(), "date": pa.date32(), "str": pa.string()}
+    columns, kinds = _typed_columns(portal_json)
+    return pa.table({name: pa.array(values, type=types[kinds[name]]) for name, values in columns.items()})
+
+_EXPORTERS = {
+    "arrow": claims_to_arrow,
+    "numpy": claims_to_numpy,
+    "columns": claims_to_columns,
+}
+
+def claims_table(portal_json: Iterable[dict], backend: str = "arrow") -> Any:
+    """Dispatches to claims_to_arrow, claims_to_numpy or claims_to_columns by backend name."""
+    if backend not in _EXPORTERS:
+        raise ValueError(f"Unknown table backend {backend!r}. Expected one of: {', '.join(_EXPORTERS)}.")
+    return _EXPORTERS[backend](portal_json)
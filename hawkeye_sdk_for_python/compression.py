@@ -0,0 +1,113 @@
+import gzip
+import threading
+from dataclasses import dataclass, fields, replace
+from importlib.util import find_spec
+from typing import Optional
+
+# Content codings in order of preference. gzip and deflate are always available; br and zstd need the
+# decoder package httpx uses for them.
+_ENCODINGS = ("zstd", "br", "gzip", "deflate")
+_DECODER_PACKAGES = {"br": ("brotli", "brotlicffi"), "zstd": ("zstandard",)}
+
+def supported_encodings() -> tuple[str, ...]:
+    """Returns the response content codings httpx can decode in this environment, most preferred first."""
+    return tuple(
+        encoding for encoding in _ENCODINGS
+        if encoding not in _DECODER_PACKAGES or any(find_spec(package) for package in _DECODER_PACKAGES[encoding])
+    )
+
+
+@dataclass
+class CompressionSettings:
+    """
+    Compression negotiated with the API. Responses are requested with an Accept-Encoding header listing
+     the codings in accept_encoding that can be decoded here. Request bodies are only compressed when
+     compress_requests is set, because the server has to support gzip-encoded bodies.
+    """
+    accept_encoding: Optional[tuple[str, ...]] = None
+    compress_requests: bool = False
+    request_min_size: int = 1024
+    compresslevel: int = 6
+
+    def __post_init__(self):
+        unknown = set(self.accept_encoding or ()) - set(_ENCODINGS)
+        if unknown:
+            raise ValueError(f"Unknown content codings {sorted(unknown)}. Expected some of: {', '.join(_ENCODINGS)}.")
+
+    def accept_encoding_header(self) -> str:
+        """
+        Returns the Accept-Encoding header value. None in accept_encoding means every supported coding;
+         codings whose decoder is not installed are left out, and an empty list asks for identity only.
+        """
+        available = supported_encodings()
+        wanted = available if self.accept_encoding is None else [name for name in self.accept_encoding if name in available]
+        return ", ".join(wanted) or "identity"
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """Returns body gzip-compressed, or None if request compression is off or the body is too small to bother."""
+        if not self.compress_requests or len(body) < self.request_min_size:
+            return None
+        return gzip.compress(body, compresslevel=self.compresslevel, mtime=0)
+
+
+@dataclass
+class EndpointTransfer:
+    """Byte counts for one endpoint. Wire bytes are as sent or received, before decompression."""
+    responses: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    compressed_requests: int = 0
+    body_bytes: int = 0
+    body_wire_bytes: int = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Decoded response bytes per byte received, e.g. 6.0 when responses shrank to a sixth on the wire."""
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes that compression kept off the wire, for responses and request bodies together."""
+        return (self.decoded_bytes - self.wire_bytes) + (self.body_bytes - self.body_wire_bytes)
+
+
+class TransferStats:
+    """Thread-safe per-endpoint byte counts, keyed like "/getclaims" or "/inscompanies"."""
+
+    def __init__(self):
+        self._endpoints: dict[str, EndpointTransfer] = {}
+        self._lock = threading.Lock()
+
+    def record_response(self, endpoint: str, wire_bytes: int, decoded_bytes: int):
+        with self._lock:
+            transfer = self._endpoints.setdefault(endpoint, EndpointTransfer())
+            transfer.responses += 1
+            transfer.wire_bytes += wire_bytes
+            transfer.decoded_bytes += decoded_bytes
+
+    def record_request(self, endpoint: str, body_bytes: int, wire_bytes: int):
+        with self._lock:
+            transfer = self._endpoints.setdefault(endpoint, EndpointTransfer())
+            transfer.body_bytes += body_bytes
+            transfer.body_wire_bytes += wire_bytes
+            if wire_bytes < body_bytes:
+                transfer.compressed_requests += 1
+
+    @property
+    def endpoints(self) -> dict[str, EndpointTransfer]:
+        """A snapshot of the counts per endpoint."""
+        with self._lock:
+            return {endpoint: replace(transfer) for endpoint, transfer in self._endpoints.items()}
+
+    @property
+    def total(self) -> EndpointTransfer:
+        """The counts summed over every endpoint."""
+        total = EndpointTransfer()
+        for transfer in self.endpoints.values():
+            for counter in fields(EndpointTransfer):
+                setattr(total, counter.name, getattr(total, counter.name) + getattr(transfer, counter.name))
+        return total
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
@@ -1,2 +1,13 @@
 BASE_URL = "https://hawkeye.g2it.co/api"
-DEV_BASE_URL = "https://qa.hawkeye.g2it.co/api"
\ No newline at end of file
+DEV_BASE_URL = "https://qa.hawkeye.g2it.co/api"
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+ENDPOINTS = (
+    "/getclaims",
+    "/createclaim",
+    "/updateclaim",
+    "/savefile",
+    "/createLogTrailEntry",
+    "/inscompanies",
+)
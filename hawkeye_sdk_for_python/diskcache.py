@@ -0,0 +1,234 @@
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, Hashable, Optional
+
+from .cache import CacheStats, Validators
+
+# Bump when cached objects change shape, so files written by an older SDK are discarded instead of unpickled.
+_FORMAT_VERSION = 1
+# Hits only record their access time in memory; the times are written in one transaction once this many are
+# pending, before an eviction, and on close.
+_TOUCH_BATCH = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    compressed INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+class DiskCache:
+    """
+    A persistent cache of decoded API results in a SQLite file, so short-lived processes such as CLI jobs and
+     cron scripts can reuse claims and insurer lookups from earlier runs. It is a drop-in replacement for
+     ResponseCache: entries have a TTL, the least recently used entries are evicted once the stored bodies
+     exceed max_bytes, and writes through the client invalidate the claims they touch. Several processes
+     may share one file.
+    A cache hit only reads the file: its access time is kept in memory and written later in a batch, so LRU order
+     seen by other processes lags slightly. Lookups are still synchronous SQLite reads, and in AsyncHawkeyeClient
+     they run on the event loop.
+    Values are stored pickled, so only open cache files that you trust.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            max_bytes: int = 256 * 1024 * 1024,
+            ttl: Optional[float] = 3600.0,
+            compress: bool = True,
+            compress_min_size: int = 1024,
+            clock: Callable[[], float] = time.time,
+            ):
+        """
+        Args:
+            path (str): The SQLite database file. It is created if it does not exist.
+            max_bytes (int): The maximum total size of the stored bodies. Defaults to 256 MiB.
+            ttl (float, optional): Seconds an entry stays valid. None keeps entries until they are evicted or invalidated.
+            compress (bool): If True, bodies of at least compress_min_size bytes are stored zlib-compressed. Defaults to True.
+            compress_min_size (int): The smallest body worth compressing, in bytes. Defaults to 1024.
+            clock (Callable, optional): Wall-clock time source shared across processes, replaceable for testing.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1.")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.compress = compress
+        self.compress_min_size = compress_min_size
+        self.stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._touched: dict[str, float] = {}
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != _FORMAT_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS entries")
+            self._conn.execute(f"PRAGMA user_version = {_FORMAT_VERSION}")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the cached value for key, or None if it is missing or expired."""
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, compressed, etag, last_modified, expires_at FROM entries WHERE key = ?", (repr(key),)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            body, compressed, etag, last_modified, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                if etag is None and last_modified is None:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (repr(key),))
+                    self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._touched[repr(key)] = now
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._flush_touched()
+        value = self._load(key, body, compressed)
+        with self._lock:
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, validators: Optional[Validators] = None):
+        """Stores value under key, then evicts the least recently used entries while the cache is over max_bytes."""
+        body = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        compressed = self.compress and len(body) >= self.compress_min_size
+        if compressed:
+            body = zlib.compress(body)
+        now = self._clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, compressed, size, etag, last_modified, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        repr(key), body, int(compressed), len(body),
+                        validators.etag if validators else None,
+                        validators.last_modified if validators else None,
+                        self._expires_at(now), now,
+                    ),
+                )
+                self._touched.pop(repr(key), None)
+                self._write_touched()
+                self._evict()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def stale(self, key: Hashable) -> Optional[tuple[Any, Validators]]:
+        """Returns the value and validators stored under key, fresh or expired, or None if it has no validators."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, compressed, etag, last_modified FROM entries WHERE key = ?", (repr(key),)
+            ).fetchone()
+        if row is None or (row[2] is None and row[3] is None):
+            return None
+        value = self._load(key, row[0], row[1])
+        return None if value is None else (value, Validators(row[2], row[3]))
+
+    def revalidate(self, key: Hashable, validators: Optional[Validators] = None):
+        """Restarts the TTL of key after the server confirmed it is unchanged, updating its validators if given."""
+        now = self._clock()
+        with self._lock:
+            if validators is not None:
+                cursor = self._conn.execute(
+                    "UPDATE entries SET expires_at = ?, accessed_at = ?, etag = ?, last_modified = ? WHERE key = ?",
+                    (self._expires_at(now), now, validators.etag, validators.last_modified, repr(key)),
+                )
+            else:
+                cursor = self._conn.execute(
+                    "UPDATE entries SET expires_at = ?, accessed_at = ? WHERE key = ?",
+                    (self._expires_at(now), now, repr(key)),
+                )
+            if cursor.rowcount:
+                self.stats.revalidations += 1
+
+    def invalidate(self, key: Hashable):
+        """Drops the entry for key, if any."""
+        with self._lock:
+            if self._conn.execute("DELETE FROM entries WHERE key = ?", (repr(key),)).rowcount:
+                self.stats.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    @property
+    def size(self) -> int:
+        """The total size of the stored bodies in bytes."""
+        with self._lock:
+            (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return total
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return count
+
+    def close(self):
+        with self._lock:
+            self._flush_touched()
+            self._conn.close()
+
+    def _expires_at(self, now: float) -> Optional[float]:
+        return now + self.ttl if self.ttl is not None else None
+
+    def _write_touched(self):
+        """Writes the pending access times of cache hits. The caller holds the lock and owns the transaction."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ? AND accessed_at < ?",
+                [(accessed_at, key, accessed_at) for key, accessed_at in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _flush_touched(self):
+        """Writes the pending access times in one transaction. The caller holds the lock."""
+        if not self._touched:
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._write_touched()
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _load(self, key: Hashable, body: bytes, compressed: int) -> Any:
+        """Unpickles a stored body, dropping the entry if it cannot be read back."""
+        try:
+            return pickle.loads(zlib.decompress(body) if compressed else body)
+        except Exception:
+            self.invalidate(key)
+            return None
+
+    def _evict(self):
+        """Deletes the least recently used entries until the stored bodies fit in max_bytes. The caller holds the lock."""
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at, rowid").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            self.stats.evictions += 1
@@ -0,0 +1,444 @@
+import functools
+import inspect
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+import httpx
+
+from .ratelimit import endpoint_for
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Hook = Callable[["RequestEvent"], None]
+
+_EXCHANGE_KEY = "hawkeye.exchange"
+
+
+@dataclass
+class RequestEvent:
+    """
+    One module call, such as claims.get_claims or docfiles.upload_file, as passed to instrumentation hooks.
+     The HTTP fields describe the requests the call made: endpoint, method and status_code come from the
+     last one, counts and phase timings are summed over all of them. A call answered without a request
+     (a cache hit, a coalesced read, a queued write) has requests == 0 and no endpoint.
+     Phase timings are None when the transport did not report them, e.g. for a custom or mock transport;
+     connect and tls are 0.0 when a pooled connection was reused.
+    """
+    operation: str
+    started_at: float
+    duration: float
+    endpoint: Optional[str] = None
+    method: Optional[str] = None
+    status_code: Optional[int] = None
+    error: Optional[BaseException] = None
+    requests: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    ttfb: Optional[float] = None
+    download: Optional[float] = None
+    decode_seconds: float = 0.0
+    typing_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _add(total: Optional[float], value: Optional[float]) -> Optional[float]:
+    if value is None:
+        return total
+    return value if total is None else total + value
+
+
+class _Exchange:
+    """One logical HTTP request of a call, across its retry attempts, timed from httpcore trace events."""
+
+    def __init__(self, request: httpx.Request):
+        self.method = request.method
+        self.endpoint = endpoint_for(request.url.path) or request.url.path
+        self.attempts = 0
+        self.bytes_sent = 0
+        self.status_code: Optional[int] = None
+        self.responses: list[httpx.Response] = []
+        self.phases: dict[str, Optional[float]] = {"connect": None, "tls": None, "ttfb": None, "download": None}
+        self._marks: dict[str, float] = {}
+
+    def attempt(self, request: httpx.Request):
+        self.attempts += 1
+        try:
+            self.bytes_sent += len(request.content)
+        except httpx.RequestNotRead:
+            pass
+
+    def responded(self, response: httpx.Response):
+        self.status_code = response.status_code
+        self.responses.append(response)
+
+    def trace(self, name: str, info: dict):
+        """httpcore trace callback; event names look like "connection.connect_tcp.started" or "http11.receive_response_body.complete"."""
+        now = time.perf_counter()
+        step = name.split(".", 1)[1] if name.startswith(("http11.", "http2.")) else name
+        self._marks[step] = now
+        if step == "connection.connect_tcp.complete":
+            self._phase("connect", "connection.connect_tcp.started", now)
+        elif step == "connection.start_tls.complete":
+            self._phase("tls", "connection.start_tls.started", now)
+        elif step == "send_request_headers.started":
+            self.phases["connect"] = _add(self.phases["connect"], 0.0)
+            self.phases["tls"] = _add(self.phases["tls"], 0.0)
+        elif step == "receive_response_headers.complete":
+            self._phase("ttfb", "send_request_headers.started", now)
+        elif step == "receive_response_body.complete":
+            self._phase("download", "receive_response_body.started", now)
+
+    async def atrace(self, name: str, info: dict):
+        self.trace(name, info)
+
+    def _phase(self, phase: str, start: str, now: float):
+        started = self._marks.get(start)
+        if started is not None:
+            self.phases[phase] = _add(self.phases[phase], now - started)
+
+    @property
+    def bytes_received(self) -> int:
+        return sum(_wire_bytes(response) for response in self.responses)
+
+
+def _wire_bytes(response: httpx.Response) -> int:
+    """Bytes read off the wire for response. Responses built in memory, e.g. by MockTransport, count their content."""
+    if response.num_bytes_downloaded:
+        return response.num_bytes_downloaded
+    try:
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        return 0
+
+
+class _Call:
+    """Measurements collected while one module call runs; see RequestEvent."""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.exchanges: list[_Exchange] = []
+        self.decode_seconds = 0.0
+        self.typing_seconds = 0.0
+        self.error: Optional[BaseException] = None
+
+    def exchange(self, request: httpx.Request) -> _Exchange:
+        """Returns the exchange of request, creating it on the first attempt. Retries send the same request."""
+        exchange = request.extensions.get(_EXCHANGE_KEY)
+        if exchange is None:
+            exchange = request.extensions[_EXCHANGE_KEY] = _Exchange(request)
+            self.exchanges.append(exchange)
+        return exchange
+
+    def event(self) -> RequestEvent:
+        event = RequestEvent(
+            operation=self.operation,
+            started_at=self.started_at,
+            duration=time.perf_counter() - self.started,
+            error=self.error,
+            requests=len(self.exchanges),
+            decode_seconds=self.decode_seconds,
+            typing_seconds=self.typing_seconds,
+        )
+        for exchange in self.exchanges:
+            event.endpoint = exchange.endpoint
+            event.method = exchange.method
+            event.status_code = exchange.status_code
+            event.retries += max(0, exchange.attempts - 1)
+            event.bytes_sent += exchange.bytes_sent
+            event.bytes_received += exchange.bytes_received
+            for phase, seconds in exchange.phases.items():
+                setattr(event, phase, _add(getattr(event, phase), seconds))
+        return event
+
+    def emit(self, hooks: Iterable[Hook]):
+        event = self.event()
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
+
+
+_current_call: ContextVar[Optional[_Call]] = ContextVar("hawkeye_current_call", default=None)
+
+def current_call() -> Optional[_Call]:
+    """Returns the instrumented module call running in this context, if any."""
+    return _current_call.get()
+
+def measure(attribute: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs func, adding its duration to the current call's decode_seconds or typing_seconds."""
+    call = _current_call.get()
+    if call is None:
+        return func(*args, **kwargs)
+    started = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        setattr(call, attribute, getattr(call, attribute) + time.perf_counter() - started)
+
+def instrumented(func: Callable) -> Callable:
+    """
+    Reports each call of a module method to the client's hooks as a RequestEvent named "<module>.<method>".
+     Works for plain methods, coroutines and (async) generators. Without hooks the method runs untouched.
+    """
+    name = func.__name__
+
+    def start(module: Any) -> _Call:
+        return _Call(f"{module._instrumentation_name}.{name}")
+
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def async_generator_wrapper(self, *args, **kwargs):
+            hooks = self._hooks
+            if not hooks:
+                async for item in func(self, *args, **kwargs):
+                    yield item
+                return
+            call = start(self)
+            generator = func(self, *args, **kwargs)
+            try:
+                while True:
+                    token = _current_call.set(call)
+                    try:
+                        item = await generator.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        _current_call.reset(token)
+                    yield item
+            except BaseException as exc:
+                call.error = exc
+                raise
+            finally:
+                await generator.aclose()
+                call.emit(hooks)
+        return async_generator_wrapper
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(self, *args, **kwargs):
+            hooks = self._hooks
+            if not hooks:
+                yield from func(self, *args, **kwargs)
+                return
+            call = start(self)
+            generator = func(self, *args, **kwargs)
+            try:
+                while True:
+                    token = _current_call.set(call)
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        break
+                    finally:
+                        _current_call.reset(token)
+                    yield item
+            except BaseException as exc:
+                call.error = exc
+                raise
+            finally:
+                generator.close()
+                call.emit(hooks)
+        return generator_wrapper
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def coroutine_wrapper(self, *args, **kwargs):
+            hooks = self._hooks
+            if not hooks:
+                return await func(self, *args, **kwargs)
+            call = start(self)
+            token = _current_call.set(call)
+            try:
+                return await func(self, *args, **kwargs)
+            except BaseException as exc:
+                call.error = exc
+                raise
+            finally:
+                _current_call.reset(token)
+                call.emit(hooks)
+        return coroutine_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        hooks = self._hooks
+        if not hooks:
+            return func(self, *args, **kwargs)
+        call = start(self)
+        token = _current_call.set(call)
+        try:
+            return func(self, *args, **kwargs)
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            _current_call.reset(token)
+            call.emit(hooks)
+    return wrapper
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class MetricsCollector:
+    """
+    An in-process, Prometheus-style metrics hook. Pass it in a client's hooks, then scrape render() from your
+     own /metrics handler or read single series with value(). Series are labelled by operation, and request
+     counts also by endpoint and status ("error" when the call failed without an HTTP status).
+    """
+
+    def __init__(self, namespace: str = "hawkeye", buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple], float] = {}
+        # operation labels -> [per-bucket counts, count, sum]
+        self._histograms: dict[tuple, list] = {}
+
+    def __call__(self, event: RequestEvent):
+        status = str(event.status_code) if event.status_code is not None else ("error" if event.error else "none")
+        operation = (("operation", event.operation),)
+        with self._lock:
+            self._inc("calls_total", operation + (("endpoint", event.endpoint or ""), ("status", status)))
+            if event.error is not None:
+                self._inc("errors_total", operation + (("error", type(event.error).__name__),))
+            self._inc("requests_total", operation, event.requests)
+            self._inc("retries_total", operation, event.retries)
+            self._inc("bytes_sent_total", operation, event.bytes_sent)
+            self._inc("bytes_received_total", operation, event.bytes_received)
+            self._inc("decode_seconds_total", operation, event.decode_seconds)
+            self._inc("typing_seconds_total", operation, event.typing_seconds)
+            histogram = self._histograms.setdefault(operation, [[0] * len(self.buckets), 0, 0.0])
+            index = bisect_left(self.buckets, event.duration)
+            if index < len(self.buckets):
+                histogram[0][index] += 1
+            histogram[1] += 1
+            histogram[2] += event.duration
+
+    def _inc(self, name: str, labels: tuple, amount: float = 1):
+        key = (name, labels)
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def value(self, name: str, **labels: str) -> float:
+        """Returns a counter summed over the series matching labels, e.g. value("calls_total", operation="claims.get_claims")."""
+        with self._lock:
+            return sum(
+                amount for (counter, series), amount in self._counters.items()
+                if counter == name and all(dict(series).get(key) == wanted for key, wanted in labels.items())
+            )
+
+    def render(self) -> str:
+        """Returns every series in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name in sorted({counter for counter, _ in self._counters}):
+                lines.append(f"# TYPE {self.namespace}_{name} counter")
+                for (counter, series), amount in sorted(self._counters.items()):
+                    if counter == name:
+                        lines.append(f"{self.namespace}_{name}{_labels(series)} {_number(amount)}")
+            if self._histograms:
+                metric = f"{self.namespace}_call_duration_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                for series, (counts, count, total) in sorted(self._histograms.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(self.buckets, counts):
+                        cumulative += bucket_count
+                        lines.append(f"{metric}_bucket{_labels(series + (('le', _number(bound)),))} {cumulative}")
+                    lines.append(f"{metric}_bucket{_labels(series + (('le', '+Inf'),))} {count}")
+                    lines.append(f"{metric}_count{_labels(series)} {count}")
+                    lines.append(f"{metric}_sum{_labels(series)} {_number(total)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+def _labels(series: tuple) -> str:
+    if not series:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in series) + "}"
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class OpenTelemetryHook:
+    """
+    Reports each RequestEvent to OpenTelemetry: a CLIENT span named after the operation, with the HTTP details
+     and timings as attributes, plus duration and byte histograms. Spans are recorded when the call finishes,
+     with its real start and end times, so they are children of whatever span was current when the hook ran.
+    Raises:
+        ImportError: If the opentelemetry-api package is not installed.
+    """
+
+    def __init__(self, tracer: Any = None, meter: Any = None):
+        """
+        Args:
+            tracer (opentelemetry.trace.Tracer, optional): Defaults to the global tracer provider's tracer.
+            meter (opentelemetry.metrics.Meter, optional): Defaults to the global meter provider's meter.
+        """
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as exc:
+            raise ImportError("OpenTelemetryHook requires the opentelemetry-api package: pip install opentelemetry-api") from exc
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("hawkeye_sdk_for_python")
+        meter = meter or metrics.get_meter("hawkeye_sdk_for_python")
+        self._duration = meter.create_histogram("hawkeye.client.call.duration", unit="s", description="Duration of SDK calls")
+        self._sent = meter.create_counter("hawkeye.client.bytes_sent", unit="By", description="Request body bytes sent")
+        self._received = meter.create_counter("hawkeye.client.bytes_received", unit="By", description="Response bytes received")
+
+    def __call__(self, event: RequestEvent):
+        attributes: dict[str, Any] = {"hawkeye.operation": event.operation}
+        if event.endpoint is not None:
+            attributes["hawkeye.endpoint"] = event.endpoint
+        if event.method is not None:
+            attributes["http.request.method"] = event.method
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error is not None:
+            attributes["error.type"] = type(event.error).__name__
+        self._duration.record(event.duration, attributes)
+        self._sent.add(event.bytes_sent, attributes)
+        self._received.add(event.bytes_received, attributes)
+
+        start_time = int(event.started_at * 1e9)
+        span = self._tracer.start_span(
+            event.operation,
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=start_time,
+            attributes={
+                **attributes,
+                "hawkeye.requests": event.requests,
+                "hawkeye.retries": event.retries,
+                "hawkeye.bytes_sent": event.bytes_sent,
+                "hawkeye.bytes_received": event.bytes_received,
+                "hawkeye.decode_seconds": event.decode_seconds,
+                "hawkeye.typing_seconds": event.typing_seconds,
+                **{f"hawkeye.{phase}_seconds": getattr(event, phase)
+                   for phase in ("connect", "tls", "ttfb", "download") if getattr(event, phase) is not None},
+            },
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+        span.end(end_time=start_time + int(event.duration * 1e9))
@@ -0,0 +1,277 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Any, Iterable, Iterator, Optional, get_args
+
+from .types import Claim, DocFile, LogTrail
+from .utils import type_claim
+
+_CHILDREN = {"docfiles": DocFile, "logtrail": LogTrail}
+# Annotated as flags, but the API sends the date liability was accepted or denied. Stored and read back as text.
+_DATE_FLAGS = frozenset({"liabilityaccepted", "liabilitydenied"})
+# Streamed claims are written in pages of this size, and the mirror is only locked while a page is written.
+_PAGE_SIZE = 500
+
+def _affinity(name: str, annotation: Any) -> str:
+    if name in _DATE_FLAGS:
+        return "TEXT"
+    args = get_args(annotation) or (annotation,)
+    if bool in args or int in args:
+        return "INTEGER"
+    if float in args:
+        return "REAL"
+    return "TEXT"
+
+_CLAIM_COLUMNS = [f.name for f in fields(Claim) if f.name not in _CHILDREN]
+_BOOL_COLUMNS = frozenset(f.name for f in fields(Claim) if bool in get_args(f.type)) - _DATE_FLAGS
+_CHILD_COLUMNS = {name: [f.name for f in fields(cls)] for name, cls in _CHILDREN.items()}
+
+def _schema() -> list[str]:
+    claim_columns = ", ".join(
+        f"{f.name} {_affinity(f.name, f.type)}{' PRIMARY KEY' if f.name == 'filenumber' else ''}"
+        for f in fields(Claim) if f.name not in _CHILDREN
+    )
+    statements = [f"CREATE TABLE IF NOT EXISTS claims ({claim_columns}, record_hash TEXT NOT NULL, synced_at REAL NOT NULL)"]
+    for table, columns in _CHILD_COLUMNS.items():
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {table} (filenumber INTEGER NOT NULL, position INTEGER NOT NULL, "
+            f"{', '.join(f'{column} TEXT' for column in columns)}, PRIMARY KEY (filenumber, position))"
+        )
+    return statements
+
+def _json_default(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else str(value)
+
+def record_hash(claim: Claim) -> str:
+    """Hashes a claim's normalised field values, including its documents and log trail, to detect changes."""
+    record = {name: getattr(claim, name) for name in _CLAIM_COLUMNS}
+    for name, cls in _CHILDREN.items():
+        record[name] = [[getattr(child, f.name) for f in fields(cls)] for child in getattr(claim, name)]
+    encoded = json.dumps(record, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class SyncStats:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+
+class ClaimsMirror:
+    """
+    A local SQLite copy of claims with their documents and log trail, kept current by incremental syncs.
+     Each claim's normalised record is hashed, and a sync only rewrites the rows of claims whose hash
+     changed. Reporting queries can run against the claims, docfiles and logtrail tables with plain SQL.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): The SQLite database file. It is created if it does not exist.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._async_sync_lock = asyncio.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for statement in _schema():
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def sync(self, client: Any, include_inactive: bool = True, prune: Optional[bool] = None) -> SyncStats:
+        """
+        Streams every claim from the API with iter_claims and applies the changes to the mirror.
+         Claims are written in pages, and the mirror is only locked while a page is written, so get, query and len
+         from other threads are not blocked while the sync waits on the API. Syncs of one mirror run one at a time.
+         Claims without a filenumber are skipped and counted in SyncStats.skipped.
+        Args:
+            client (HawkeyeClient): The client to read claims with.
+            include_inactive (bool): If True, inactive claims are mirrored too. Defaults to True.
+            prune (bool, optional): Delete mirrored claims the API no longer returned. Defaults to include_inactive,
+             since an active-only pull does not return claims that were closed.
+        Returns:
+            SyncStats: How many claims were inserted, updated, unchanged, deleted and skipped.
+        """
+        started = time.perf_counter()
+        with self._sync_lock:
+            try:
+                applier = self._locked(_SyncApplier, self._conn)
+                page = []
+                for claim in client.claims.iter_claims(include_inactive=include_inactive):
+                    page.append(claim)
+                    if len(page) >= _PAGE_SIZE:
+                        self._locked(applier.apply_many, page)
+                        page = []
+                self._locked(applier.apply_many, page)
+                return self._locked(self._commit, applier, include_inactive if prune is None else prune, started)
+            except BaseException:
+                self._locked(self._conn.rollback)
+                raise
+
+    async def async_sync(self, client: Any, include_inactive: bool = True, prune: Optional[bool] = None) -> SyncStats:
+        """
+        Async counterpart of sync, streaming claims from an AsyncHawkeyeClient.
+         Claims are written in pages from a worker thread, and the mirror is only locked while a page is written,
+         so get, query and len stay usable from the event loop during the sync. Async syncs of one mirror run one
+         at a time. A sync or apply from another thread in the meantime commits the changes written so far.
+        """
+        started = time.perf_counter()
+        async with self._async_sync_lock:
+            try:
+                applier = await asyncio.to_thread(self._locked, _SyncApplier, self._conn)
+                page = []
+                async for claim in client.claims.iter_claims(include_inactive=include_inactive):
+                    page.append(claim)
+                    if len(page) >= _PAGE_SIZE:
+                        await asyncio.to_thread(self._locked, applier.apply_many, page)
+                        page = []
+                await asyncio.to_thread(self._locked, applier.apply_many, page)
+                return await asyncio.to_thread(
+                    self._locked, self._commit, applier, include_inactive if prune is None else prune, started
+                )
+            except BaseException:
+                self._locked(self._conn.rollback)
+                raise
+
+    def sync_claim(self, client: Any, filenumber: int) -> SyncStats:
+        """Refreshes a single claim with get_single_claim, e.g. after a webhook reports a change."""
+        return self.apply([client.claims.get_single_claim(filenumber)])
+
+    def apply(self, claims: Iterable[Claim]) -> SyncStats:
+        """Upserts the given claims, rewriting only those whose content changed. Nothing is deleted."""
+        started = time.perf_counter()
+        with self._lock, self._conn:
+            applier = _SyncApplier(self._conn)
+            for claim in claims:
+                applier.apply(claim)
+            return applier.finish(False, started)
+
+    def get(self, filenumber: int) -> Optional[Claim]:
+        """Returns the mirrored claim with its documents and log trail, or None if it is not mirrored."""
+        return next(self._load("WHERE filenumber = ?", (filenumber,)), None)
+
+    def claims(self) -> Iterator[Claim]:
+        """Yields every mirrored claim, ordered by filenumber."""
+        return self._load("ORDER BY filenumber", ())
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> list[sqlite3.Row]:
+        """Runs a read-only SQL query against the claims, docfiles and logtrail tables."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            return cursor.execute(sql, tuple(params)).fetchall()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM claims").fetchone()
+        return count
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _locked(self, func: Any, *args: Any) -> Any:
+        with self._lock:
+            return func(*args)
+
+    def _commit(self, applier: "_SyncApplier", prune: bool, started: float) -> SyncStats:
+        stats = applier.finish(prune, started)
+        self._conn.commit()
+        return stats
+
+    def _load(self, clause: str, params: tuple) -> Iterator[Claim]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {', '.join(_CLAIM_COLUMNS)} FROM claims {clause}", params).fetchall()
+            children = {
+                table: self._children(table, [row[0] for row in rows] if clause.startswith("WHERE") else None)
+                for table in _CHILD_COLUMNS
+            }
+        for row in rows:
+            record = {
+                column: (bool(value) if value is not None and column in _BOOL_COLUMNS else value)
+                for column, value in zip(_CLAIM_COLUMNS, row)
+            }
+            for table in _CHILD_COLUMNS:
+                record[table] = children[table].get(record["filenumber"], [])
+            yield type_claim(record)
+
+    def _children(self, table: str, filenumbers: Optional[list]) -> dict[Any, list[dict]]:
+        columns = _CHILD_COLUMNS[table]
+        sql = f"SELECT filenumber, {', '.join(columns)} FROM {table}"
+        params: tuple = ()
+        if filenumbers is not None:
+            sql += f" WHERE filenumber IN ({', '.join('?' for _ in filenumbers)})"
+            params = tuple(filenumbers)
+        grouped: dict[Any, list[dict]] = {}
+        for row in self._conn.execute(sql + " ORDER BY filenumber, position", params):
+            grouped.setdefault(row[0], []).append(dict(zip(columns, row[1:])))
+        return grouped
+
+
+class _SyncApplier:
+    """Applies one sync pass, comparing against the hashes stored before it began. The caller owns the transaction."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        self._hashes: dict[Any, str] = dict(conn.execute("SELECT filenumber, record_hash FROM claims"))
+        self._seen: set = set()
+        self._now = time.time()
+        self.stats = SyncStats()
+
+    def apply_many(self, claims: Iterable[Claim]):
+        for claim in claims:
+            self.apply(claim)
+
+    def apply(self, claim: Claim):
+        if claim.filenumber is None:
+            self.stats.skipped += 1
+            return
+        # Stored hashes are keyed by the INTEGER primary key, while the API may send filenumbers as strings.
+        filenumber = int(claim.filenumber)
+        self._seen.add(filenumber)
+        digest = record_hash(claim)
+        previous = self._hashes.get(filenumber)
+        if previous == digest:
+            self.stats.unchanged += 1
+            return
+        if previous is None:
+            self.stats.inserted += 1
+        else:
+            self.stats.updated += 1
+        self._hashes[filenumber] = digest
+        values = [filenumber if column == "filenumber" else getattr(claim, column) for column in _CLAIM_COLUMNS]
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO claims ({', '.join(_CLAIM_COLUMNS)}, record_hash, synced_at) "
+            f"VALUES ({', '.join('?' for _ in range(len(_CLAIM_COLUMNS) + 2))})",
+            (*values, digest, self._now),
+        )
+        for table, columns in _CHILD_COLUMNS.items():
+            self._conn.execute(f"DELETE FROM {table} WHERE filenumber = ?", (filenumber,))
+            self._conn.executemany(
+                f"INSERT INTO {table} (filenumber, position, {', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in range(len(columns) + 2))})",
+                [
+                    (filenumber, position, *(_json_default(value) if isinstance(value, Enum) else value
+                                             for value in (getattr(child, column) for column in columns)))
+                    for position, child in enumerate(getattr(claim, table))
+                ],
+            )
+
+    def finish(self, prune: bool, started: float) -> SyncStats:
+        if prune:
+            stale = [(filenumber,) for filenumber in self._hashes if filenumber not in self._seen]
+            for table in ("claims", *_CHILD_COLUMNS):
+                self._conn.executemany(f"DELETE FROM {table} WHERE filenumber = ?", stale)
+            self.stats.deleted = len(stale)
+        self.stats.seconds = time.perf_counter() - started
+        return self.stats
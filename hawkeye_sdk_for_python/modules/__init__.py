@@ -1,4 +1,5 @@
-from .claims import ClaimsModule
-from .docfiles import DocfilesModule
-from .logtrails import LogtrailsModule
-from .inscompanies import InsCompaniesModule
+from .claims import ClaimsModule, AsyncClaimsModule
+from .docfiles import DocfilesModule, AsyncDocfilesModule
+from .logtrails import LogtrailsModule, AsyncLogtrailsModule
+from .inscompanies import InsCompaniesModule, AsyncInsCompaniesModule
+from .outbox import OutboxModule, AsyncOutboxModule
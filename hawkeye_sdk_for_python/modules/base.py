@@ -1,10 +1,87 @@
 import httpx
 import json
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+from ..cache import ResponseCache, Validators, claim_key
+from ..diskcache import DiskCache
 from ..exceptions import APIError, APIResourceNotFoundError
+from ..instrumentation import measure
+from ..serialization import JsonCodec
+from ..types import ClientSettings
 
-class BaseModule:
-    def __init__(self, client: httpx.Client):
-        self._client = client
+_DEFAULT_CODEC = JsonCodec()
+
+class ModuleCore:
+    """Request building and response checking shared by the sync and async modules."""
+
+    _settings: Optional[ClientSettings]
+    _instrumentation_name = "module"
+
+    @property
+    def _compact(self) -> bool:
+        return self._settings is not None and self._settings.compact_records
+
+    @property
+    def _codec(self) -> JsonCodec:
+        return self._settings.json_codec if self._settings is not None else _DEFAULT_CODEC
+
+    @property
+    def _cache(self) -> Optional[Union[ResponseCache, DiskCache]]:
+        return self._settings.cache if self._settings is not None else None
+
+    @property
+    def _hooks(self) -> tuple:
+        return self._settings.hooks if self._settings is not None else ()
+
+    @property
+    def _single_flight(self) -> Any:
+        return self._settings.single_flight if self._settings is not None else None
+
+    def _cache_get(self, key: Hashable) -> Any:
+        return self._cache.get(key) if self._cache is not None else None
+
+    def _cache_set(self, key: Hashable, value: Any, response: Optional[httpx.Response] = None):
+        """Caches value, keeping the response's ETag and Last-Modified so the entry can be revalidated later."""
+        if self._cache is not None:
+            self._cache.set(key, value, Validators.from_response(response) if response is not None else None)
+
+    def _cache_for_revalidation(self, key: Hashable, value: Any, response: httpx.Response):
+        """Caches value only if the response carried validators, for results that are always revalidated."""
+        if self._cache is not None:
+            validators = Validators.from_response(response)
+            if validators is not None:
+                self._cache.set(key, value, validators)
+
+    def _revalidation(self, key: Hashable) -> tuple[Any, dict]:
+        """
+        Returns the cached value that can be revalidated for key, or None, and the httpx keyword arguments
+         (If-None-Match / If-Modified-Since headers) that make the request conditional on it.
+        """
+        entry = self._cache.stale(key) if self._cache is not None else None
+        if entry is None:
+            return None, {}
+        value, validators = entry
+        return value, {"headers": validators.request_headers()}
+
+    def _not_modified(self, key: Hashable, response: httpx.Response, stale: Any) -> bool:
+        """Returns True, and restarts the entry's TTL, when a conditional request was answered 304 Not Modified."""
+        cache = self._cache
+        if cache is None or stale is None or response.status_code != 304:
+            return False
+        cache.revalidate(key, Validators.from_response(response))
+        return True
+
+    def _invalidate_claim(self, filenumber: Any):
+        """Drops cached data for a claim after a write to it."""
+        if self._cache is not None:
+            self._cache.invalidate(claim_key(filenumber))
+
+    def _json_body(self, data: Any) -> dict:
+        """Returns the httpx keyword arguments that send data as the JSON request body."""
+        return self._codec.request_kwargs(data)
+
+    def _decode(self, response: httpx.Response) -> Any:
+        """Decodes a JSON response body with the client's JSON codec."""
+        return measure("decode_seconds", self._codec.decode_response, response)
 
     def _check_response(self, response: httpx.Response):
         """Checks the HTTP response for errors and raises appropriate exceptions."""
@@ -25,3 +102,25 @@ class BaseModule:
                 status_code=response.status_code,
                 response=error_details
                     )
+
+class BaseModule(ModuleCore):
+    def __init__(self, client: httpx.Client, settings: Optional[ClientSettings] = None):
+        self._client = client
+        self._settings = settings
+
+    def _coalesced(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Runs fetch, sharing its result with concurrent callers of the same key when read coalescing is on."""
+        if self._single_flight is None:
+            return fetch()
+        return self._single_flight.do(key, fetch)
+
+class AsyncBaseModule(ModuleCore):
+    def __init__(self, client: httpx.AsyncClient, settings: Optional[ClientSettings] = None):
+        self._client = client
+        self._settings = settings
+
+    async def _coalesced(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of BaseModule._coalesced."""
+        if self._single_flight is None:
+            return await fetch()
+        return await self._single_flight.do(key, fetch)
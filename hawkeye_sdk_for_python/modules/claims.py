@@ -1,29 +1,230 @@
-from typing import Optional
-from ..types import Claim, ApiResponse
-from ..utils import type_claim
-from .base import BaseModule
+import hashlib
+import re
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Protocol, Union, runtime_checkable
+from ..constants import DEFAULT_MAX_CONCURRENCY
+from ..types import Claim, ApiResponse, BulkResult
+from ..cache import claim_key, claims_key
+from ..collection import ClaimCollection
+from ..columnar import claims_table
+from ..utils import type_claim, run_bounded, gather_bounded, iter_json_array, JsonArrayParser
+from ..instrumentation import instrumented, measure
+from .base import ModuleCore, BaseModule, AsyncBaseModule
 
-class ClaimsModule(BaseModule):
-    def get_claims(self, include_inactive: bool = False) -> list[Claim]:
+# update_claim arguments whose Claim attribute has a different name.
+_RENAMED_CLAIM_FIELDS = {
+    "vehcolor": "color",
+    "vehvin": "vin",
+    "vehplatenumber": "platenumber",
+    "vehunitnumber": "unitnumber",
+}
+_CLAIM_ATTRIBUTES = frozenset(field.name for field in fields(Claim))
+_US_DATE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_ISO_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:[T ]00:00(?::00(?:\.0+)?)?(?:Z|[+-]00:?00)?)?")
+
+def _comparable(value: Any) -> str:
+    """Normalises a value for change detection: stripped text, None as "", and dates (MM/DD/YYYY or ISO) as YYYY-MM-DD."""
+    if value is None:
+        return ""
+    text = str(value).strip()
+    match = _US_DATE.fullmatch(text)
+    if match:
+        month, day, year = match.groups()
+        return f"{year}-{int(month):02d}-{int(day):02d}"
+    match = _ISO_DATE.fullmatch(text)
+    if match:
+        return "-".join(match.groups())
+    return text
+
+def _digest(value: Any) -> str:
+    return hashlib.blake2b(_comparable(value).encode(), digest_size=8).hexdigest()
+
+@runtime_checkable
+class _NamedTupleRow(Protocol):
+    """A NamedTuple claim row, recognised by its _asdict method."""
+
+    def _asdict(self) -> dict[str, Any]: ...
+
+class ClaimsCore(ModuleCore):
+    """URL building and response typing shared by ClaimsModule and AsyncClaimsModule."""
+
+    _instrumentation_name = "claims"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sent_untracked: dict[str, dict[str, str]] = {}
+
+    @property
+    def sent_untracked(self) -> dict[str, dict[str, str]]:
+        """
+        Digests of the untracked field values update_claims_bulk last sent, by filenumber and field.
+         The mapping is plain JSON, so a nightly job can save it and load it back with update() on its next run.
+        """
+        return self._sent_untracked
+
+    def clear_sent_untracked(self):
+        """Forgets the untracked values remembered by update_claims_bulk, so the next run sends them again."""
+        self._sent_untracked.clear()
+
+    @staticmethod
+    def _claims_url(include_inactive: bool) -> str:
+        return f"/getclaims/all/{str(include_inactive).lower()}"
+
+    @staticmethod
+    def _claim_payload(all_args: dict) -> dict:
+        return {key: value for key, value in all_args.items() if value is not None and key != "self"}
+
+    @staticmethod
+    def _row_fields(row: Any) -> dict:
+        """Turns a dict, dataclass instance or NamedTuple row into create_claim or update_claim keyword arguments."""
+        if isinstance(row, Mapping):
+            return dict(row)
+        if isinstance(row, _NamedTupleRow):
+            return dict(row._asdict())
+        if is_dataclass(row) and not isinstance(row, type):
+            return {field.name: getattr(row, field.name) for field in fields(row)}
+        raise TypeError(f"Unsupported claim row type: {type(row).__name__}.")
+
+    @staticmethod
+    def _claim_changes(desired: dict, current: Claim, sent: dict[str, str], ignore_untracked: bool) -> dict:
+        """
+        Returns the update_claim arguments in desired whose value differs from the current claim.
+         Values are compared as stripped strings, with None and "" treated alike and dates in either format.
+         Arguments the claim does not expose (e.g. note, inscompaniesid) are compared with the digests in sent
+         of the values last sent for this claim. One never sent counts as changed, unless ignore_untracked is
+         set, in which case its value is recorded in sent as the server's.
+        """
+        changes = {}
+        for name, value in desired.items():
+            if name == "filenumber" or value is None:
+                continue
+            attribute = _RENAMED_CLAIM_FIELDS.get(name, name)
+            if attribute not in _CLAIM_ATTRIBUTES:
+                digest = _digest(value)
+                if name not in sent and ignore_untracked:
+                    sent[name] = digest
+                elif sent.get(name) != digest:
+                    changes[name] = value
+                continue
+            if _comparable(value) != _comparable(getattr(current, attribute)):
+                changes[name] = value
+        return changes
+
+    def _remember_sent(self, filenumber: Any, changes: dict):
+        """Records the untracked values of an update the API accepted."""
+        sent = self._sent_untracked.setdefault(str(filenumber), {})
+        for name, value in changes.items():
+            if _RENAMED_CLAIM_FIELDS.get(name, name) not in _CLAIM_ATTRIBUTES:
+                sent[name] = _digest(value)
+
+    @staticmethod
+    def _current_claims(results: Iterable[Any]) -> dict[str, Any]:
+        """Maps filenumbers to their current Claim, or to the error raised while fetching it."""
+        current = {}
+        for result in results:
+            if isinstance(result, BulkResult):
+                current[str(result.item)] = result.value if result.ok else result.error
+            else:
+                current[str(result.filenumber)] = result
+        return current
+
+    def _planned_update(self, record: dict, current: dict[str, Any], ignore_untracked: bool) -> dict:
+        """Returns the update_claim arguments to send for record, empty if nothing changed."""
+        filenumber = record.get("filenumber")
+        claim = current.get(str(filenumber))
+        if claim is None:
+            raise ValueError(f"Claim with filenumber {filenumber} not found.")
+        if isinstance(claim, Exception):
+            raise claim
+        return self._claim_changes(record, claim, self._sent_untracked.setdefault(str(filenumber), {}), ignore_untracked)
+
+    def _typed_claim(self, claim: dict) -> Claim:
+        return measure("typing_seconds", type_claim, claim, compact=self._compact)
+
+    def _typed_claims(self, portal_json: list) -> list[Claim]:
+        return measure("typing_seconds", lambda: [type_claim(claim, compact=self._compact) for claim in portal_json])
+
+    @staticmethod
+    def _claims_result(claims: list[Claim], as_collection: bool) -> Union[list[Claim], ClaimCollection]:
+        return ClaimCollection(claims) if as_collection else list(claims)
+
+    def _typed_single_claim(self, filenumber: int, portal_json: list) -> Claim:
+        if not portal_json:
+            raise ValueError(f"Claim with filenumber {filenumber} not found.")
+
+        return self._typed_claim(portal_json[0])
+
+class ClaimsModule(ClaimsCore, BaseModule):
+    @instrumented
+    def get_claims(self, include_inactive: bool = False, as_collection: bool = False) -> Union[list[Claim], ClaimCollection]:
         """
         Retrieves a list of active (or all) claims. By default, only active claims are returned.
+         With a ResponseCache, the request is made conditional on the last list's ETag or Last-Modified, and the
+         decoded list is reused when the server answers 304 Not Modified.
         Args:
             include_inactive (bool): If True, includes inactive claims in the results. Defaults to False.
+            as_collection (bool): If True, returns a ClaimCollection with indexed lookups by VIN, claim number
+             and other identifiers. Defaults to False.
         Returns:
-            list[Claim]: A list of Claim objects.
+            list[Claim]: A list of Claim objects, or a ClaimCollection when as_collection is True.
         """
+        key = claims_key(include_inactive)
+        stale, conditional = self._revalidation(key)
         response = self._client.get(
-                url=f"/getclaims/all/{str(include_inactive).lower()}",
+                url=self._claims_url(include_inactive),
+                **conditional,
                 )
-        
-        portal_json = response.json()
 
-        self._check_response(response)
+        if self._not_modified(key, response, stale):
+            return self._claims_result(stale, as_collection)
 
-        claim_list = [type_claim(claim) for claim in portal_json]
+        self._check_response(response)
 
-        return claim_list
+        claims = self._typed_claims(self._decode(response))
+        self._cache_for_revalidation(key, claims, response)
+        return self._claims_result(claims, as_collection)
     
+    @instrumented
+    def get_claims_table(self, include_inactive: bool = False, backend: str = "arrow") -> Any:
+        """
+        Retrieves active (or all) claims as a columnar table for analytics, without building a Claim per row.
+        Args:
+            include_inactive (bool): If True, includes inactive claims in the results. Defaults to False.
+            backend (str): "arrow" for a pyarrow.Table, "numpy" for a dict of NumPy arrays, or "columns" for a
+             dict of plain lists. Defaults to "arrow".
+        Returns:
+            Any: One typed column per Claim field; docfiles and logtrail are not included.
+        Raises:
+            ImportError: If the package the backend needs is not installed.
+        """
+        response = self._client.get(
+                url=self._claims_url(include_inactive),
+                )
+
+        self._check_response(response)
+
+        return measure("typing_seconds", claims_table, self._decode(response), backend)
+
+    @instrumented
+    def iter_claims(self, include_inactive: bool = False) -> Iterator[Claim]:
+        """
+        Streams active (or all) claims, decoding the response incrementally and yielding one Claim at a time.
+         Unlike get_claims, the full body and the full list are never held in memory at once.
+        Args:
+            include_inactive (bool): If True, includes inactive claims in the results. Defaults to False.
+        Returns:
+            Iterator[Claim]: An iterator over Claim objects.
+        """
+        with self._client.stream("GET", self._claims_url(include_inactive)) as response:
+            if response.is_error:
+                response.read()
+                self._check_response(response)
+
+            for claim in iter_json_array(response.iter_text()):
+                yield self._typed_claim(claim)
+
+    @instrumented
     def get_single_claim(self, filenumber: int) -> Claim:
         """
         Retrieves a single claim by its filenumber.
@@ -32,18 +233,48 @@ class ClaimsModule(BaseModule):
         Returns:
             Claim: A Claim object.
         """
-        response = self._client.get(
-                url=f"/getclaims/{filenumber}",
-                )
-        portal_json = response.json()
+        cached = self._cache_get(claim_key(filenumber))
+        if cached is not None:
+            return cached
 
-        self._check_response(response)
+        def fetch() -> Claim:
+            stale, conditional = self._revalidation(claim_key(filenumber))
+            response = self._client.get(
+                    url=f"/getclaims/{filenumber}",
+                    **conditional,
+                    )
 
-        if not portal_json:
-            raise ValueError(f"Claim with filenumber {filenumber} not found.")
+            if self._not_modified(claim_key(filenumber), response, stale):
+                return stale
+
+            self._check_response(response)
+
+            claim = self._typed_single_claim(filenumber, self._decode(response))
+            self._cache_set(claim_key(filenumber), claim, response)
+            return claim
 
-        return type_claim(portal_json[0])
+        return self._coalesced(claim_key(filenumber), fetch)
+
+    @instrumented
+    def get_many_claims(
+            self,
+            filenumbers: Iterable[int],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            on_result: Optional[Callable[[BulkResult[Claim]], None]] = None,
+    ) -> list[BulkResult[Claim]]:
+        """
+        Retrieves many claims concurrently over the client's shared connection pool.
+         A claim that is missing or fails to load is reported on its own result instead of aborting the batch.
+        Args:
+            filenumbers (Iterable[int]): The filenumbers of the claims to retrieve.
+            max_concurrency (int): The maximum number of requests in flight at once. Defaults to 10.
+            on_result (Callable, optional): Called with each BulkResult as soon as it finishes.
+        Returns:
+            list[BulkResult[Claim]]: One result per filenumber, in input order. Check `ok`, then read `value` or `error`.
+        """
+        return run_bounded(self.get_single_claim, filenumbers, max_concurrency, on_result)
     
+    @instrumented
     def create_claim(
             self,
             rentername: str,
@@ -95,19 +326,82 @@ class ClaimsModule(BaseModule):
         Returns:
             ApiResponse: Response from the API indicating success or failure.
         """
-        all_args = locals()
-        data = {key: value for key, value in all_args.items() if value is not None and key != "self"}
-        
+        data = self._claim_payload(locals())
+
         response = self._client.post(
                 url="/createclaim",
-                json=data
+                **self._json_body(data)
                 )
 
         self._check_response(response)
 
-        response_json: ApiResponse = response.json()
+        response_json: ApiResponse = self._decode(response)
         return response_json
     
+    @instrumented
+    def create_claims_bulk(
+            self,
+            rows: Iterable[Any],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            on_result: Optional[Callable[[BulkResult[ApiResponse]], None]] = None,
+    ) -> list[BulkResult[ApiResponse]]:
+        """
+        Creates many claims concurrently over the client's shared connection pool.
+         Rows are read from the iterable lazily, so a large import is never held in flight all at once,
+         and a row that fails is reported on its own result instead of aborting the run.
+        Args:
+            rows (Iterable): Dicts, dataclass instances or NamedTuples with the same fields as create_claim.
+            max_concurrency (int): The maximum number of requests in flight at once. Defaults to 10.
+            on_result (Callable, optional): Called with each BulkResult as soon as it finishes.
+        Returns:
+            list[BulkResult[ApiResponse]]: One result per row, in input order. The `value` of a successful
+             result is the ApiResponse, including the filenumber the server assigned.
+        """
+        return run_bounded(lambda row: self.create_claim(**self._row_fields(row)), rows, max_concurrency, on_result)
+
+    @instrumented
+    def update_claims_bulk(
+            self,
+            records: Iterable[Any],
+            current: Optional[Iterable[Claim]] = None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            on_result: Optional[Callable[[BulkResult[Optional[ApiResponse]]], None]] = None,
+            ignore_untracked: bool = False,
+    ) -> list[BulkResult[Optional[ApiResponse]]]:
+        """
+        Updates many claims concurrently, sending only the fields that differ from each claim's current state
+         and skipping claims where nothing changed.
+        Args:
+            records (Iterable): Dicts, dataclass instances or NamedTuples with a filenumber and update_claim fields.
+            current (Iterable[Claim], optional): The claims to compare against, e.g. from get_claims(include_inactive=True).
+             When omitted they are fetched with get_many_claims, which reads through the client's cache if one is set.
+            max_concurrency (int): The maximum number of requests in flight at once. Defaults to 10.
+            on_result (Callable, optional): Called with each BulkResult as soon as it finishes.
+            ignore_untracked (bool): Fields a Claim does not expose (note, inscompaniesid, renterphone, renteremail
+             and the vehicle location fields) are compared with the values this module last sent for the claim
+             (see sent_untracked). If True, a value never sent before is assumed to be on the server already and
+             is not sent; by default it is sent.
+        Returns:
+            list[BulkResult[Optional[ApiResponse]]]: One result per record, in input order. The `value` is the
+             ApiResponse of the update, or None if the claim was already up to date and no request was sent.
+        """
+        records = [self._row_fields(record) for record in records]
+        snapshot: Iterable[Any] = current if current is not None else self.get_many_claims(
+            list(dict.fromkeys(record.get("filenumber") for record in records)), max_concurrency
+        )
+        current_claims = self._current_claims(snapshot)
+
+        def update(record: dict) -> Optional[ApiResponse]:
+            changes = self._planned_update(record, current_claims, ignore_untracked)
+            if not changes:
+                return None
+            response = self.update_claim(filenumber=record["filenumber"], **changes)
+            self._remember_sent(record["filenumber"], changes)
+            return response
+
+        return run_bounded(update, records, max_concurrency, on_result)
+
+    @instrumented
     def update_claim(
             self,
             filenumber: int,
@@ -161,15 +455,245 @@ class ClaimsModule(BaseModule):
         Returns:
             ApiResponse: Response from the API indicating success or failure.
         """
-        all_args = locals()
-        data = {key: value for key, value in all_args.items() if value is not None and key != "self"}
-        
-        response = self._client.post(
-                url="/updateclaim",
-                json=data
-               )
+        data = self._claim_payload(locals())
+
+        try:
+            response = self._client.post(
+                    url="/updateclaim",
+                    **self._json_body(data)
+                   )
+        finally:
+            self._invalidate_claim(filenumber)
+
+        self._check_response(response)
+
+        response_json: ApiResponse = self._decode(response)
+        return response_json
+
+
+class AsyncClaimsModule(ClaimsCore, AsyncBaseModule):
+    @instrumented
+    async def get_claims(self, include_inactive: bool = False, as_collection: bool = False) -> Union[list[Claim], ClaimCollection]:
+        """
+        Retrieves a list of active (or all) claims without blocking the event loop.
+        See ClaimsModule.get_claims for details.
+        """
+        key = claims_key(include_inactive)
+        stale, conditional = self._revalidation(key)
+        response = await self._client.get(
+                url=self._claims_url(include_inactive),
+                **conditional,
+                )
+
+        if self._not_modified(key, response, stale):
+            return self._claims_result(stale, as_collection)
+
+        self._check_response(response)
+
+        claims = self._typed_claims(self._decode(response))
+        self._cache_for_revalidation(key, claims, response)
+        return self._claims_result(claims, as_collection)
+
+    @instrumented
+    async def get_claims_table(self, include_inactive: bool = False, backend: str = "arrow") -> Any:
+        """
+        Retrieves active (or all) claims as a columnar table without blocking the event loop.
+        See ClaimsModule.get_claims_table for details.
+        """
+        response = await self._client.get(
+                url=self._claims_url(include_inactive),
+                )
+
+        self._check_response(response)
+
+        return measure("typing_seconds", claims_table, self._decode(response), backend)
+
+    @instrumented
+    async def iter_claims(self, include_inactive: bool = False) -> AsyncIterator[Claim]:
+        """
+        Streams active (or all) claims without blocking the event loop, yielding one Claim at a time.
+        See ClaimsModule.iter_claims for details.
+        """
+        async with self._client.stream("GET", self._claims_url(include_inactive)) as response:
+            if response.is_error:
+                await response.aread()
+                self._check_response(response)
+
+            parser = JsonArrayParser()
+            async for chunk in response.aiter_text():
+                for claim in parser.feed(chunk):
+                    yield self._typed_claim(claim)
+            for claim in parser.close():
+                yield self._typed_claim(claim)
+
+    @instrumented
+    async def get_single_claim(self, filenumber: int) -> Claim:
+        """
+        Retrieves a single claim by its filenumber without blocking the event loop.
+        See ClaimsModule.get_single_claim for details.
+        """
+        cached = self._cache_get(claim_key(filenumber))
+        if cached is not None:
+            return cached
+
+        async def fetch() -> Claim:
+            stale, conditional = self._revalidation(claim_key(filenumber))
+            response = await self._client.get(
+                    url=f"/getclaims/{filenumber}",
+                    **conditional,
+                    )
+
+            if self._not_modified(claim_key(filenumber), response, stale):
+                return stale
+
+            self._check_response(response)
+
+            claim = self._typed_single_claim(filenumber, self._decode(response))
+            self._cache_set(claim_key(filenumber), claim, response)
+            return claim
+
+        return await self._coalesced(claim_key(filenumber), fetch)
+
+    @instrumented
+    async def get_many_claims(
+            self,
+            filenumbers: Iterable[int],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            on_result: Optional[Callable[[BulkResult[Claim]], None]] = None,
+    ) -> list[BulkResult[Claim]]:
+        """
+        Retrieves many claims concurrently without blocking the event loop.
+        See ClaimsModule.get_many_claims for details.
+        """
+        return await gather_bounded(self.get_single_claim, filenumbers, max_concurrency, on_result)
+
+    @instrumented
+    async def create_claim(
+            self,
+            rentername: str,
+            inscompaniesid: str,
+            dateofloss: str,
+            vehmake: str,
+            vehmodel: str,
+            vehcolor: str,
+            vehvin: str,
+            clientclaimno: Optional[str]=None,
+            claimnumber: Optional[str]=None,
+            note: Optional[str]=None,
+            insuredname: Optional[str]=None,
+            policynumber: Optional[str]=None,
+            renterphone: Optional[str]=None,
+            renteremail: Optional[str]=None,
+            vehlocationdetails: Optional[str]=None,
+            vehlocationcity: Optional[str]=None,
+            vehlocationstate: Optional[str]=None,
+            vehyear: Optional[int]=None,
+            vehedition: Optional[str]=None,
+            vehplatenumber: Optional[str]=None,
+            vehunitnumber: Optional[str]=None
+    ) -> ApiResponse:
+        """
+        Creates a new claim with the provided details without blocking the event loop.
+        See ClaimsModule.create_claim for the meaning of each argument.
+        """
+        data = self._claim_payload(locals())
+
+        response = await self._client.post(
+                url="/createclaim",
+                **self._json_body(data)
+                )
+
+        self._check_response(response)
+
+        response_json: ApiResponse = self._decode(response)
+        return response_json
+
+    @instrumented
+    async def create_claims_bulk(
+            self,
+            rows: Iterable[Any],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            on_result: Optional[Callable[[BulkResult[ApiResponse]], None]] = None,
+    ) -> list[BulkResult[ApiResponse]]:
+        """
+        Creates many claims concurrently without blocking the event loop.
+        See ClaimsModule.create_claims_bulk for details.
+        """
+        async def create(row: Any) -> ApiResponse:
+            return await self.create_claim(**self._row_fields(row))
+
+        return await gather_bounded(create, rows, max_concurrency, on_result)
+
+    @instrumented
+    async def update_claims_bulk(
+            self,
+            records: Iterable[Any],
+            current: Optional[Iterable[Claim]] = None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            on_result: Optional[Callable[[BulkResult[Optional[ApiResponse]]], None]] = None,
+            ignore_untracked: bool = False,
+    ) -> list[BulkResult[Optional[ApiResponse]]]:
+        """
+        Updates many claims concurrently, skipping unchanged fields and claims, without blocking the event loop.
+        See ClaimsModule.update_claims_bulk for details.
+        """
+        records = [self._row_fields(record) for record in records]
+        snapshot: Iterable[Any] = current if current is not None else await self.get_many_claims(
+            list(dict.fromkeys(record.get("filenumber") for record in records)), max_concurrency
+        )
+        current_claims = self._current_claims(snapshot)
+
+        async def update(record: dict) -> Optional[ApiResponse]:
+            changes = self._planned_update(record, current_claims, ignore_untracked)
+            if not changes:
+                return None
+            response = await self.update_claim(filenumber=record["filenumber"], **changes)
+            self._remember_sent(record["filenumber"], changes)
+            return response
+
+        return await gather_bounded(update, records, max_concurrency, on_result)
+
+    @instrumented
+    async def update_claim(
+            self,
+            filenumber: int,
+            clientclaimno: Optional[str]=None,
+            claimnumber: Optional[str]=None,
+            note: Optional[str]=None,
+            rentername: Optional[str]=None,
+            inscompaniesid: Optional[str]=None,
+            insuredname: Optional[str]=None,
+            policynumber: Optional[str]=None,
+            renterphone: Optional[str]=None,
+            renteremail: Optional[str]=None,
+            dateofloss: Optional[str]=None,
+            vehlocationdetails: Optional[str]=None,
+            vehlocationcity: Optional[str]=None,
+            vehlocationstate: Optional[str]=None,
+            vehyear: Optional[int]=None,
+            vehmake: Optional[str]=None,
+            vehmodel: Optional[str]=None,
+            vehedition: Optional[str]=None,
+            vehcolor: Optional[str]=None,
+            vehvin: Optional[str]=None,
+            vehplatenumber: Optional[str]=None,
+            vehunitnumber: Optional[str]=None
+    ) -> ApiResponse:
+        """
+        Updates an existing claim with the provided details without blocking the event loop.
+        See ClaimsModule.update_claim for the meaning of each argument.
+        """
+        data = self._claim_payload(locals())
+
+        try:
+            response = await self._client.post(
+                    url="/updateclaim",
+                    **self._json_body(data)
+                   )
+        finally:
+            self._invalidate_claim(filenumber)
 
         self._check_response(response)
 
-        response_json: ApiResponse = response.json()
+        response_json: ApiResponse = self._decode(response)
         return response_json
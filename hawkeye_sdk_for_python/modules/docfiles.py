@@ -1,7 +1,77 @@
-from .base import BaseModule
-from ..types import DocType
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable, Optional
+from .base import ModuleCore, BaseModule, AsyncBaseModule
+from ..instrumentation import instrumented
+from ..constants import DEFAULT_MAX_CONCURRENCY
+from ..types import BulkResult, DocType
+from ..utils import run_bounded, gather_bounded
 
-class DocfilesModule(BaseModule):
+def _upload_args(
+        filenumber: int,
+        fileurl: str,
+        category: DocType = DocType.DEFAULT,
+        visibleToClient: bool = False,
+        notes: str = ""
+        ) -> tuple:
+    return (filenumber, fileurl, category, visibleToClient, notes)
+
+class DocfilesCore(ModuleCore):
+    """Payload building shared by DocfilesModule and AsyncDocfilesModule."""
+
+    _instrumentation_name = "docfiles"
+
+    @staticmethod
+    def _unique_uploads(items: Iterable[Any]) -> tuple[list[tuple], list[int], list[int]]:
+        """
+        Normalises upload items to upload_file argument tuples and drops repeated (filenumber, fileurl) pairs.
+         Returns the unique uploads, the unique upload each item maps to, and the first item of each upload.
+        """
+        uploads, positions, first_items, seen = [], [], [], {}
+        for index, item in enumerate(items):
+            args = _upload_args(**item) if isinstance(item, Mapping) else _upload_args(*item)
+            key = (str(args[0]), args[1])
+            if key not in seen:
+                seen[key] = len(uploads)
+                uploads.append(args)
+                first_items.append(index)
+            positions.append(seen[key])
+        return uploads, positions, first_items
+
+    @staticmethod
+    def _item_result(result: BulkResult, index: int) -> BulkResult:
+        return BulkResult(index=index, item=result.item, value=result.value, error=result.error)
+
+    def _upload_callback(
+            self,
+            first_items: list[int],
+            on_result: Optional[Callable[[BulkResult], None]],
+            ) -> Optional[Callable[[BulkResult], None]]:
+        """Reports each finished upload under the index of the first item that requested it."""
+        if on_result is None:
+            return None
+        return lambda result: on_result(self._item_result(result, first_items[result.index]))
+
+    def _upload_results(self, results: list[BulkResult], positions: list[int]) -> list[BulkResult]:
+        return [self._item_result(results[position], index) for index, position in enumerate(positions)]
+
+    @staticmethod
+    def _savefile_payload(
+            filenumber: int,
+            fileurl: str,
+            category: DocType,
+            visibleToClient: bool,
+            notes: str
+            ) -> dict:
+        return {
+                "filenumber": filenumber,
+                "link": fileurl,
+                "category": category.value,
+                "visibleToClient": visibleToClient,
+                "notes": notes
+                }
+
+class DocfilesModule(DocfilesCore, BaseModule):
+    @instrumented
     def upload_file(
             self,
             filenumber: int,
@@ -21,18 +91,86 @@ class DocfilesModule(BaseModule):
         Returns:
             None
         """
-        response = self._client.post(
-                url="/savefile",
-                json={
-                    "filenumber": filenumber,
-                    "link": fileurl,
-                    "category": category.value,
-                    "visibleToClient": visibleToClient,
-                    "notes": notes
-                    }
-                )
+        try:
+            response = self._client.post(
+                    url="/savefile",
+                    **self._json_body(self._savefile_payload(filenumber, fileurl, category, visibleToClient, notes))
+                    )
+        finally:
+            self._invalidate_claim(filenumber)
 
         self._check_response(response)
 
 
         return
+
+    @instrumented
+    def upload_files(
+            self,
+            items: Iterable[Any],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            on_result: Optional[Callable[[BulkResult[None]], None]] = None,
+            ) -> list[BulkResult[None]]:
+        """
+        Uploads many documents concurrently over the client's shared connection pool.
+         Items that repeat an earlier (filenumber, fileurl) pair are not posted again and share its result.
+        Args:
+            items (Iterable): Tuples of (filenumber, fileurl, category, visibleToClient, notes), or dicts with
+             those keys. Trailing tuple elements and dict keys other than filenumber and fileurl are optional.
+            max_concurrency (int): The maximum number of requests in flight at once. Defaults to 10.
+            on_result (Callable, optional): Called with each BulkResult as soon as its upload finishes.
+        Returns:
+            list[BulkResult[None]]: One result per item, in input order. `item` holds the normalised upload
+             arguments. Check `ok`, and read `error` for uploads that failed.
+        """
+        uploads, positions, first_items = self._unique_uploads(items)
+        results = run_bounded(
+            lambda args: self.upload_file(*args), uploads, max_concurrency, self._upload_callback(first_items, on_result)
+            )
+        return self._upload_results(results, positions)
+
+
+class AsyncDocfilesModule(DocfilesCore, AsyncBaseModule):
+    @instrumented
+    async def upload_file(
+            self,
+            filenumber: int,
+            fileurl: str,
+            category: DocType = DocType.DEFAULT,
+            visibleToClient: bool = False,
+            notes: str = ""
+            ):
+        """
+        Uploads a document to a specific filenumber without blocking the event loop.
+        See DocfilesModule.upload_file for the meaning of each argument.
+        """
+        try:
+            response = await self._client.post(
+                    url="/savefile",
+                    **self._json_body(self._savefile_payload(filenumber, fileurl, category, visibleToClient, notes))
+                    )
+        finally:
+            self._invalidate_claim(filenumber)
+
+        self._check_response(response)
+
+        return
+
+    @instrumented
+    async def upload_files(
+            self,
+            items: Iterable[Any],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            on_result: Optional[Callable[[BulkResult[None]], None]] = None,
+            ) -> list[BulkResult[None]]:
+        """
+        Uploads many documents concurrently without blocking the event loop.
+        See DocfilesModule.upload_files for details.
+        """
+        uploads, positions, first_items = self._unique_uploads(items)
+
+        async def upload(args: tuple):
+            return await self.upload_file(*args)
+
+        results = await gather_bounded(upload, uploads, max_concurrency, self._upload_callback(first_items, on_result))
+        return self._upload_results(results, positions)
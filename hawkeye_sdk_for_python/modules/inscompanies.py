@@ -1,34 +1,331 @@
-from ..types import InsCompany
-from .base import BaseModule
+import asyncio
+import logging
+import threading
+import time
+from typing import Iterable, Optional
+from ..cache import inscompanies_key
+from ..constants import DEFAULT_MAX_CONCURRENCY
+from ..search import InsCompanyIndex, normalize_name
+from ..types import BulkResult, InsCompany
+from ..utils import run_bounded, gather_bounded
+from ..instrumentation import instrumented, measure
+from .base import ModuleCore, BaseModule, AsyncBaseModule
 
-class InsCompaniesModule(BaseModule):
+logger = logging.getLogger(__name__)
+
+class InsCompaniesCore(ModuleCore):
+    """Query building and response typing shared by InsCompaniesModule and AsyncInsCompaniesModule."""
+
+    _instrumentation_name = "inscompanies"
+    MAX_LIMIT = 20
+
+    _local_index: Optional[InsCompanyIndex] = None
+    _local_index_loaded_at: float = 0.0
+    _local_index_refresh_interval: Optional[float] = None
+    _local_index_refreshing: bool = False
+    # Bumped whenever an index is installed or local mode is disabled, so a slower reload can tell it is stale.
+    _local_index_generation: int = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolved_names: dict[str, Optional[InsCompany]] = {}
+        self._local_index_lock = threading.Lock()
+
+    def clear_resolved_names(self):
+        """Forgets the matches memoized by resolve_many."""
+        self._resolved_names.clear()
+
+    def _unresolved_names(self, keys: list[str]) -> list[str]:
+        return [key for key in dict.fromkeys(keys) if key and key not in self._resolved_names]
+
+    def _best_match(self, matches: list[InsCompany]) -> Optional[InsCompany]:
+        return matches[0] if matches else None
+
+    def _remember_resolutions(self, results: list[BulkResult]) -> dict[str, Exception]:
+        """Memoizes successful lookups and returns the failures by name, so a retry only repeats what failed."""
+        failures = {}
+        for result in results:
+            if result.ok:
+                self._resolved_names[result.item] = result.value
+            else:
+                failures[result.item] = result.error
+        return failures
+
+    def _resolutions(
+            self,
+            names: list[str],
+            keys: list[str],
+            failures: dict[str, Exception],
+            min_probability: int,
+            ) -> list[BulkResult[Optional[InsCompany]]]:
+        resolved = []
+        for index, (name, key) in enumerate(zip(names, keys)):
+            if key in failures:
+                resolved.append(BulkResult(index, name, error=failures[key]))
+                continue
+            match = self._resolved_names.get(key) if key else None
+            if match is not None and match.probability is not None and match.probability < min_probability:
+                match = None
+            resolved.append(BulkResult(index, name, match))
+        return resolved
+
+    @property
+    def local_index(self) -> Optional[InsCompanyIndex]:
+        """The local company index, or None when local index mode is off."""
+        return self._local_index
+
+    def disable_local_index(self):
+        """Turns local index mode off; get_insurance_companies goes back to the server."""
+        with self._local_index_lock:
+            self._local_index_generation += 1
+            self._local_index = None
+            self._local_index_refresh_interval = None
+
+    def _install_local_index(self, companies: list[InsCompany], generation: Optional[int] = None) -> InsCompanyIndex:
+        """
+        Installs a freshly loaded index. A background reload passes the generation it started from, and its index
+         is dropped if local mode was disabled or another index was installed in the meantime.
+        """
+        index = InsCompanyIndex(companies)
+        with self._local_index_lock:
+            if generation is None or generation == self._local_index_generation:
+                self._local_index_generation += 1
+                self._local_index = index
+                self._local_index_loaded_at = time.monotonic()
+        return index
+
+    def _claim_refresh(self) -> Optional[int]:
+        """Marks a reload as running and returns the current generation if the index is stale and no reload is running."""
+        with self._local_index_lock:
+            if self._local_index_refreshing or self._local_index_refresh_interval is None:
+                return None
+            if time.monotonic() - self._local_index_loaded_at < self._local_index_refresh_interval:
+                return None
+            self._local_index_refreshing = True
+            return self._local_index_generation
+
+    def _search_local_index(self, index: InsCompanyIndex, query: str, limit: int) -> list[InsCompany]:
+        if not query:
+            return list(index.companies)
+        return index.search(query, limit)
+
+    @staticmethod
+    def _log_refresh_failure(exc: Exception):
+        logger.warning("Refreshing the local insurance company index failed; keeping the previous index: %s", exc)
+
+    def _inscompanies_cache_key(self, query: str, limit: int) -> tuple:
+        return inscompanies_key(query, min(limit, self.MAX_LIMIT) if query else 0)
+
+    def _inscompanies_params(self, query: str, limit: int) -> dict:
+        if limit > self.MAX_LIMIT:
+            limit = self.MAX_LIMIT
+
+        params = {}
+        if query:
+            params["q"] = query
+            params["limit"] = limit
+        return params
+
+    @staticmethod
+    def _typed_companies(portal_json: dict) -> list[InsCompany]:
+        items = portal_json.get("suggestions", portal_json.get("data", []))
+        return measure("typing_seconds", lambda: [InsCompany(**item) for item in items])
+
+class InsCompaniesModule(InsCompaniesCore, BaseModule):
+    @instrumented
     def get_insurance_companies(self, query: str = "", limit: int = 5) -> list[InsCompany]:
         """
         Retrieves a list of insurance companies. When no search query is provided, returns all companies.
          When a search query is provided, returns intelligent suggestions with probability scores on fuzzy matching.
+         In local index mode (see enable_local_index) the query is answered in-process without a server round trip.
          Args:
              query (str): The search query to filter insurance companies by name. If omitted, returns all companies.
-             limit (int): The maximum number of suggestions to return. Defaults to 5, maximum is 20.
+             limit (int): The maximum number of suggestions to return. Defaults to 5, maximum is 20 unless the local index is used.
          Returns:
              list[InsCompany]: A list of InsCompany objects.
          """ 
-        MAX_LIMIT = 20
-        
-        if limit > MAX_LIMIT:
-            limit = MAX_LIMIT
-        
+        index = self._local_index
+        if index is not None:
+            generation = self._claim_refresh()
+            if generation is not None:
+                threading.Thread(target=self._background_refresh, args=(generation,), daemon=True).start()
+            return self._search_local_index(index, query, limit)
+
         url = "/inscompanies"
         
-        params = {}
-        if query:
-            params["q"] = query
-            params["limit"] = limit
-        
-        response = self._client.get(url, params=params)
-        
+        cache_key = self._inscompanies_cache_key(query, limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        params = self._inscompanies_params(query, limit)
+
+        def fetch() -> list[InsCompany]:
+            stale, conditional = self._revalidation(cache_key)
+            response = self._client.get(url, params=params, **conditional)
+
+            if self._not_modified(cache_key, response, stale):
+                return stale
+
+            self._check_response(response)
+
+            ins_companies = self._typed_companies(self._decode(response))
+            self._cache_set(cache_key, ins_companies, response)
+            return ins_companies
+
+        return list(self._coalesced(cache_key, fetch))
+
+    @instrumented
+    def resolve_many(
+            self,
+            names: Iterable[str],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            min_probability: int = 0,
+            ) -> list[BulkResult[Optional[InsCompany]]]:
+        """
+        Resolves many free-text insurer names to their best matching company, e.g. for a CSV claim import.
+         Names are normalised and deduplicated first, and each distinct name is looked up once: against the
+         local index when it is enabled, otherwise concurrently against the server. Matches are memoized on
+         the module, so repeated batches only look up names they have not seen before. A lookup that fails is
+         reported on the results of its names instead of aborting the batch, and is retried by the next batch.
+        Args:
+            names (Iterable[str]): The insurer names to resolve.
+            max_concurrency (int): The maximum number of server lookups in flight at once. Defaults to 10.
+            min_probability (int): Matches scoring below this (0-100) are returned as None. Defaults to 0.
+        Returns:
+            list[BulkResult[Optional[InsCompany]]]: One result per name, in input order. Check `ok`, then read `value`
+             (the best match with its probability, or None) or `error`.
+        """
+        names = list(names)
+        keys = [normalize_name(name) for name in names]
+        pending = self._unresolved_names(keys)
+        failures = {}
+        if pending:
+            lookup = lambda key: self._best_match(self.get_insurance_companies(query=key, limit=1))
+            failures = self._remember_resolutions(run_bounded(lookup, pending, 1 if self._local_index is not None else max_concurrency))
+        return self._resolutions(names, keys, failures, min_probability)
+
+    def enable_local_index(self, refresh_interval: Optional[float] = 3600.0) -> InsCompanyIndex:
+        """
+        Downloads the full company list once and answers get_insurance_companies from an in-process trigram index.
+         When the index is older than refresh_interval, the next query starts a background reload and keeps using
+         the current index until the new one is ready.
+        Args:
+            refresh_interval (float, optional): Seconds between reloads. None never reloads. Defaults to one hour.
+        Returns:
+            InsCompanyIndex: The loaded index.
+        """
+        self._local_index_refresh_interval = refresh_interval
+        return self.refresh_local_index()
+
+    @instrumented
+    def refresh_local_index(self) -> InsCompanyIndex:
+        """Reloads the full company list from the server and rebuilds the local index."""
+        return self._install_local_index(self._fetch_all_companies())
+
+    def _fetch_all_companies(self) -> list[InsCompany]:
+        response = self._client.get("/inscompanies", params={})
+
+        self._check_response(response)
+
+        return self._typed_companies(self._decode(response))
+
+    def _background_refresh(self, generation: int):
+        try:
+            self._install_local_index(self._fetch_all_companies(), generation)
+        except Exception as exc:
+            self._local_index_loaded_at = time.monotonic()
+            self._log_refresh_failure(exc)
+        finally:
+            self._local_index_refreshing = False
+
+
+class AsyncInsCompaniesModule(InsCompaniesCore, AsyncBaseModule):
+    _refresh_task: Optional[asyncio.Task] = None
+
+    @instrumented
+    async def get_insurance_companies(self, query: str = "", limit: int = 5) -> list[InsCompany]:
+        """
+        Retrieves a list of insurance companies without blocking the event loop.
+        See InsCompaniesModule.get_insurance_companies for details.
+        """
+        index = self._local_index
+        if index is not None:
+            generation = self._claim_refresh()
+            if generation is not None:
+                self._refresh_task = asyncio.create_task(self._background_refresh(generation))
+            return self._search_local_index(index, query, limit)
+
+        url = "/inscompanies"
+
+        cache_key = self._inscompanies_cache_key(query, limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        params = self._inscompanies_params(query, limit)
+
+        async def fetch() -> list[InsCompany]:
+            stale, conditional = self._revalidation(cache_key)
+            response = await self._client.get(url, params=params, **conditional)
+
+            if self._not_modified(cache_key, response, stale):
+                return stale
+
+            self._check_response(response)
+
+            ins_companies = self._typed_companies(self._decode(response))
+            self._cache_set(cache_key, ins_companies, response)
+            return ins_companies
+
+        return list(await self._coalesced(cache_key, fetch))
+
+    @instrumented
+    async def resolve_many(
+            self,
+            names: Iterable[str],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            min_probability: int = 0,
+            ) -> list[BulkResult[Optional[InsCompany]]]:
+        """
+        Resolves many free-text insurer names to their best matching company without blocking the event loop.
+        See InsCompaniesModule.resolve_many for details.
+        """
+        names = list(names)
+        keys = [normalize_name(name) for name in names]
+        pending = self._unresolved_names(keys)
+        failures = {}
+        if pending:
+            async def lookup(key: str) -> Optional[InsCompany]:
+                return self._best_match(await self.get_insurance_companies(query=key, limit=1))
+            failures = self._remember_resolutions(await gather_bounded(lookup, pending, max_concurrency))
+        return self._resolutions(names, keys, failures, min_probability)
+
+    async def enable_local_index(self, refresh_interval: Optional[float] = 3600.0) -> InsCompanyIndex:
+        """
+        Downloads the full company list once and answers get_insurance_companies from an in-process index.
+        See InsCompaniesModule.enable_local_index for details.
+        """
+        self._local_index_refresh_interval = refresh_interval
+        return await self.refresh_local_index()
+
+    @instrumented
+    async def refresh_local_index(self) -> InsCompanyIndex:
+        """Reloads the full company list from the server and rebuilds the local index."""
+        return self._install_local_index(await self._fetch_all_companies())
+
+    async def _fetch_all_companies(self) -> list[InsCompany]:
+        response = await self._client.get("/inscompanies", params={})
+
         self._check_response(response)
-        portal_json = response.json()
 
-        ins_companies = [InsCompany(**item) for item in portal_json.get("suggestions", portal_json.get("data", []))]
+        return self._typed_companies(self._decode(response))
 
-        return ins_companies
+    async def _background_refresh(self, generation: int):
+        try:
+            self._install_local_index(await self._fetch_all_companies(), generation)
+        except Exception as exc:
+            self._local_index_loaded_at = time.monotonic()
+            self._log_refresh_failure(exc)
+        finally:
+            self._local_index_refreshing = False
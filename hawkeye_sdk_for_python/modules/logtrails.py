@@ -1,15 +1,41 @@
-from .base import BaseModule
+from typing import Optional
+from .base import ModuleCore, BaseModule, AsyncBaseModule
+from ..instrumentation import instrumented
 from ..types import ApiResponse
+from ..writebehind import WriteBehindQueue, AsyncWriteBehindQueue, ErrorCallback
 from datetime import datetime
-import json
 
-class LogtrailsModule(BaseModule):
+class LogtrailsCore(ModuleCore):
+    """Payload building shared by LogtrailsModule and AsyncLogtrailsModule."""
+
+    _instrumentation_name = "logtrails"
+    _write_behind = None
+
+    @property
+    def write_behind(self):
+        """The write-behind queue entries are buffered in, or None when entries are sent synchronously."""
+        return self._write_behind
+
+    @staticmethod
+    def _log_trail_payload(file_number: int, activity: str, date: str) -> dict:
+        if date == "":
+            date = datetime.now().strftime("%m/%d/%Y")
+        return {
+                "filenumber": file_number,
+                "activity": activity,
+                "date": date
+                }
+
+class LogtrailsModule(LogtrailsCore, BaseModule):
+    _write_behind: Optional[WriteBehindQueue]
+
+    @instrumented
     def create_log_trail(
             self, 
             file_number: int,
             activity: str,
             date: str = "" 
-            ) -> ApiResponse:
+            ) -> Optional[ApiResponse]:
         """
         Creates a status entry for a specific file number with the given activity and date.
         Args:
@@ -18,17 +44,114 @@ class LogtrailsModule(BaseModule):
             date (str, optional): The date of the activity in MM/DD/YYYY format. Defaults to the current date if not provided.
         Returns:
             ApiResponse: The API response indicating the success or failure of the operation.
+             None when write-behind is enabled: the entry is queued and sent in the background.
         """
-        if date == "":
-            date = datetime.now().strftime("%m/%d/%Y")
-        response = self._client.post(
-                url="/createLogTrailEntry",
-                json={
-                    "filenumber": file_number,
-                    "activity": activity,
-                    "date": date
-                    }
-                )
+        payload = self._log_trail_payload(file_number, activity, date)
+        if self._write_behind is not None:
+            self._write_behind.put(payload)
+            return None
+        return self._send_log_trail(payload)
+
+    def _send_log_trail(self, payload: dict) -> ApiResponse:
+        try:
+            response = self._client.post(
+                    url="/createLogTrailEntry",
+                    **self._json_body(payload)
+                    )
+        finally:
+            self._invalidate_claim(payload["filenumber"])
         self._check_response(response)
-        response_json: ApiResponse = json.loads(response.text)
+        response_json: ApiResponse = self._codec.loads(response.text)
         return response_json 
+
+    def enable_write_behind(
+            self,
+            max_queue_size: int = 1000,
+            max_concurrency: int = 4,
+            on_error: Optional[ErrorCallback] = None,
+            ) -> WriteBehindQueue:
+        """
+        Buffers log trail entries: create_log_trail queues the entry and returns immediately, and background
+         threads post queued entries with bounded concurrency. The entry date is fixed when it is queued.
+        Args:
+            max_queue_size (int): Entries held before create_log_trail blocks until there is room. Defaults to 1000.
+            max_concurrency (int): The maximum number of entries posted at once. Defaults to 4.
+            on_error (Callable, optional): Called with (payload, exception) for each entry that fails to post.
+             Failures are logged when it is None.
+        Returns:
+            WriteBehindQueue: The queue, exposing flush(), pending, sent and failed.
+        """
+        if self._write_behind is None:
+            self._write_behind = WriteBehindQueue(self._send_log_trail, max_queue_size, max_concurrency, on_error)
+        return self._write_behind
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every buffered entry has been posted or has failed.
+        Args:
+            timeout (float, optional): Maximum seconds to wait. Defaults to None (wait indefinitely).
+        Returns:
+            bool: False if entries were still pending when timeout ran out.
+        """
+        return self._write_behind.flush(timeout) if self._write_behind is not None else True
+
+    def disable_write_behind(self, timeout: Optional[float] = None) -> bool:
+        """Drains the buffered entries, stops the background workers and sends later entries synchronously."""
+        write_behind, self._write_behind = self._write_behind, None
+        return write_behind.close(timeout) if write_behind is not None else True
+
+
+class AsyncLogtrailsModule(LogtrailsCore, AsyncBaseModule):
+    _write_behind: Optional[AsyncWriteBehindQueue]
+
+    @instrumented
+    async def create_log_trail(
+            self,
+            file_number: int,
+            activity: str,
+            date: str = ""
+            ) -> Optional[ApiResponse]:
+        """
+        Creates a status entry for a specific file number without blocking the event loop.
+        See LogtrailsModule.create_log_trail for the meaning of each argument.
+        """
+        payload = self._log_trail_payload(file_number, activity, date)
+        if self._write_behind is not None:
+            await self._write_behind.put(payload)
+            return None
+        return await self._send_log_trail(payload)
+
+    async def _send_log_trail(self, payload: dict) -> ApiResponse:
+        try:
+            response = await self._client.post(
+                    url="/createLogTrailEntry",
+                    **self._json_body(payload)
+                    )
+        finally:
+            self._invalidate_claim(payload["filenumber"])
+        self._check_response(response)
+        response_json: ApiResponse = self._codec.loads(response.text)
+        return response_json
+
+    async def enable_write_behind(
+            self,
+            max_queue_size: int = 1000,
+            max_concurrency: int = 4,
+            on_error: Optional[ErrorCallback] = None,
+            ) -> AsyncWriteBehindQueue:
+        """
+        Buffers log trail entries, posting them from worker tasks on the running event loop.
+        See LogtrailsModule.enable_write_behind for details.
+        """
+        if self._write_behind is None:
+            self._write_behind = AsyncWriteBehindQueue(self._send_log_trail, max_queue_size, max_concurrency, on_error)
+        return self._write_behind
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every buffered entry has been posted or has failed. See LogtrailsModule.flush."""
+        return await self._write_behind.flush(timeout) if self._write_behind is not None else True
+
+    async def disable_write_behind(self, timeout: Optional[float] = None) -> bool:
+        """Drains the buffered entries, stops the worker tasks and sends later entries directly."""
+        write_behind, self._write_behind = self._write_behind, None
+        return await write_behind.close(timeout) if write_behind is not None else True
@@ -0,0 +1,312 @@
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import httpx
+
+from .base import ModuleCore, BaseModule, AsyncBaseModule
+from .claims import ClaimsCore, ClaimsModule
+from .docfiles import DocfilesCore, DocfilesModule
+from .logtrails import LogtrailsCore, LogtrailsModule
+from ..exceptions import APIError
+from ..types import ApiResponse
+from ..outbox import Outbox, OutboxEntry
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+def _bound_arguments(method: Callable, fields: dict) -> dict:
+    """Checks fields against a module method's signature and returns every argument, defaults included."""
+    bound = inspect.signature(method).bind(None, **fields)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+class OutboxCore(ModuleCore):
+    """Payload building and failure classification shared by OutboxModule and AsyncOutboxModule."""
+
+    @property
+    def _outbox(self) -> Outbox:
+        outbox = self._settings.outbox if self._settings is not None else None
+        if outbox is None:
+            raise RuntimeError("No outbox is configured. Pass outbox=Outbox(path) to the client.")
+        return outbox
+
+    @staticmethod
+    def _outbox_write(operation: str, fields: dict) -> tuple[str, dict, Any]:
+        """Returns the url, JSON payload and filenumber the module method named operation would post."""
+        if operation == "create_claim":
+            return "/createclaim", ClaimsCore._claim_payload(_bound_arguments(ClaimsModule.create_claim, fields)), None
+        if operation == "update_claim":
+            args = _bound_arguments(ClaimsModule.update_claim, fields)
+            return "/updateclaim", ClaimsCore._claim_payload(args), args["filenumber"]
+        if operation == "upload_file":
+            args = _bound_arguments(DocfilesModule.upload_file, fields)
+            del args["self"]
+            return "/savefile", DocfilesCore._savefile_payload(**args), args["filenumber"]
+        if operation == "create_log_trail":
+            args = _bound_arguments(LogtrailsModule.create_log_trail, fields)
+            payload = LogtrailsCore._log_trail_payload(args["file_number"], args["activity"], args["date"])
+            return "/createLogTrailEntry", payload, args["file_number"]
+        raise ValueError(f"Unsupported outbox operation: {operation}.")
+
+    def _add(self, operation: str, fields: dict, idempotency_key: Optional[str]) -> str:
+        url, payload, filenumber = self._outbox_write(operation, fields)
+        return self._outbox.add(operation, url, payload, filenumber, idempotency_key)
+
+    def _outbox_request(self, entry: OutboxEntry) -> dict:
+        return {"url": entry.url, "headers": {"Idempotency-Key": entry.idempotency_key}, **self._json_body(entry.payload)}
+
+    @staticmethod
+    def _retryable(exc: Exception) -> bool:
+        if isinstance(exc, APIError):
+            return exc.status_code in RETRYABLE_STATUSES
+        return isinstance(exc, httpx.TransportError)
+
+    def _report_sent(self, entry: OutboxEntry, response: ApiResponse):
+        on_sent = self._outbox.on_sent
+        if on_sent is None:
+            return
+        try:
+            on_sent(entry, response)
+        except Exception:
+            logger.exception("Outbox on_sent callback raised for entry %s", entry.idempotency_key)
+
+    def _record_failure(self, entry: OutboxEntry, exc: Exception, held: set) -> bool:
+        """
+        Reschedules or buries a failed entry and holds back the rest of its claim for this pass.
+         Returns True when the failure looks like an outage, so the pass should stop early.
+        """
+        retryable = self._retryable(exc)
+        self._outbox.mark_failed(entry, exc, retryable)
+        if entry.filenumber is not None:
+            held.add(entry.filenumber)
+        if not retryable:
+            logger.warning("Outbox entry %s (%s) was rejected and marked dead: %s", entry.idempotency_key, entry.operation, exc)
+        return retryable
+
+
+class OutboxModule(OutboxCore, BaseModule):
+    """
+    Queues create_claim, update_claim, upload_file and create_log_trail calls in a durable local outbox.
+     Each method returns the entry's idempotency key as soon as the write is on disk, and a background
+     thread replays entries to the API in order, retrying outages with backoff.
+    """
+
+    def __init__(self, client: httpx.Client, settings=None):
+        super().__init__(client, settings)
+        self._drain_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._drainer: Optional[threading.Thread] = None
+
+    def create_claim(self, idempotency_key: Optional[str] = None, **fields) -> str:
+        """
+        Queues a create_claim call. Takes the same arguments as ClaimsModule.create_claim.
+        Args:
+            idempotency_key (str, optional): Key sent as the Idempotency-Key header. Queuing a key that is still
+             in the outbox again is a no-op. Defaults to a random key.
+        Returns:
+            str: The idempotency key of the queued write.
+        """
+        return self._queue("create_claim", fields, idempotency_key)
+
+    def update_claim(self, idempotency_key: Optional[str] = None, **fields) -> str:
+        """Queues an update_claim call. See OutboxModule.create_claim."""
+        return self._queue("update_claim", fields, idempotency_key)
+
+    def upload_file(self, idempotency_key: Optional[str] = None, **fields) -> str:
+        """Queues an upload_file call. See OutboxModule.create_claim."""
+        return self._queue("upload_file", fields, idempotency_key)
+
+    def create_log_trail(self, idempotency_key: Optional[str] = None, **fields) -> str:
+        """Queues a create_log_trail call. The entry date is fixed when it is queued. See OutboxModule.create_claim."""
+        return self._queue("create_log_trail", fields, idempotency_key)
+
+    def _queue(self, operation: str, fields: dict, idempotency_key: Optional[str]) -> str:
+        key = self._add(operation, fields, idempotency_key)
+        self._wakeup.set()
+        return key
+
+    def drain(self) -> int:
+        """
+        Sends every entry that is due, oldest first, from the calling thread.
+        Returns:
+            int: The number of entries the API accepted.
+        """
+        sent = 0
+        with self._drain_lock:
+            held: set = set()
+            for entry in self._outbox.due():
+                if entry.filenumber in held:
+                    continue
+                try:
+                    response = self._send(entry)
+                except Exception as exc:
+                    if self._record_failure(entry, exc, held):
+                        break
+                else:
+                    self._report_sent(entry, response)
+                    self._outbox.mark_sent(entry)
+                    sent += 1
+        return sent
+
+    def _send(self, entry: OutboxEntry) -> ApiResponse:
+        try:
+            response = self._client.post(**self._outbox_request(entry))
+        finally:
+            if entry.filenumber is not None:
+                self._invalidate_claim(entry.filenumber)
+        self._check_response(response)
+        return self._decode(response)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Drains the outbox from the calling thread until no entries are pending, waiting out retry delays.
+        Args:
+            timeout (float, optional): Maximum seconds to wait. Defaults to None (wait indefinitely).
+        Returns:
+            bool: False if entries were still pending when timeout ran out.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.drain()
+            wait = self._outbox.seconds_until_due()
+            if wait is None:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            time.sleep(max(0.01, min(wait, remaining) if remaining is not None else wait))
+
+    def start(self, poll_interval: float = 1.0):
+        """Starts the background drainer thread, if it is not running yet."""
+        if self._drainer is not None and self._drainer.is_alive():
+            return
+        self._stopping.clear()
+        self._drainer = threading.Thread(target=self._run, args=(poll_interval,), name="hawkeye-outbox", daemon=True)
+        self._drainer.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stops the background drainer after its current request. Pending entries stay in the outbox."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._drainer is not None:
+            self._drainer.join(timeout)
+            self._drainer = None
+
+    def _run(self, poll_interval: float):
+        while not self._stopping.is_set():
+            try:
+                sent = self.drain()
+            except Exception:
+                logger.exception("Draining the outbox failed")
+                sent = 0
+            if not sent:
+                self._wakeup.wait(poll_interval)
+                self._wakeup.clear()
+
+
+class AsyncOutboxModule(OutboxCore, AsyncBaseModule):
+    """
+    Async counterpart of OutboxModule. The drainer runs as a task on the event loop and SQLite access
+     happens in worker threads, so queuing a write does not block the loop.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, settings=None):
+        super().__init__(client, settings)
+        self._drain_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._drainer: Optional[asyncio.Task] = None
+
+    async def create_claim(self, idempotency_key: Optional[str] = None, **fields) -> str:
+        """Queues a create_claim call. See OutboxModule.create_claim."""
+        return await self._queue("create_claim", fields, idempotency_key)
+
+    async def update_claim(self, idempotency_key: Optional[str] = None, **fields) -> str:
+        """Queues an update_claim call. See OutboxModule.create_claim."""
+        return await self._queue("update_claim", fields, idempotency_key)
+
+    async def upload_file(self, idempotency_key: Optional[str] = None, **fields) -> str:
+        """Queues an upload_file call. See OutboxModule.create_claim."""
+        return await self._queue("upload_file", fields, idempotency_key)
+
+    async def create_log_trail(self, idempotency_key: Optional[str] = None, **fields) -> str:
+        """Queues a create_log_trail call. See OutboxModule.create_claim."""
+        return await self._queue("create_log_trail", fields, idempotency_key)
+
+    async def _queue(self, operation: str, fields: dict, idempotency_key: Optional[str]) -> str:
+        key = await asyncio.to_thread(self._add, operation, fields, idempotency_key)
+        self.start()
+        self._wakeup.set()
+        return key
+
+    async def drain(self) -> int:
+        """Sends every entry that is due, oldest first. See OutboxModule.drain."""
+        sent = 0
+        async with self._drain_lock:
+            held: set = set()
+            for entry in await asyncio.to_thread(self._outbox.due):
+                if entry.filenumber in held:
+                    continue
+                try:
+                    response = await self._send(entry)
+                except Exception as exc:
+                    if await asyncio.to_thread(self._record_failure, entry, exc, held):
+                        break
+                else:
+                    self._report_sent(entry, response)
+                    await asyncio.to_thread(self._outbox.mark_sent, entry)
+                    sent += 1
+        return sent
+
+    async def _send(self, entry: OutboxEntry) -> ApiResponse:
+        try:
+            response = await self._client.post(**self._outbox_request(entry))
+        finally:
+            if entry.filenumber is not None:
+                self._invalidate_claim(entry.filenumber)
+        self._check_response(response)
+        return self._decode(response)
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Drains the outbox until no entries are pending. See OutboxModule.flush."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            await self.drain()
+            wait = await asyncio.to_thread(self._outbox.seconds_until_due)
+            if wait is None:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            await asyncio.sleep(max(0.01, min(wait, remaining) if remaining is not None else wait))
+
+    def start(self, poll_interval: float = 1.0):
+        """Starts the drainer task on the running event loop, if it is not running yet."""
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._run(poll_interval))
+
+    async def stop(self):
+        """Stops the drainer task. Pending entries stay in the outbox."""
+        if self._drainer is not None:
+            self._drainer.cancel()
+            await asyncio.gather(self._drainer, return_exceptions=True)
+            self._drainer = None
+
+    async def _run(self, poll_interval: float):
+        while True:
+            try:
+                sent = await self.drain()
+            except Exception:
+                logger.exception("Draining the outbox failed")
+                sent = 0
+            if not sent:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
@@ -0,0 +1,193 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+PENDING = "pending"
+DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    operation TEXT NOT NULL,
+    url TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    filenumber TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL
+)
+"""
+_COLUMNS = "id, idempotency_key, operation, url, payload, filenumber, status, attempts, next_attempt_at, last_error"
+
+
+@dataclass
+class OutboxEntry:
+    id: int
+    idempotency_key: str
+    operation: str
+    url: str
+    payload: dict
+    filenumber: Optional[str]
+    status: str
+    attempts: int
+    next_attempt_at: float
+    last_error: Optional[str]
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "OutboxEntry":
+        id, idempotency_key, operation, url, payload, filenumber, status, attempts, next_attempt_at, last_error = row
+        return cls(
+            id=id,
+            idempotency_key=idempotency_key,
+            operation=operation,
+            url=url,
+            payload=json.loads(payload),
+            filenumber=filenumber,
+            status=status,
+            attempts=attempts,
+            next_attempt_at=next_attempt_at,
+            last_error=last_error,
+        )
+
+
+# Called with an entry and the API's decoded response once the API has accepted it.
+SentCallback = Callable[["OutboxEntry", Any], None]
+
+
+class Outbox:
+    """
+    A durable queue of API writes stored in a local SQLite database. Each write is committed to disk before
+     add returns, and is only removed once the API has accepted it, so a crash never loses a write. A write
+     that was sent but not yet marked as done when the process died is sent again with the same
+     idempotency key (at-least-once delivery).
+    """
+
+    def __init__(
+            self,
+            path: str,
+            max_attempts: Optional[int] = None,
+            backoff_factor: float = 1.0,
+            max_backoff: float = 300.0,
+            clock: Callable[[], float] = time.time,
+            on_sent: Optional[SentCallback] = None,
+            ):
+        """
+        Args:
+            path (str): The SQLite database file. It is created if it does not exist.
+            max_attempts (int, optional): Attempts before a retryable failure is given up on and the entry is
+             marked dead. None keeps retrying. Defaults to None.
+            backoff_factor (float): Seconds before the first retry; the delay doubles with each attempt. Defaults to 1.0.
+            max_backoff (float): Upper bound of the retry delay in seconds. Defaults to 300.
+            clock (Callable, optional): Wall-clock time source, replaceable for testing.
+            on_sent (Callable, optional): Called by the drainer with (entry, response) when the API accepts an entry,
+             e.g. to learn the filenumber assigned to a queued create_claim. It runs before the entry is removed,
+             so after a crash it may be called again for the same write. Exceptions it raises are logged.
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self.on_sent = on_sent
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS outbox_filenumber ON outbox (filenumber, id)")
+
+    def add(
+            self,
+            operation: str,
+            url: str,
+            payload: dict,
+            filenumber: Any = None,
+            idempotency_key: Optional[str] = None,
+            ) -> str:
+        """
+        Durably stores a write. Adding a key that is already in the outbox is a no-op.
+        Returns:
+            str: The idempotency key of the entry.
+        """
+        key = idempotency_key or uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO outbox (idempotency_key, operation, url, payload, filenumber, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, operation, url, json.dumps(payload), None if filenumber is None else str(filenumber), self._clock()),
+            )
+        return key
+
+    def due(self, limit: int = 100) -> list[OutboxEntry]:
+        """
+        Returns pending entries that may be sent now, oldest first. An entry waiting for a retry holds back
+         later entries for the same filenumber, so writes to one claim are replayed in order.
+        """
+        now = self._clock()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM outbox AS entry"
+                " WHERE status = ? AND next_attempt_at <= ? AND (filenumber IS NULL OR NOT EXISTS ("
+                "   SELECT 1 FROM outbox AS waiting WHERE waiting.filenumber = entry.filenumber AND waiting.id < entry.id"
+                "   AND waiting.status = ? AND waiting.next_attempt_at > ?))"
+                " ORDER BY id LIMIT ?",
+                (PENDING, now, PENDING, now, limit),
+            ).fetchall()
+        return [OutboxEntry.from_row(row) for row in rows]
+
+    def entries(self, status: str = PENDING) -> list[OutboxEntry]:
+        """Returns the entries with the given status ("pending" or "dead"), oldest first."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_COLUMNS} FROM outbox WHERE status = ? ORDER BY id", (status,)).fetchall()
+        return [OutboxEntry.from_row(row) for row in rows]
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Returns how long until the earliest pending entry may be sent, or None if nothing is pending."""
+        with self._lock:
+            (when,) = self._conn.execute("SELECT MIN(next_attempt_at) FROM outbox WHERE status = ?", (PENDING,)).fetchone()
+        return None if when is None else max(0.0, when - self._clock())
+
+    def mark_sent(self, entry: OutboxEntry):
+        """Removes an entry the API has accepted."""
+        with self._lock:
+            self._conn.execute("DELETE FROM outbox WHERE id = ?", (entry.id,))
+
+    def mark_failed(self, entry: OutboxEntry, error: Exception, retryable: bool):
+        """Schedules a retry with exponential backoff, or marks the entry dead when it cannot succeed."""
+        attempts = entry.attempts + 1
+        if retryable and (self.max_attempts is None or attempts < self.max_attempts):
+            status = PENDING
+            next_attempt_at = self._clock() + min(self.max_backoff, self.backoff_factor * 2 ** (attempts - 1))
+        else:
+            status = DEAD
+            next_attempt_at = entry.next_attempt_at
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                (status, attempts, next_attempt_at, str(error), entry.id),
+            )
+
+    def requeue_dead(self) -> int:
+        """Moves every dead entry back to pending for immediate replay. Returns the number requeued."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = 0, next_attempt_at = 0 WHERE status = ?", (PENDING, DEAD)
+            )
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        """The number of pending entries."""
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM outbox WHERE status = ?", (PENDING,)).fetchone()
+        return count
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,64 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from .constants import ENDPOINTS
+
+
+def endpoint_for(path: str) -> Optional[str]:
+    """Returns the API endpoint ("/getclaims", "/savefile", ...) a request path belongs to, if any."""
+    for segment in path.split("/"):
+        endpoint = f"/{segment}"
+        if endpoint in ENDPOINTS:
+            return endpoint
+    return None
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that refills at `rate` tokens per second up to `burst` tokens.
+     reserve() never blocks: it takes a token, possibly going into debt, and returns how long the
+     caller must wait before sending, so the same bucket works from threads and from asyncio.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Takes tokens from the bucket and returns the number of seconds to wait before using them."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Client-side request budget. An optional default bucket applies to every request and optional
+     per-endpoint buckets apply to requests for that endpoint, keyed like "/getclaims" or "/createclaim".
+     One instance can be shared by several HawkeyeClient and AsyncHawkeyeClient instances.
+    """
+
+    def __init__(self, default: Optional[TokenBucket] = None, endpoints: Optional[dict[str, TokenBucket]] = None):
+        unknown = set(endpoints or {}) - set(ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unknown endpoints {sorted(unknown)}. Expected some of: {', '.join(ENDPOINTS)}.")
+        self.default = default
+        self.endpoints = dict(endpoints or {})
+
+    def reserve(self, path: str) -> float:
+        """Reserves a request slot for the given URL path and returns how long to wait before sending it."""
+        delay = self.default.reserve() if self.default is not None else 0.0
+        bucket = self.endpoints.get(endpoint_for(path) or "")
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        return delay
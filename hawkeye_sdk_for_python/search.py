@@ -0,0 +1,71 @@
+import re
+from collections import defaultdict
+from typing import Iterable
+
+from .types import InsCompany
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercases a company name and collapses punctuation and whitespace, so "State-Farm, Inc." == "state farm inc"."""
+    return _NON_ALNUM.sub(" ", name.lower()).strip()
+
+def trigrams(text: str, prefix: bool = False) -> set[str]:
+    """
+    Returns the character trigrams of a normalised string, padded so word starts carry weight.
+     With prefix=True the end is left unpadded, so a partially typed query still matches the full name.
+    """
+    padded = f"  {text}" if prefix else f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class InsCompanyIndex:
+    """
+    An in-process trigram index over insurance company names. Scores are 0-100 and average how much of the
+     query is found in the name (good for autocomplete) with how similar the two are overall (Dice coefficient).
+    """
+
+    def __init__(self, companies: Iterable[InsCompany]):
+        self.companies = [InsCompany(id=company.id, name=company.name) for company in companies]
+        self._trigrams = [trigrams(normalize_name(company.name)) for company in self.companies]
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for position, grams in enumerate(self._trigrams):
+            for gram in grams:
+                self._postings[gram].append(position)
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    def search(self, query: str, limit: int = 5) -> list[InsCompany]:
+        """
+        Returns up to limit companies matching query, best first, with their probability set.
+        Args:
+            query (str): Free-text, possibly partial, company name.
+            limit (int): The maximum number of results.
+        Returns:
+            list[InsCompany]: Matches ordered by probability from highest to lowest.
+        """
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+        query_grams = trigrams(normalized, prefix=True)
+        whole_query_grams = trigrams(normalized)
+
+        shared: dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+
+        scored = []
+        for position, overlap in shared.items():
+            containment = overlap / len(query_grams)
+            name_grams = self._trigrams[position]
+            dice = 2 * len(whole_query_grams & name_grams) / (len(whole_query_grams) + len(name_grams))
+            scored.append((round(100 * (containment + dice) / 2), position))
+        scored.sort(key=lambda item: (-item[0], self.companies[item[1]].name))
+
+        return [
+            InsCompany(id=self.companies[position].id, name=self.companies[position].name, probability=probability)
+            for probability, position in scored[:limit]
+        ]
@@ -0,0 +1,98 @@
+import json
+from typing import Any, Union
+
+
+class JsonCodec:
+    """
+    Encodes request bodies and decodes response bodies. The default implementation uses the standard
+     library through httpx, so requests are sent with `json=` and responses read with `response.json()`.
+    """
+
+    name = "stdlib"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def request_kwargs(self, obj: Any) -> dict:
+        """Returns the httpx keyword arguments that send obj as a JSON body."""
+        return {"json": obj}
+
+    def decode_response(self, response) -> Any:
+        return response.json()
+
+
+class _BytesJsonCodec(JsonCodec):
+    """Base for third-party codecs that work on raw bytes, bypassing httpx's stdlib JSON handling."""
+
+    def request_kwargs(self, obj: Any) -> dict:
+        return {"content": self.dumps(obj)}
+
+    def decode_response(self, response) -> Any:
+        return self.loads(response.content)
+
+
+class OrjsonCodec(_BytesJsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+class MsgspecCodec(_BytesJsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+_CODECS = {
+    "stdlib": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+def get_json_codec(backend: str = "auto") -> JsonCodec:
+    """
+    Returns a JSON codec for the given backend.
+    Args:
+        backend (str): "stdlib", "orjson", "msgspec", or "auto" to use the fastest installed library
+         (orjson, then msgspec) and fall back to the standard library.
+    Returns:
+        JsonCodec: The selected codec.
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If a specific third-party backend was requested but is not installed.
+    """
+    if backend == "auto":
+        for name in ("orjson", "msgspec"):
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                continue
+        return JsonCodec()
+
+    if backend not in _CODECS:
+        raise ValueError(f"Unknown JSON backend {backend!r}. Expected one of: auto, {', '.join(_CODECS)}.")
+
+    try:
+        return _CODECS[backend]()
+    except ImportError as exc:
+        raise ImportError(f"JSON backend {backend!r} requires the {backend} package: pip install {backend}") from exc
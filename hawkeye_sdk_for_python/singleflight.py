@@ -0,0 +1,89 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+@dataclass
+class SingleFlightStats:
+    executed: int = 0
+    shared: int = 0
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls across threads: while a call for a key is in flight, other callers
+     with the same key wait for it and receive its result (or its exception) instead of making their own.
+    """
+
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Runs func for key, unless a call for key is already in flight, in which case its result is shared."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats.executed += 1
+            else:
+                self.stats.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+
+class AsyncSingleFlight:
+    """
+    Async counterpart of SingleFlight, coalescing identical concurrent calls on one event loop. The call runs
+     in its own task that every caller awaits through asyncio.shield, so cancelling one caller, including the
+     one that started it, does not cancel the others.
+    """
+
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Awaits func for key, unless a call for key is already in flight, in which case its result is shared."""
+        task = self._calls.get(key)
+        if task is not None:
+            self.stats.shared += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._finished(key, done))
+            self.stats.executed += 1
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved, so it is not logged when every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,322 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+import httpx
+
+from .compression import CompressionSettings, TransferStats
+from .instrumentation import current_call
+from .ratelimit import RateLimiter, endpoint_for
+from .types import RetryPolicy
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given either as delay-seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class _RetryCore:
+    """Retry decisions shared by RetryTransport and AsyncRetryTransport."""
+
+    def __init__(self, policy: RetryPolicy):
+        self._policy = policy
+
+    def _may_retry(self, request: httpx.Request, attempt: int) -> bool:
+        if attempt >= self._policy.max_attempts:
+            return False
+        return request.method in IDEMPOTENT_METHODS or self._policy.retry_mutations
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        # None when Retry-After asks for a longer wait than max_retry_after: the response is returned instead.
+        if self._policy.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self._policy.max_retry_after else None
+        return self._policy.backoff(attempt)
+
+
+class RetryTransport(_RetryCore, httpx.BaseTransport):
+    """Wraps a transport and retries retryable status codes and transport errors according to a RetryPolicy."""
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy, sleep: Callable[[float], None] = time.sleep):
+        super().__init__(policy)
+        self._transport = transport
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 1
+        while True:
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError:
+                if not self._may_retry(request, attempt):
+                    raise
+                self._sleep(self._policy.backoff(attempt))
+            else:
+                if response.status_code not in self._policy.retry_statuses or not self._may_retry(request, attempt):
+                    return response
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    return response
+                response.close()
+                self._sleep(delay)
+            attempt += 1
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncRetryTransport(_RetryCore, httpx.AsyncBaseTransport):
+    """Async counterpart of RetryTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy, sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        super().__init__(policy)
+        self._transport = transport
+        self._sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 1
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                if not self._may_retry(request, attempt):
+                    raise
+                await self._sleep(self._policy.backoff(attempt))
+            else:
+                if response.status_code not in self._policy.retry_statuses or not self._may_retry(request, attempt):
+                    return response
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    return response
+                await response.aclose()
+                await self._sleep(delay)
+            attempt += 1
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Wraps a transport and waits for a RateLimiter slot before sending each request."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter, sleep: Callable[[float], None] = time.sleep):
+        self._transport = transport
+        self._limiter = limiter
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self._limiter.reserve(request.url.path)
+        if delay > 0:
+            self._sleep(delay)
+        return self._transport.handle_request(request)
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of RateLimitTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter, sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        self._transport = transport
+        self._limiter = limiter
+        self._sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self._limiter.reserve(request.url.path)
+        if delay > 0:
+            await self._sleep(delay)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class _MeasuredResponse(httpx.Response):
+    """A response that reports its wire and decoded sizes once its body has been read through."""
+
+    _report_transfer: Callable[[int, int], None]
+
+    @classmethod
+    def wrap(cls, response: httpx.Response, request: httpx.Request, report: Callable[[int, int], None]) -> "_MeasuredResponse":
+        measured = cls(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            extensions=response.extensions,
+            request=request,
+        )
+        measured._report_transfer = report
+        return measured
+
+    def iter_bytes(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        measuring = not hasattr(self, "_content")
+        decoded = 0
+        for chunk in super().iter_bytes(chunk_size):
+            decoded += len(chunk)
+            yield chunk
+        if measuring:
+            self._report_transfer(self.num_bytes_downloaded, decoded)
+
+    async def aiter_bytes(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        measuring = not hasattr(self, "_content")
+        decoded = 0
+        async for chunk in super().aiter_bytes(chunk_size):
+            decoded += len(chunk)
+            yield chunk
+        if measuring:
+            self._report_transfer(self.num_bytes_downloaded, decoded)
+
+
+class _CompressionCore:
+    """Request body compression and transfer accounting shared by CompressionTransport and AsyncCompressionTransport."""
+
+    def __init__(self, settings: CompressionSettings, stats: TransferStats):
+        self._settings = settings
+        self._stats = stats
+        self._compress_rejected = False
+
+    @staticmethod
+    def _endpoint(request: httpx.Request) -> str:
+        return endpoint_for(request.url.path) or request.url.path
+
+    def _body(self, request: httpx.Request) -> bytes:
+        try:
+            return request.content
+        except httpx.RequestNotRead:
+            return b""
+
+    def _prepare(self, request: httpx.Request) -> tuple[httpx.Request, bool]:
+        """Returns the request to send, gzip-compressed when that is enabled and worthwhile, and whether it was."""
+        body = self._body(request)
+        if not body:
+            return request, False
+        compressed = None
+        if not self._compress_rejected and "Content-Encoding" not in request.headers:
+            compressed = self._settings.compress(body)
+        endpoint = self._endpoint(request)
+        if compressed is None:
+            self._stats.record_request(endpoint, len(body), len(body))
+            return request, False
+        self._stats.record_request(endpoint, len(body), len(compressed))
+        headers = request.headers.copy()
+        headers["Content-Encoding"] = "gzip"
+        del headers["Content-Length"]
+        return httpx.Request(request.method, request.url, headers=headers, content=compressed, extensions=request.extensions), True
+
+    def _rejected(self, response: httpx.Response, compressed: bool) -> bool:
+        """
+        A 415 answer to a compressed body means the server does not accept gzip bodies. Compression is then
+         switched off for this transport and the request is sent again uncompressed.
+        """
+        if compressed and response.status_code == 415:
+            self._compress_rejected = True
+            return True
+        return False
+
+    def _measured(self, response: httpx.Response, request: httpx.Request) -> httpx.Response:
+        endpoint = self._endpoint(request)
+        return _MeasuredResponse.wrap(
+            response, request, lambda wire, decoded: self._stats.record_response(endpoint, wire, decoded)
+        )
+
+
+class CompressionTransport(_CompressionCore, httpx.BaseTransport):
+    """Wraps a transport, optionally gzip-compresses request bodies, and records wire vs. decoded bytes per endpoint."""
+
+    def __init__(self, transport: httpx.BaseTransport, settings: CompressionSettings, stats: TransferStats):
+        super().__init__(settings, stats)
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        sent, compressed = self._prepare(request)
+        response = self._transport.handle_request(sent)
+        if self._rejected(response, compressed):
+            response.close()
+            sent, _ = self._prepare(request)
+            response = self._transport.handle_request(sent)
+        return self._measured(response, request)
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncCompressionTransport(_CompressionCore, httpx.AsyncBaseTransport):
+    """Async counterpart of CompressionTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, settings: CompressionSettings, stats: TransferStats):
+        super().__init__(settings, stats)
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        sent, compressed = self._prepare(request)
+        response = await self._transport.handle_async_request(sent)
+        if self._rejected(response, compressed):
+            await response.aclose()
+            sent, _ = self._prepare(request)
+            response = await self._transport.handle_async_request(sent)
+        return self._measured(response, request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """
+    Wraps a transport and records each attempt of a request made during an instrumented module call: status,
+     bytes, retries and, through the httpcore trace extension, connect/TLS/TTFB/download timings.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        call = current_call()
+        if call is None:
+            return self._transport.handle_request(request)
+        exchange = call.exchange(request)
+        exchange.attempt(request)
+        request.extensions.setdefault("trace", exchange.trace)
+        response = self._transport.handle_request(request)
+        exchange.responded(response)
+        return response
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of InstrumentedTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        call = current_call()
+        if call is None:
+            return await self._transport.handle_async_request(request)
+        exchange = call.exchange(request)
+        exchange.attempt(request)
+        request.extensions.setdefault("trace", exchange.atrace)
+        response = await self._transport.handle_async_request(request)
+        exchange.responded(response)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
@@ -4,6 +4,10 @@ from .api_request_response import (
     Claim,
     ApiResponse,
     InsCompany,
+    CompactClaim,
+    CompactDocFile,
+    CompactLogTrail,
 )
-from .client_settings import ClientSettings
+from .bulk import BulkResult
+from .client_settings import ClientSettings, RetryPolicy, TransportSettings
 from .hc_enums import DocType
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from typing import List, Optional, TypedDict, NotRequired
 from .hc_enums import DocType
 
@@ -87,3 +87,25 @@ class Claim:
     vehicleowner: Optional[str] = None
     docfiles: List[DocFile] = field(default_factory=list)
     logtrail: List[LogTrail] = field(default_factory=list)
+
+
+def _slotted(cls: type, name: str, field_types: Optional[dict] = None) -> type:
+    """Builds a slotted copy of a dataclass with the same fields, defaults and field order."""
+    annotations = {}
+    namespace = {"__module__": cls.__module__, "__qualname__": name, "__annotations__": annotations}
+    for f in fields(cls):
+        annotations[f.name] = (field_types or {}).get(f.name, f.type)
+        if f.default is not MISSING:
+            namespace[f.name] = f.default
+        elif f.default_factory is not MISSING:
+            namespace[f.name] = field(default_factory=f.default_factory)
+    namespace["__doc__"] = f"Memory-compact variant of {cls.__name__} using __slots__ instead of a per-instance __dict__."
+    return dataclass(slots=True)(type(name, (), namespace))
+
+CompactDocFile = _slotted(DocFile, "CompactDocFile")
+CompactLogTrail = _slotted(LogTrail, "CompactLogTrail")
+CompactClaim = _slotted(
+    Claim,
+    "CompactClaim",
+    {"docfiles": List[CompactDocFile], "logtrail": List[CompactLogTrail]},
+)
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+@dataclass
+class BulkResult(Generic[T]):
+    index: int
+    item: Any
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -1,7 +1,90 @@
-from dataclasses import dataclass
+import httpx
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Union
+from ..cache import ResponseCache
+from ..compression import CompressionSettings, TransferStats
+from ..diskcache import DiskCache
+from ..instrumentation import RequestEvent
+from ..outbox import Outbox
+from ..ratelimit import RateLimiter
+from ..serialization import JsonCodec
+from ..singleflight import AsyncSingleFlight, SingleFlight
+
+@dataclass
+class TransportSettings:
+    """
+    Connection pool, protocol and timeout configuration for the underlying httpx client.
+     Timeouts are in seconds; None disables that timeout. When a custom transport is given,
+     the pool and HTTP/2 options are ignored because the transport owns its own connections.
+    """
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+    connect_timeout: Optional[float] = 60.0
+    read_timeout: Optional[float] = 60.0
+    write_timeout: Optional[float] = 60.0
+    pool_timeout: Optional[float] = 60.0
+    transport: Optional[httpx.BaseTransport] = None
+    async_transport: Optional[httpx.AsyncBaseTransport] = None
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def build_transport(self) -> httpx.BaseTransport:
+        return self.transport or httpx.HTTPTransport(limits=self.limits(), http2=self.http2)
+
+    def build_async_transport(self) -> httpx.AsyncBaseTransport:
+        return self.async_transport or httpx.AsyncHTTPTransport(limits=self.limits(), http2=self.http2)
+
+@dataclass
+class RetryPolicy:
+    """
+    Controls automatic retries of failed requests. The delay before retry n is
+     min(max_backoff, backoff_factor * 2 ** (n - 1)), scaled by a random factor in [0, 1) when jitter
+     is on, unless the response carries a Retry-After header. A Retry-After longer than max_retry_after
+     seconds is not waited out: the 429/503 response is returned to the caller instead. POST requests (create_claim, update_claim,
+     upload_file, create_log_trail) are only retried when retry_mutations is True.
+    """
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+    retry_mutations: bool = False
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return delay * random.random() if self.jitter else delay
 
 @dataclass
 class ClientSettings:
     auth_token: str
     dev_env: bool
     base_url: str
+    compact_records: bool = False
+    json_codec: JsonCodec = field(default_factory=JsonCodec)
+    transport: TransportSettings = field(default_factory=TransportSettings)
+    retry: Optional[RetryPolicy] = None
+    rate_limiter: Optional[RateLimiter] = None
+    cache: Optional[Union[ResponseCache, DiskCache]] = None
+    outbox: Optional[Outbox] = None
+    single_flight: Optional[Union[SingleFlight, AsyncSingleFlight]] = None
+    compression: Optional[CompressionSettings] = None
+    transfer_stats: Optional[TransferStats] = None
+    hooks: tuple[Callable[[RequestEvent], None], ...] = ()
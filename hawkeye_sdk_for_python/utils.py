@@ -1,72 +1,219 @@
-from .types import Claim, DocFile, DocType, LogTrail
-
-def type_claim(file: dict) -> Claim:
-    claim = Claim()
-    claim.filenumber = file.get("filenumber")
-    claim.customername = file.get("customername")
-    claim.clientclaimno = file.get("clientclaimno")
-    claim.rentername = file.get("rentername")
-    claim.ranumber = file.get("ranumber")
-    claim.insuredname = file.get("insuredname")
-    claim.insurancecompany = file.get("insurancecompany")
-    claim.claimnumber = file.get("claimnumber")
-    claim.policynumber = file.get("policynumber")
-    claim.dateofloss = file.get("dateofloss")
-    claim.adjuster = file.get("adjuster")
-    claim.adjusterphone = file.get("adjusterphone")
-    claim.firstparty = file.get("firstparty")
-    claim.thirdparty = file.get("thirdparty")
-    claim.cdw = file.get("cdw")
-    claim.hc_adj = file.get("hc_adj")
-    claim.officephone = file.get("officephone")
-    claim.email = file.get("email")
-    claim.vin = file.get("vin")
-    claim.vehyear = file.get("vehyear")
-    claim.vehmake = file.get("vehmake")
-    claim.vehmodel = file.get("vehmodel")
-    claim.vehedition = file.get("vehedition")
-    claim.color = file.get("color")
-    claim.platenumber = file.get("platenumber")
-    claim.unitnumber = file.get("unitnumber")
-    claim.inspectiondate = file.get("inspectiondate")
-    claim.estimateamount = file.get("estimateamount")
-    claim.totalloss = file.get("totalloss")
-    claim.continuedrentalamt = file.get("continuedrentalamt")
-    claim.dv_amt = file.get("dv_amt")
-    claim.liabilityaccepted = file.get("liabilityaccepted")
-    claim.liabilitydenied = file.get("liabilitydenied")
-    claim.settlement_pd = file.get("settlement_pd")
-    claim.settlement_salvage = file.get("settlement_salvage")
-    claim.settlement_cr = file.get("settlement_cr")
-    claim.settlement_dv = file.get("settlement_dv")
-    claim.settlement_other = file.get("settlement_other")
-    claim.settlement_deductable = file.get("settlement_deductable")
-    claim.administrativefee = file.get("administrativefee")
-    claim.appraisalfee = file.get("appraisalfee")
-    claim.datefileclosed = file.get("datefileclosed")
-    claim.settlementoffer = file.get("settlementoffer")
-    claim.supplement = file.get("supplement")
-    claim.settlementtowing = file.get("settlementtowing")
-    claim.settlementstorage = file.get("settlementstorage")
-    claim.demand_admin_fee = file.get("demand_admin_fee")
-    claim.demand_appraisal_fee = file.get("demand_appraisal_fee")
-    claim.estimatedate = file.get("estimatedate")
-    claim.demanddate = file.get("demanddate")
-    claim.policystartdate = file.get("policystartdate")
-    claim.policyenddate = file.get("policyenddate")
-    claim.vehicleowner = file.get("vehicleowner")
-    for doc in file.get("docfiles", []):
-        doc_file = DocFile()
-        doc_file.doctype = DocType(doc.get("doctype"))
-        doc_file.dateadded = doc.get("dateadded")
-        doc_file.user = doc.get("user")
-        doc_file.notes = doc.get("notes")
-        doc_file.filename = doc.get("filename")
-        claim.docfiles.append(doc_file)
-    for logtrail in file.get("logtrail", []):
-        log_entry = LogTrail()
-        log_entry.date = logtrail.get("date")
-        log_entry.activity = logtrail.get("activity")
-        log_entry.user = logtrail.get("user")
-        claim.logtrail.append(log_entry)
-    return claim
+import asyncio
+import json
+from dataclasses import fields
+from functools import cache
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional
+from .types import BulkResult, Claim, DocFile, DocType, LogTrail, CompactClaim, CompactDocFile, CompactLogTrail
+
+_DOCTYPES: dict[Optional[str], DocType] = {doctype.value: doctype for doctype in DocType}
+
+def type_doctype(value: Optional[str]) -> DocType:
+    """Looks up a DocType by its API value, falling back to DocType.DEFAULT for unknown or missing values."""
+    return _DOCTYPES.get(value, DocType.DEFAULT)
+
+@cache
+def _claim_decoder(claim_cls: type, doc_cls: type, log_cls: type) -> Callable[[dict], Claim]:
+    """
+    Generates a decoder that builds a claim and its children with one positional constructor call each,
+     instead of assigning every attribute separately. The source is derived from the dataclass fields,
+     so new fields on Claim, DocFile or LogTrail are picked up automatically.
+    """
+    def args(cls: type, get: str, overrides: dict) -> str:
+        return ", ".join(overrides.get(f.name, f"{get}({f.name!r})") for f in fields(cls))
+
+    docfile = args(doc_cls, "doc.get", {"doctype": "type_doctype(doc.get('doctype'))"})
+    logtrail = args(log_cls, "log.get", {})
+    claim = args(claim_cls, "get", {
+        "docfiles": f"[doc_cls({docfile}) for doc in get('docfiles') or ()]",
+        "logtrail": f"[log_cls({logtrail}) for log in get('logtrail') or ()]",
+    })
+    source = (
+        "def decode(file):\n"
+        "    get = file.get\n"
+        f"    return claim_cls({claim})\n"
+    )
+    namespace = {"claim_cls": claim_cls, "doc_cls": doc_cls, "log_cls": log_cls, "type_doctype": type_doctype}
+    exec(source, namespace)
+    return namespace["decode"]
+
+def type_claim(file: dict, compact: bool = False) -> Claim:
+    """
+    Builds a Claim (or CompactClaim when compact is True) from a claim object returned by the API.
+     Missing fields are set to None and unknown document types fall back to DocType.DEFAULT.
+    """
+    if compact:
+        return _claim_decoder(CompactClaim, CompactDocFile, CompactLogTrail)(file)
+    return _claim_decoder(Claim, DocFile, LogTrail)(file)
+
+
+class JsonArrayParser:
+    """
+    Incrementally decodes the elements of a top-level JSON array from text chunks.
+     Only the current partial element is buffered, so memory does not grow with the array length.
+    """
+
+    _WHITESPACE = " \t\n\r"
+    # Characters that end a number or literal; a scalar is only decoded once one of them (or EOF) is seen.
+    _SCALAR_END = " \t\n\r,]"
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        # The next token allowed: "[" to open the array, "first" (an element or "]"), "element",
+        # "separator" ("," or "]"), or "done" once the array is closed.
+        self._expect = "["
+
+    def feed(self, chunk: str) -> list[Any]:
+        """Adds a chunk of text and returns every element that is now complete."""
+        self._buffer += chunk
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """Signals the end of the input and returns any trailing element."""
+        elements = self._drain(final=True)
+        if self._expect != "done":
+            raise ValueError("Incomplete JSON array in response body.")
+        return elements
+
+    def _skip(self, pos: int) -> int:
+        while pos < len(self._buffer) and self._buffer[pos] in self._WHITESPACE:
+            pos += 1
+        return pos
+
+    def _scalar_end(self, pos: int) -> int:
+        while pos < len(self._buffer) and self._buffer[pos] not in self._SCALAR_END:
+            pos += 1
+        return pos
+
+    def _drain(self, final: bool) -> list[Any]:
+        elements = []
+        buffer = self._buffer
+        pos = self._skip(0)
+        while pos < len(buffer) and self._expect != "done":
+            char = buffer[pos]
+            if self._expect == "[":
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array, found {char!r}.")
+                self._expect = "first"
+                pos = self._skip(pos + 1)
+                continue
+            if self._expect == "separator":
+                if char not in ",]":
+                    raise ValueError(f"Expected ',' or ']' between array elements, found {char!r}.")
+                self._expect = "element" if char == "," else "done"
+                pos = self._skip(pos + 1)
+                continue
+            if char == "]" and self._expect == "first":
+                self._expect = "done"
+                pos += 1
+                break
+            if char in "[{\"":
+                try:
+                    element, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+            else:
+                # A number or literal that runs to the end of the buffer may continue in the next chunk.
+                token_end = self._scalar_end(pos)
+                if token_end == len(buffer) and not final:
+                    break
+                element, end = self._decoder.raw_decode(buffer[:token_end], pos)
+                if end != token_end:
+                    raise ValueError(f"Invalid JSON value {buffer[pos:token_end]!r} in array.")
+            elements.append(element)
+            self._expect = "separator"
+            pos = self._skip(end)
+        self._buffer = buffer[pos:]
+        return elements
+
+def iter_json_array(chunks: Iterable[str]) -> Iterator[Any]:
+    """Yields the elements of a JSON array streamed as text chunks, one at a time."""
+    parser = JsonArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def _run_one(func: Callable[[Any], Any], index: int, item: Any) -> BulkResult:
+    try:
+        return BulkResult(index=index, item=item, value=func(item))
+    except Exception as exc:
+        return BulkResult(index=index, item=item, error=exc)
+
+def run_bounded(
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_concurrency: int,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+        ) -> list[BulkResult]:
+    """
+    Calls func on every item using at most max_concurrency worker threads.
+     Items are pulled from the iterable lazily, so only a bounded number are in flight at once.
+     An exception raised for one item is captured on its result instead of aborting the run.
+    Args:
+        func (Callable): The function to call with each item.
+        items (Iterable): The items to process.
+        max_concurrency (int): The maximum number of concurrent calls.
+        on_result (Callable, optional): Called with each BulkResult as soon as it finishes.
+    Returns:
+        list[BulkResult]: One result per item, in input order.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+
+    results: list[BulkResult] = []
+    source = enumerate(items)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        pending = {pool.submit(_run_one, func, index, item) for index, item in islice(source, max_concurrency)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+            for index, item in islice(source, len(done)):
+                pending.add(pool.submit(_run_one, func, index, item))
+
+    results.sort(key=lambda result: result.index)
+    return results
+
+async def gather_bounded(
+        func: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        max_concurrency: int,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+        ) -> list[BulkResult]:
+    """
+    Async counterpart of run_bounded: max_concurrency worker tasks on the running event loop each await func
+     on the next item until the iterable is exhausted, so items and coroutines are only created as they start.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+
+    results: list[BulkResult] = []
+    source = enumerate(items)
+
+    async def worker():
+        for index, item in source:
+            try:
+                result = BulkResult(index=index, item=item, value=await func(item))
+            except Exception as exc:
+                result = BulkResult(index=index, item=item, error=exc)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+
+    results.sort(key=lambda result: result.index)
+    return results
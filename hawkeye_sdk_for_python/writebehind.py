@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+ErrorCallback = Callable[[Any, Exception], None]
+
+_STOP = object()
+
+
+def _report_failure(on_error: Optional[ErrorCallback], item: Any, exc: Exception):
+    if on_error is None:
+        logger.warning("Write-behind request failed for %r: %s", item, exc)
+        return
+    try:
+        on_error(item, exc)
+    except Exception:
+        logger.exception("Write-behind on_error callback raised")
+
+
+class WriteBehindQueue:
+    """
+    A bounded queue drained by background threads that call send on each item.
+     put returns as soon as the item is queued and blocks only while the queue is full (back-pressure).
+     Failures never reach the caller of put; they are passed to on_error, or logged when it is None.
+    """
+
+    def __init__(
+            self,
+            send: Callable[[Any], Any],
+            max_queue_size: int = 1000,
+            max_concurrency: int = 4,
+            on_error: Optional[ErrorCallback] = None,
+            ):
+        """
+        Args:
+            send (Callable): Called with each queued item on a worker thread.
+            max_queue_size (int): Items held before put blocks. Defaults to 1000.
+            max_concurrency (int): Number of worker threads, i.e. requests in flight at once. Defaults to 4.
+            on_error (Callable, optional): Called with (item, exception) for every item send fails on.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._send = send
+        self._on_error = on_error
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._closed = False
+        self._counts_lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+        self._workers = [
+            threading.Thread(target=self._work, name=f"hawkeye-write-behind-{n}", daemon=True)
+            for n in range(max_concurrency)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def pending(self) -> int:
+        """Items queued or being sent."""
+        return self._queue.unfinished_tasks
+
+    def put(self, item: Any, timeout: Optional[float] = None):
+        """
+        Queues an item for sending.
+        Raises:
+            queue.Full: If the queue is still full after timeout seconds.
+            RuntimeError: If the queue has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("Write-behind queue is closed.")
+        self._queue.put(item, timeout=timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every queued item has been sent or has failed. Returns False if timeout ran out first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stops accepting items, drains the queue and stops the workers. Returns False if draining timed out;
+         the workers then keep sending the remaining items in the background and stop once the queue is empty.
+        """
+        self._closed = True
+        drained = self.flush(timeout)
+        if drained:
+            self._stop_workers()
+        else:
+            threading.Thread(target=self._stop_workers, name="hawkeye-write-behind-stop", daemon=True).start()
+        return drained
+
+    def _stop_workers(self):
+        # Queued after every pending item, so each worker finishes its share of the queue first.
+        for _ in self._workers:
+            self._queue.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                try:
+                    self._send(item)
+                except Exception as exc:
+                    with self._counts_lock:
+                        self.failed += 1
+                    _report_failure(self._on_error, item, exc)
+                else:
+                    with self._counts_lock:
+                        self.sent += 1
+            finally:
+                self._queue.task_done()
+
+
+class AsyncWriteBehindQueue:
+    """Async counterpart of WriteBehindQueue, drained by worker tasks on the running event loop."""
+
+    def __init__(
+            self,
+            send: Callable[[Any], Awaitable[Any]],
+            max_queue_size: int = 1000,
+            max_concurrency: int = 4,
+            on_error: Optional[ErrorCallback] = None,
+            ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._send = send
+        self._on_error = on_error
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._closed = False
+        self.sent = 0
+        self.failed = 0
+        self._sending = 0
+        self._workers = [asyncio.create_task(self._work()) for _ in range(max_concurrency)]
+        self._stopping: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Items queued or being sent."""
+        return self._queue.qsize() + self._sending
+
+    async def put(self, item: Any):
+        """Queues an item for sending, waiting while the queue is full."""
+        if self._closed:
+            raise RuntimeError("Write-behind queue is closed.")
+        await self._queue.put(item)
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every queued item has been sent or has failed. Returns False if timeout ran out first."""
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stops accepting items, drains the queue and stops the workers. Returns False if draining timed out;
+         the workers then keep sending the remaining items while the event loop runs and stop once the queue is empty.
+        """
+        self._closed = True
+        drained = await self.flush(timeout)
+        if drained:
+            await self._stop_workers()
+        else:
+            self._stopping = asyncio.create_task(self._stop_workers())
+        return drained
+
+    async def _stop_workers(self):
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+    async def _work(self):
+        while True:
+            item = await self._queue.get()
+            self._sending += 1
+            try:
+                await self._send(item)
+                self.sent += 1
+            except Exception as exc:
+                self.failed += 1
+                _report_failure(self._on_error, item, exc)
+            finally:
+                self._sending -= 1
+                self._queue.task_done()
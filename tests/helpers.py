@@ -0,0 +1,234 @@
+"""Fixtures and fakes shared by the test modules."""
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, TransportSettings
+
+# A copy of the anonymised claims in test_claims.test_get_claims_success, as returned by /getclaims/all,
+# including the API's quirks: flags such as liabilityaccepted carry dates, and empty text fields come back as "".
+SAMPLE_CLAIMS = [
+    {
+        "filenumber": 24111756,
+        "customername": "Test Company - City, ST",
+        "clientclaimno": "12345678 (Cross Claim 98765432)",
+        "rentername": "John Doe",
+        "ranumber": "123456789",
+        "insuredname": "John Doe",
+        "insurancecompany": "Test Insurance Co.",
+        "claimnumber": "1234567890123456789",
+        "policynumber": "POL123456",
+        "dateofloss": "2024-12-22",
+        "adjuster": "Test Adjuster",
+        "adjusterphone": "1-800-000-0000",
+        "firstparty": True,
+        "thirdparty": None,
+        "cdw": None,
+        "hc_adj": "Test Martinez",
+        "officephone": "(555) 123-4567",
+        "email": "test@example.com",
+        "vin": "1ABCD23E45FG67890",
+        "vehyear": 2022,
+        "vehmake": "Test",
+        "vehmodel": "Model 3500",
+        "vehedition": "15 ft. box",
+        "color": "White",
+        "platenumber": "ST-ABC123",
+        "unitnumber": "12345678",
+        "inspectiondate": "2024-12-23",
+        "estimateamount": 2933.95,
+        "totalloss": None,
+        "continuedrentalamt": 439.96,
+        "dv_amt": 6812.89,
+        "liabilityaccepted": "2025-02-19",
+        "liabilitydenied": None,
+        "settlement_pd": 2092.75,
+        "settlement_salvage": None,
+        "settlement_cr": 0,
+        "settlement_dv": 0,
+        "settlement_other": None,
+        "settlement_deductable": 0,
+        "administrativefee": 0,
+        "appraisalfee": 0,
+        "datefileclosed": None,
+        "settlementoffer": None,
+        "supplement": None,
+        "settlementtowing": None,
+        "settlementstorage": None,
+        "demand_admin_fee": 300,
+        "demand_appraisal_fee": 65,
+        "estimatedate": None,
+        "demanddate": None,
+        "policystartdate": None,
+        "policyenddate": None,
+        "vehicleowner": None,
+        "docfiles": [
+            {
+                "doctype": "Images",
+                "dateadded": "2024-12-23T18:40:16.435945",
+                "user": "Test User",
+                "notes": "photos",
+                "filename": "https://example.cdn.space.com/14915/Images_24111756_15428.JPG"
+            },
+            {
+                "doctype": "Rental Agreement",
+                "dateadded": "2024-12-23T18:42:15.541078",
+                "user": "Test User",
+                "notes": None,
+                "filename": "https://example.cdn.space.com/14915/Rental_Agreement_24111756_35461.pdf"
+            },
+            {
+                "doctype": "Insurance Card",
+                "dateadded": "2024-12-23T18:42:41.635703",
+                "user": "Test User",
+                "notes": "Test note",
+                "filename": "https://example.cdn.space.com/14915/Insurance_Card_24111756_61565.pdf"
+            }
+        ],
+        "logtrail": [
+            {
+                "date": "04/07/2025",
+                "activity": "Contacted insurance company for status update",
+                "user": "Test User"
+            },
+            {
+                "date": "03/20/2025",
+                "activity": "Received correspondence from insurance requesting estimate",
+                "user": "Test User"
+            },
+            {
+                "date": "03/18/2025",
+                "activity": "Called client regarding vehicle repair status",
+                "user": "Test User"
+            }
+        ]
+    },
+    {
+        "filenumber": 25111512,
+        "customername": "Test Company 2 - Another City, ST",
+        "clientclaimno": "87654321",
+        "rentername": "Jane Smith",
+        "ranumber": "987654321",
+        "insuredname": "Jane Smith / Test Business LLC",
+        "insurancecompany": "Another Insurance Company",
+        "claimnumber": "Unknown",
+        "policynumber": "POL987654",
+        "dateofloss": "2025-07-25",
+        "adjuster": "Test Adjuster 2",
+        "adjusterphone": "501-000-0000",
+        "firstparty": True,
+        "thirdparty": None,
+        "cdw": None,
+        "hc_adj": "Test Admin",
+        "officephone": "(555) 987-6543",
+        "email": "admin@example.com",
+        "vin": "9ZYXW87V65U43210",
+        "vehyear": 2025,
+        "vehmake": "Test Make",
+        "vehmodel": "Transport Van",
+        "vehedition": "",
+        "color": "White",
+        "platenumber": "ABC8139",
+        "unitnumber": "87654321",
+        "inspectiondate": "2025-07-30",
+        "estimateamount": 6551.79,
+        "totalloss": None,
+        "continuedrentalamt": None,
+        "dv_amt": None,
+        "liabilityaccepted": None,
+        "liabilitydenied": None,
+        "settlement_pd": None,
+        "settlement_salvage": None,
+        "settlement_cr": None,
+        "settlement_dv": None,
+        "settlement_other": None,
+        "settlement_deductable": None,
+        "administrativefee": None,
+        "appraisalfee": None,
+        "datefileclosed": None,
+        "settlementoffer": None,
+        "supplement": None,
+        "settlementtowing": None,
+        "settlementstorage": None,
+        "demand_admin_fee": 300,
+        "demand_appraisal_fee": None,
+        "estimatedate": "2025-07-31",
+        "demanddate": None,
+        "policystartdate": None,
+        "policyenddate": None,
+        "vehicleowner": None,
+        "docfiles": [
+            {
+                "doctype": "Images",
+                "dateadded": "2025-07-30T16:35:18.361016",
+                "user": "Test User 2",
+                "notes": None,
+                "filename": "https://example.cdn.space.com/16603/Images_25111512_16856.JPG"
+            },
+            {
+                "doctype": "Rental Agreement",
+                "dateadded": "2025-07-30T16:35:59.793683",
+                "user": "Test User 2",
+                "notes": None,
+                "filename": "https://example.cdn.space.com/16603/Rental_Agreement_25111512_59410.jpeg"
+            }
+        ],
+        "logtrail": [
+            {
+                "date": "08/12/2025",
+                "activity": "Emailed insurance adjuster for status update",
+                "user": "Test Admin"
+            },
+            {
+                "date": "08/06/2025",
+                "activity": "Spoke with client regarding appraisal authorization",
+                "user": "Test Admin"
+            },
+            {
+                "date": "07/30/2025",
+                "activity": "Reviewed incident report and images",
+                "user": "Test Admin"
+            }
+        ]
+    }
+]
+
+
+class FakeClock:
+    """A clock that only moves when a test sets or advances `now`."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeApi:
+    """In-memory stand-in for the Hawkeye API that records each request and counts requests per path."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append((request.method, request.url.path, dict(request.url.params)))
+        path = request.url.path
+        if path.startswith("/api/getclaims/"):
+            return httpx.Response(200, json=[{"filenumber": int(path.rsplit("/", 1)[1]), "rentername": "Renter"}])
+        if path == "/api/inscompanies":
+            return httpx.Response(200, json={"suggestions": [{"id": 1, "name": "GEICO", "probability": 90}]})
+        return httpx.Response(200, json={"filenumber": "1", "message": "ok", "error": 0, "success": True})
+
+    def paths(self):
+        return [path for _, path, _ in self.requests]
+
+    def count(self, path):
+        return self.paths().count(path)
+
+
+def client_for(api, **options):
+    """A HawkeyeClient whose requests are answered by `api`, with any further client options."""
+    return HawkeyeClient(
+        "test-auth-token",
+        transport_settings=TransportSettings(transport=httpx.MockTransport(api)),
+        **options,
+    )
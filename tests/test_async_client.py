@@ -0,0 +1,206 @@
+import unittest
+from unittest.mock import patch, Mock, AsyncMock
+import asyncio
+import json
+
+import httpx
+
+from hawkeye_sdk_for_python import AsyncHawkeyeClient, Claim, InsCompany, APIError, APIResourceNotFoundError
+from hawkeye_sdk_for_python.types import DocType
+
+
+class TestAsyncHawkeyeClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """Set up test client for each test case."""
+        self.client = AsyncHawkeyeClient("test-auth-token")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_get_claims_success(self, mock_get):
+        """Test retrieving claims through the async client."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.is_error = False
+        mock_response.json.return_value = [
+            {"filenumber": 1, "rentername": "John Doe", "docfiles": [{"doctype": "Images"}], "logtrail": []},
+            {"filenumber": 2, "rentername": "Jane Doe"},
+        ]
+        mock_get.return_value = mock_response
+
+        claims = await self.client.claims.get_claims(include_inactive=True)
+
+        mock_get.assert_called_once_with(url="/getclaims/all/true")
+        self.assertEqual(len(claims), 2)
+        self.assertIsInstance(claims[0], Claim)
+        self.assertEqual(claims[0].docfiles[0].doctype, DocType.IMAGES)
+        self.assertEqual(claims[1].rentername, "Jane Doe")
+
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_get_single_claim_concurrently(self, mock_get):
+        """Test that many single-claim lookups can be awaited together."""
+        def respond(url):
+            filenumber = int(url.rsplit("/", 1)[1])
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.is_error = False
+            mock_response.json.return_value = [{"filenumber": filenumber}]
+            return mock_response
+        mock_get.side_effect = respond
+
+        claims = await asyncio.gather(*(self.client.claims.get_single_claim(n) for n in range(100)))
+
+        self.assertEqual(mock_get.await_count, 100)
+        self.assertEqual([claim.filenumber for claim in claims], list(range(100)))
+
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_get_many_claims(self, mock_get):
+        """Test bulk fetch on the async client reports missing claims per item."""
+        def respond(url):
+            filenumber = int(url.rsplit("/", 1)[1])
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.is_error = False
+            mock_response.json.return_value = [] if filenumber % 2 else [{"filenumber": filenumber}]
+            return mock_response
+        mock_get.side_effect = respond
+
+        results = await self.client.claims.get_many_claims(range(6), max_concurrency=2)
+
+        self.assertEqual([result.ok for result in results], [True, False] * 3)
+        self.assertEqual(results[4].value.filenumber, 4)
+        self.assertIsInstance(results[1].error, ValueError)
+
+    async def test_iter_claims_streams(self):
+        """Test that iter_claims yields claims from a chunked body on the async client."""
+        body = json.dumps([{"filenumber": n} for n in range(20)]).encode()
+
+        async def chunks():
+            for i in range(0, len(body), 5):
+                yield body[i:i + 5]
+
+        self.client.claims._client = httpx.AsyncClient(
+            base_url=self.client.settings.base_url,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=chunks())),
+        )
+
+        filenumbers = [claim.filenumber async for claim in self.client.claims.iter_claims()]
+
+        self.assertEqual(filenumbers, list(range(20)))
+
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_get_single_claim_empty(self, mock_get):
+        """Test that an empty body raises ValueError like the sync client."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.is_error = False
+        mock_response.json.return_value = []
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(ValueError):
+            await self.client.claims.get_single_claim(12345)
+
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_get_single_claim_not_found(self, mock_get):
+        """Test that a 404 raises APIResourceNotFoundError."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.is_error = True
+        mock_response.json.return_value = {"message": "Claim not found"}
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(APIResourceNotFoundError):
+            await self.client.claims.get_single_claim(999999)
+
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_update_claim_drops_none_values(self, mock_post):
+        """Test that update_claim only sends provided fields."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.is_error = False
+        mock_response.json.return_value = {"filenumber": "12345", "message": "ok", "error": 0, "success": True}
+        mock_post.return_value = mock_response
+
+        response = await self.client.claims.update_claim(filenumber=12345, note="Updated")
+
+        mock_post.assert_called_once_with(url="/updateclaim", json={"filenumber": 12345, "note": "Updated"})
+        self.assertTrue(response["success"])
+
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_upload_file(self, mock_post):
+        """Test uploading a document through the async client."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.is_error = False
+        mock_post.return_value = mock_response
+
+        result = await self.client.docfiles.upload_file(12345, "https://example.com/a.pdf", DocType.INVOICE)
+
+        mock_post.assert_called_once_with(
+            url="/savefile",
+            json={
+                "filenumber": 12345,
+                "link": "https://example.com/a.pdf",
+                "category": "Invoice",
+                "visibleToClient": False,
+                "notes": ""
+            }
+        )
+        self.assertIsNone(result)
+
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_create_log_trail_error(self, mock_post):
+        """Test that a server error raises APIError."""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.is_error = True
+        mock_response.json.return_value = {"message": "Internal error"}
+        mock_post.return_value = mock_response
+
+        with self.assertRaises(APIError) as context:
+            await self.client.logtrails.create_log_trail(12345, "Activity", "01/15/2024")
+
+        self.assertEqual(context.exception.status_code, 500)
+
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_create_log_trail_success(self, mock_post):
+        """Test creating a log trail entry through the async client."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.is_error = False
+        mock_response.text = json.dumps({"message": "Log entry created successfully", "success": True, "error": 0})
+        mock_post.return_value = mock_response
+
+        result = await self.client.logtrails.create_log_trail(12345, "Activity", "01/15/2024")
+
+        mock_post.assert_called_once_with(
+            url="/createLogTrailEntry",
+            json={"filenumber": 12345, "activity": "Activity", "date": "01/15/2024"}
+        )
+        self.assertTrue(result["success"])
+
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_get_insurance_companies_with_query(self, mock_get):
+        """Test searching insurance companies through the async client."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.is_error = False
+        mock_response.json.return_value = {"suggestions": [{"id": 1, "name": "State Farm", "probability": 95}]}
+        mock_get.return_value = mock_response
+
+        companies = await self.client.inscompanies.get_insurance_companies(query="farm", limit=50)
+
+        mock_get.assert_called_once_with("/inscompanies", params={"q": "farm", "limit": 20})
+        self.assertIsInstance(companies[0], InsCompany)
+        self.assertEqual(companies[0].probability, 95)
+
+    async def test_async_context_manager(self):
+        """Test that the async client closes its connection pool on exit."""
+        async with AsyncHawkeyeClient("test-token", debug_mode=True) as client:
+            self.assertIn("qa", client.settings.base_url.lower())
+        self.assertTrue(client._http_client.is_closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
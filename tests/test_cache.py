@@ -0,0 +1,278 @@
+import unittest
+import asyncio
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, AsyncHawkeyeClient, ResponseCache, TransportSettings, DocType
+from hawkeye_sdk_for_python.cache import Validators
+
+from helpers import FakeApi, FakeClock
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_hit_and_miss_statistics(self):
+        """Test that lookups are counted as hits or misses."""
+        cache = ResponseCache(clock=self.clock)
+        cache.set("a", 1)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+        self.assertEqual(cache.stats.hit_rate, 0.5)
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after their TTL."""
+        cache = ResponseCache(ttl=10, clock=self.clock)
+        cache.set("a", 1)
+
+        self.clock.now = 9.9
+        self.assertEqual(cache.get("a"), 1)
+        self.clock.now = 10.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats.expirations, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache(maxsize=2, ttl=None, clock=self.clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats.evictions, 1)
+
+
+class TestClientCaching(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApi()
+        self.cache = ResponseCache(maxsize=100, ttl=60)
+        self.client = HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(self.api)),
+            cache=self.cache,
+        )
+
+    def test_single_claim_is_cached(self):
+        """Test that repeated lookups of the same claim hit the cache."""
+        first = self.client.claims.get_single_claim(12345)
+        second = self.client.claims.get_single_claim("12345")
+
+        self.assertIs(first, second)
+        self.assertEqual(self.api.count("/api/getclaims/12345"), 1)
+        self.assertEqual(self.cache.stats.hits, 1)
+
+    def test_writes_invalidate_claim(self):
+        """Test that update_claim, upload_file and create_log_trail drop the cached claim."""
+        writes = [
+            lambda: self.client.claims.update_claim(filenumber=12345, note="x"),
+            lambda: self.client.docfiles.upload_file(12345, "https://example.com/a.pdf", DocType.INVOICE),
+            lambda: self.client.logtrails.create_log_trail(12345, "Touched", "01/01/2025"),
+        ]
+
+        for write in writes:
+            self.client.claims.get_single_claim(12345)
+            write()
+        self.client.claims.get_single_claim(12345)
+
+        self.assertEqual(self.api.count("/api/getclaims/12345"), 4)
+        self.assertEqual(self.cache.stats.invalidations, 3)
+
+    def test_write_to_other_claim_keeps_entry(self):
+        """Test that writes only invalidate their own filenumber."""
+        self.client.claims.get_single_claim(1)
+        self.client.claims.update_claim(filenumber=2, note="x")
+        self.client.claims.get_single_claim(1)
+
+        self.assertEqual(self.api.count("/api/getclaims/1"), 1)
+
+    def test_failed_write_still_invalidates(self):
+        """Test that a write that errors out still drops the cached claim."""
+        self.client.claims.get_single_claim(7)
+        failing = HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(lambda request: httpx.Response(500, json={}))),
+            cache=self.cache,
+        )
+
+        with self.assertRaises(Exception):
+            failing.claims.update_claim(filenumber=7, note="x")
+
+        self.assertIsNone(self.cache.get(("claim", "7")))
+
+    def test_insurance_companies_cached_by_query_and_limit(self):
+        """Test that company lookups are keyed by query and effective limit."""
+        self.client.inscompanies.get_insurance_companies(query="geico", limit=5)
+        companies = self.client.inscompanies.get_insurance_companies(query="geico", limit=5)
+        self.client.inscompanies.get_insurance_companies(query="geico", limit=25)
+        self.client.inscompanies.get_insurance_companies(query="geico", limit=20)
+        self.client.inscompanies.get_insurance_companies(query="progressive", limit=5)
+
+        self.assertEqual(companies[0].name, "GEICO")
+        self.assertEqual(self.api.count("/api/inscompanies"), 3)
+
+    def test_caller_cannot_mutate_cached_company_list(self):
+        """Test that each call gets its own list."""
+        self.client.inscompanies.get_insurance_companies(query="geico").clear()
+
+        self.assertEqual(len(self.client.inscompanies.get_insurance_companies(query="geico")), 1)
+
+    def test_no_cache_by_default(self):
+        """Test that clients without a cache always hit the API."""
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(self.api)))
+        client.claims.get_single_claim(1)
+        client.claims.get_single_claim(1)
+
+        self.assertEqual(self.api.count("/api/getclaims/1"), 2)
+
+    def test_async_client_shares_cache(self):
+        """Test that the async client reads and invalidates the same cache."""
+        self.client.claims.get_single_claim(5)
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(self.api)),
+                cache=self.cache,
+            ) as client:
+                await client.claims.get_single_claim(5)
+                await client.logtrails.create_log_trail(5, "Touched", "01/01/2025")
+                await client.claims.get_single_claim(5)
+
+        asyncio.run(run())
+
+        self.assertEqual(self.api.count("/api/getclaims/5"), 2)
+
+
+class ValidatingApi:
+    """Stand-in for an API that sends validators and answers matching conditional requests with 304."""
+
+    def __init__(self):
+        self.version = 1
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append((request.url.path, request.headers.get("If-None-Match"), request.headers.get("If-Modified-Since")))
+        etag = f'"v{self.version}"'
+        headers = {"ETag": etag, "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=headers)
+        path = request.url.path
+        if path.startswith("/api/getclaims/all/"):
+            body = [{"filenumber": n, "rentername": f"v{self.version}"} for n in (1, 2)]
+        elif path.startswith("/api/getclaims/"):
+            body = [{"filenumber": int(path.rsplit("/", 1)[1]), "rentername": f"v{self.version}"}]
+        else:
+            body = {"suggestions": [{"id": 1, "name": f"GEICO v{self.version}", "probability": 90}]}
+        return httpx.Response(200, json=body, headers=headers)
+
+    def statuses(self):
+        return [(path, etag) for path, etag, _ in self.requests]
+
+
+class TestRevalidation(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.api = ValidatingApi()
+        self.cache = ResponseCache(ttl=60, clock=self.clock)
+        self.client = HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(self.api)),
+            cache=self.cache,
+        )
+
+    def test_expired_claim_is_revalidated(self):
+        """Test that an expired claim is revalidated with If-None-Match and reused on 304."""
+        first = self.client.claims.get_single_claim(7)
+        self.clock.now = 61
+        second = self.client.claims.get_single_claim(7)
+        third = self.client.claims.get_single_claim(7)
+
+        self.assertIs(first, second)
+        self.assertIs(second, third)
+        self.assertEqual(self.api.statuses(), [("/api/getclaims/7", None), ("/api/getclaims/7", '"v1"')])
+        self.assertEqual(self.api.requests[1][2], "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.assertEqual(self.cache.stats.revalidations, 1)
+
+    def test_changed_claim_is_downloaded(self):
+        """Test that a 200 answer to a conditional request replaces the entry and its validators."""
+        self.client.claims.get_single_claim(7)
+        self.api.version = 2
+        self.clock.now = 61
+
+        claim = self.client.claims.get_single_claim(7)
+
+        self.assertEqual(claim.rentername, "v2")
+        self.assertEqual(self.cache.stale(("claim", "7"))[1].etag, '"v2"')
+
+    def test_claims_list_is_always_revalidated(self):
+        """Test that get_claims asks the server every time but reuses the decoded list on 304."""
+        first = self.client.claims.get_claims()
+        first.clear()
+        second = self.client.claims.get_claims(as_collection=True)
+        self.api.version = 2
+        third = self.client.claims.get_claims()
+
+        self.assertEqual(self.api.statuses(), [("/api/getclaims/all/false", None), ("/api/getclaims/all/false", '"v1"'), ("/api/getclaims/all/false", '"v1"')])
+        self.assertEqual([claim.rentername for claim in second], ["v1", "v1"])
+        self.assertEqual([claim.rentername for claim in third], ["v2", "v2"])
+        self.assertEqual(self.cache.stats.revalidations, 1)
+
+    def test_insurance_companies_are_revalidated(self):
+        """Test that an expired company search is revalidated and each caller still gets its own list."""
+        self.client.inscompanies.get_insurance_companies(query="geico")
+        self.clock.now = 61
+
+        companies = self.client.inscompanies.get_insurance_companies(query="geico")
+
+        self.assertEqual([company.name for company in companies], ["GEICO v1"])
+        self.assertEqual(self.api.statuses()[1], ("/api/inscompanies", '"v1"'))
+
+    def test_invalidated_claim_is_not_revalidated(self):
+        """Test that a write drops the validators too, so the next read is unconditional."""
+        self.client.claims.get_single_claim(7)
+        self.cache.invalidate(("claim", "7"))
+        self.client.claims.get_single_claim(7)
+
+        self.assertEqual(self.api.statuses()[1], ("/api/getclaims/7", None))
+
+    def test_entries_without_validators_still_expire(self):
+        """Test that only entries with validators outlive their TTL."""
+        self.cache.set("plain", 1)
+        self.cache.set("validated", 2, Validators(etag='"x"'))
+        self.clock.now = 61
+
+        self.assertIsNone(self.cache.get("plain"))
+        self.assertIsNone(self.cache.get("validated"))
+        self.assertIsNone(self.cache.stale("plain"))
+        self.assertEqual(self.cache.stale("validated"), (2, Validators(etag='"x"')))
+
+    def test_async_client_revalidates(self):
+        """Test conditional requests through AsyncHawkeyeClient."""
+        async def handler(request):
+            return self.api(request)
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+                cache=self.cache,
+            ) as client:
+                first = await client.claims.get_claims()
+                second = await client.claims.get_claims()
+                return first, second
+
+        first, second = asyncio.run(run())
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.api.statuses()[1], ("/api/getclaims/all/false", '"v1"'))
+
+
+if __name__ == "__main__":
+    unittest.main()
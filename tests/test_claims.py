@@ -1,8 +1,15 @@
 import unittest
+import asyncio
 from unittest.mock import patch, Mock
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
 import json
 
-from hawkeye_sdk_for_python import HawkeyeClient, Claim, APIError, APIResourceNotFoundError
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, Claim, CompactClaim, CompactDocFile, APIError, APIResourceNotFoundError
+from hawkeye_sdk_for_python.types import DocType
+from hawkeye_sdk_for_python.utils import gather_bounded, iter_json_array, type_claim
 
 
 class TestClaimsModule(unittest.TestCase):
@@ -627,6 +634,362 @@ class TestClaimsModule(unittest.TestCase):
         
         self.assertIn("Connection lost", str(context.exception))
 
+    @patch('httpx.Client.get')
+    def test_get_many_claims_reports_per_item(self, mock_get):
+        """Test that bulk fetch keeps input order and reports failures per item."""
+        def respond(url):
+            filenumber = int(url.rsplit("/", 1)[1])
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.is_error = False
+            mock_response.json.return_value = [] if filenumber == 3 else [{"filenumber": filenumber}]
+            if filenumber == 5:
+                mock_response.status_code = 404
+                mock_response.is_error = True
+                mock_response.json.return_value = {"message": "Claim not found"}
+            return mock_response
+        mock_get.side_effect = respond
+
+        seen = []
+        results = self.client.claims.get_many_claims(range(10), max_concurrency=4, on_result=seen.append)
+
+        self.assertEqual(mock_get.call_count, 10)
+        self.assertEqual(len(seen), 10)
+        self.assertEqual([result.item for result in results], list(range(10)))
+        self.assertIsInstance(results[3].error, ValueError)
+        self.assertIsInstance(results[5].error, APIResourceNotFoundError)
+        self.assertEqual([result.value.filenumber for result in results if result.ok], [0, 1, 2, 4, 6, 7, 8, 9])
+
+    def test_get_many_claims_invalid_concurrency(self):
+        """Test that a non-positive max_concurrency is rejected."""
+        with self.assertRaises(ValueError):
+            self.client.claims.get_many_claims([1, 2], max_concurrency=0)
+
+    def test_gather_bounded_pulls_items_lazily(self):
+        """Test that gather_bounded pulls each item only when a worker is free to start it."""
+        pulled = []
+        pulled_at_start = {}
+        in_flight = set()
+        peak = 0
+
+        def items():
+            for n in range(20):
+                pulled.append(n)
+                yield n
+
+        async def square(n):
+            nonlocal peak
+            pulled_at_start[n] = len(pulled)
+            in_flight.add(n)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.001 * (n % 3))
+            in_flight.discard(n)
+            if n == 7:
+                raise ValueError("seven")
+            return n * n
+
+        seen = []
+        results = asyncio.run(gather_bounded(square, items(), 3, on_result=seen.append))
+
+        self.assertEqual(peak, 3)
+        self.assertEqual(pulled_at_start, {n: n + 1 for n in range(20)})
+        self.assertEqual(len(seen), 20)
+        self.assertEqual([result.index for result in results], list(range(20)))
+        self.assertIsInstance(results[7].error, ValueError)
+        self.assertEqual(results[8].value, 64)
+
+    def test_create_claims_bulk_reports_per_row(self):
+        """Test that bulk creation accepts dicts and dataclasses and reports each row's response."""
+        @dataclass
+        class Row:
+            rentername: str
+            inscompaniesid: str
+            dateofloss: str
+            vehmake: str
+            vehmodel: str
+            vehcolor: str
+            vehvin: str
+            vehyear: Optional[int] = None
+
+        posted = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            posted.append(body)
+            if body["rentername"] == "Broken":
+                return httpx.Response(400, json={"message": "Invalid insurance company"})
+            return httpx.Response(200, json={"filenumber": f"F-{body['vehvin']}", "message": "Claim created", "error": 0, "success": True})
+        self._use_transport(handler)
+
+        base = dict(inscompaniesid="1", dateofloss="01/15/2025", vehmake="Toyota", vehmodel="Camry", vehcolor="Blue")
+        rows = [
+            dict(base, rentername="Jane", vehvin="VIN0"),
+            Row(**base, rentername="John", vehvin="VIN1", vehyear=2024),
+            dict(base, rentername="Broken", vehvin="VIN2"),
+            dict(base, rentername="Typo", vehvin="VIN3", vehcolour="Red"),
+        ]
+        seen = []
+        results = self.client.claims.create_claims_bulk(iter(rows), max_concurrency=2, on_result=seen.append)
+
+        self.assertEqual(len(seen), 4)
+        self.assertEqual([result.ok for result in results], [True, True, False, False])
+        self.assertEqual(results[1].value["filenumber"], "F-VIN1")
+        self.assertIsInstance(results[2].error, APIError)
+        self.assertIsInstance(results[3].error, TypeError)
+        self.assertEqual(len(posted), 3)
+        self.assertNotIn("vehyear", next(body for body in posted if body["vehvin"] == "VIN0"))
+        self.assertEqual(next(body for body in posted if body["vehvin"] == "VIN1")["vehyear"], 2024)
+
+    def test_create_claims_bulk_accepts_named_tuples(self):
+        """Test that NamedTuple rows are posted with their field names."""
+        class Row(NamedTuple):
+            rentername: str
+            inscompaniesid: str
+            dateofloss: str
+            vehmake: str
+            vehmodel: str
+            vehcolor: str
+            vehvin: str
+
+        posted = []
+
+        def handler(request):
+            posted.append(json.loads(request.content))
+            return httpx.Response(200, json={"filenumber": "1", "message": "Claim created", "error": 0, "success": True})
+        self._use_transport(handler)
+
+        results = self.client.claims.create_claims_bulk([Row("Jane", "1", "01/15/2025", "Toyota", "Camry", "Blue", "VIN0")])
+
+        self.assertTrue(results[0].ok)
+        self.assertEqual((posted[0]["rentername"], posted[0]["vehvin"]), ("Jane", "VIN0"))
+
+    def test_create_claims_bulk_rejects_unknown_row_type(self):
+        """Test that rows that are not mappings or records fail on their own result."""
+        results = self.client.claims.create_claims_bulk([("Jane", "1")])
+
+        self.assertIsInstance(results[0].error, TypeError)
+
+    def _claim_store(self, claims):
+        """Serves getclaims from claims and records updateclaim bodies."""
+        updates = []
+
+        def handler(request):
+            if request.url.path == "/api/updateclaim":
+                updates.append(json.loads(request.content))
+                return httpx.Response(200, json={"message": "Claim updated", "error": 0, "success": True})
+            filenumber = int(request.url.path.rsplit("/", 1)[1])
+            return httpx.Response(200, json=[claims[filenumber]] if filenumber in claims else [])
+        self._use_transport(handler)
+        return updates
+
+    def test_update_claims_bulk_sends_only_changes(self):
+        """Test that unchanged claims are skipped and only changed fields are posted."""
+        updates = self._claim_store({
+            1: {"filenumber": 1, "rentername": "Jane", "color": "Blue", "vin": "VIN1", "vehyear": 2024},
+            2: {"filenumber": 2, "rentername": "John", "color": "Red", "vin": "VIN2", "claimnumber": None},
+        })
+
+        results = self.client.claims.update_claims_bulk([
+            {"filenumber": 1, "rentername": "Jane ", "vehcolor": "Blue", "vehvin": "VIN1", "vehyear": "2024"},
+            {"filenumber": 2, "rentername": "John", "vehcolor": "Green", "vehvin": "VIN2", "claimnumber": ""},
+            {"filenumber": 3, "rentername": "Ghost"},
+        ])
+
+        self.assertTrue(results[0].ok)
+        self.assertIsNone(results[0].value)
+        self.assertTrue(results[1].value["success"])
+        self.assertIsInstance(results[2].error, ValueError)
+        self.assertEqual(updates, [{"filenumber": 2, "vehcolor": "Green"}])
+
+    def test_update_claims_bulk_untracked_fields(self):
+        """Test that fields a Claim does not expose are sent unless ignore_untracked is set."""
+        updates = self._claim_store({1: {"filenumber": 1, "rentername": "Jane"}})
+        record = {"filenumber": 1, "rentername": "Jane", "inscompaniesid": "7"}
+
+        self.client.claims.update_claims_bulk([record])
+        skipped = self.client.claims.update_claims_bulk([record], ignore_untracked=True)
+
+        self.assertEqual(updates, [{"filenumber": 1, "inscompaniesid": "7"}])
+        self.assertIsNone(skipped[0].value)
+
+    def test_update_claims_bulk_resends_only_changed_untracked_fields(self):
+        """Test that untracked fields are compared with the values last sent, with or without ignore_untracked."""
+        updates = self._claim_store({1: {"filenumber": 1, "rentername": "Jane"}})
+
+        for ignore_untracked in (False, True):
+            self.client.claims.update_claims_bulk([{"filenumber": 1, "note": "Called renter"}], ignore_untracked=ignore_untracked)
+        self.client.claims.update_claims_bulk([{"filenumber": 1, "note": "Called renter again"}], ignore_untracked=True)
+        self.client.claims.update_claims_bulk([{"filenumber": 1, "note": "Called renter again "}])
+
+        self.assertEqual(updates, [
+            {"filenumber": 1, "note": "Called renter"},
+            {"filenumber": 1, "note": "Called renter again"},
+        ])
+        self.assertEqual(list(self.client.claims.sent_untracked["1"]), ["note"])
+
+    def test_update_claims_bulk_ignore_untracked_takes_first_value_as_baseline(self):
+        """Test that ignore_untracked skips a value never sent but still sends later changes to it."""
+        updates = self._claim_store({1: {"filenumber": 1}})
+
+        self.client.claims.update_claims_bulk([{"filenumber": 1, "renterphone": "555-0100"}], ignore_untracked=True)
+        self.client.claims.update_claims_bulk([{"filenumber": 1, "renterphone": "555-0199"}], ignore_untracked=True)
+
+        self.assertEqual(updates, [{"filenumber": 1, "renterphone": "555-0199"}])
+
+    def test_update_claims_bulk_normalises_dates(self):
+        """Test that the same date in MM/DD/YYYY and ISO format is not reported as a change."""
+        updates = self._claim_store({1: {"filenumber": 1, "dateofloss": "2024-12-22T00:00:00"}})
+
+        results = self.client.claims.update_claims_bulk([
+            {"filenumber": 1, "dateofloss": "12/22/2024"},
+            {"filenumber": 1, "dateofloss": "1/2/2025"},
+        ])
+
+        self.assertIsNone(results[0].value)
+        self.assertEqual(updates, [{"filenumber": 1, "dateofloss": "1/2/2025"}])
+
+    def test_update_claims_bulk_with_current_state(self):
+        """Test that a caller-supplied snapshot is used instead of fetching each claim."""
+        updates = self._claim_store({})
+        current = [Claim(filenumber=1, rentername="Jane"), Claim(filenumber=2, rentername="John")]
+
+        results = self.client.claims.update_claims_bulk(
+            [{"filenumber": 1, "rentername": "Jane"}, {"filenumber": "2", "rentername": "Johnny"}],
+            current=current,
+        )
+
+        self.assertEqual([result.ok for result in results], [True, True])
+        self.assertEqual(updates, [{"filenumber": "2", "rentername": "Johnny"}])
+
+    def _use_transport(self, handler):
+        """Routes the claims module through an in-memory httpx transport."""
+        self.client.claims._client = httpx.Client(
+            base_url=self.client.settings.base_url,
+            transport=httpx.MockTransport(handler),
+        )
+
+    def test_iter_claims_streams_in_chunks(self):
+        """Test that iter_claims yields typed claims from a chunked body."""
+        body = json.dumps([
+            {"filenumber": n, "rentername": f"Renter {n}", "estimateamount": n * 1.5,
+             "docfiles": [{"doctype": "Invoice", "filename": f"{n}.pdf"}], "logtrail": [{"activity": "Opened"}]}
+            for n in range(50)
+        ]).encode()
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            chunks = (body[i:i + 7] for i in range(0, len(body), 7))
+            return httpx.Response(200, content=chunks)
+        self._use_transport(handler)
+
+        claims = list(self.client.claims.iter_claims(include_inactive=True))
+
+        self.assertEqual(requested, ["/api/getclaims/all/true"])
+        self.assertEqual(len(claims), 50)
+        self.assertIsInstance(claims[0], Claim)
+        self.assertEqual(claims[49].estimateamount, 73.5)
+        self.assertEqual(claims[7].docfiles[0].filename, "7.pdf")
+        self.assertEqual(claims[7].logtrail[0].activity, "Opened")
+
+    def test_iter_claims_error_response(self):
+        """Test that iter_claims raises APIError for an error status."""
+        self._use_transport(lambda request: httpx.Response(500, json={"message": "Server exploded"}))
+
+        with self.assertRaises(APIError) as context:
+            list(self.client.claims.iter_claims())
+
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertIn("Server exploded", str(context.exception))
+
+    def test_iter_json_array_split_scalars(self):
+        """Test that scalars split across chunk boundaries are not decoded early."""
+        chunks = ["[", "12", "34, tr", "ue ,", '"a', '\\"b"', ", {\"x\": [1,", " 2]}", " ]  "]
+
+        self.assertEqual(list(iter_json_array(chunks)), [1234, True, 'a"b', {"x": [1, 2]}])
+        self.assertEqual(list(iter_json_array(["[", "]"])), [])
+
+    def test_iter_json_array_chunk_boundaries(self):
+        """Test that numbers and literals split at any point are held back until they are complete."""
+        self.assertEqual(list(iter_json_array(["[1,2.", "5]"])), [1, 2.5])
+        self.assertEqual(list(iter_json_array(["[1.5e", "3]"])), [1500.0])
+        self.assertEqual(list(iter_json_array(["[-", "1, n", "ull, fa", "lse]"])), [-1, None, False])
+        self.assertEqual(list(iter_json_array(["[12", "]"])), [12])
+
+        text = '[1, -2.5e-3, true, null, "x,]", {"a": [1, 2]}, [3], 40]'
+        expected = json.loads(text)
+        for split in range(len(text) + 1):
+            with self.subTest(split=split):
+                self.assertEqual(list(iter_json_array([text[:split], text[split:]])), expected)
+        self.assertEqual(list(iter_json_array(list(text))), expected)
+
+    def test_iter_json_array_requires_separators(self):
+        """Test that elements must be separated by a comma."""
+        for chunks in (["[1 2]"], ["[1", " 2]"], ['[{"a": 1} {"b": 2}]'], ["[1,,2]"], ["[1,]"], ["[1.2.3]"]):
+            with self.subTest(chunks=chunks):
+                with self.assertRaises(ValueError):
+                    list(iter_json_array(chunks))
+
+    def test_iter_json_array_rejects_truncated_body(self):
+        """Test that a truncated array raises instead of silently ending."""
+        with self.assertRaises(ValueError):
+            list(iter_json_array(['[{"filenumber": 1}, {"filenu']))
+        with self.assertRaises(ValueError):
+            list(iter_json_array(['{"filenumber": 1}']))
+
+    @patch('httpx.Client.get')
+    def test_get_single_claim_compact_records(self, mock_get):
+        """Test that compact_records returns slotted claims with the same attributes."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.is_error = False
+        mock_response.json.return_value = [{
+            "filenumber": 12345,
+            "vin": "1ABCD23E45FG67890",
+            "estimateamount": 2933.95,
+            "docfiles": [{"doctype": "Images", "filename": "photo.jpg"}],
+            "logtrail": [{"activity": "Claim created"}],
+        }]
+        mock_get.return_value = mock_response
+        compact_client = HawkeyeClient("test-auth-token", compact_records=True)
+
+        claim = compact_client.claims.get_single_claim(12345)
+
+        self.assertIsInstance(claim, CompactClaim)
+        self.assertFalse(hasattr(claim, "__dict__"))
+        self.assertEqual(claim.vin, "1ABCD23E45FG67890")
+        self.assertEqual(claim.estimateamount, 2933.95)
+        self.assertIsNone(claim.vehmake)
+        self.assertIsInstance(claim.docfiles[0], CompactDocFile)
+        self.assertEqual(claim.docfiles[0].filename, "photo.jpg")
+        self.assertEqual(claim.logtrail[0].activity, "Claim created")
+        self.assertEqual(list(CompactClaim.__dataclass_fields__), list(Claim.__dataclass_fields__))
+        with self.assertRaises(AttributeError):
+            claim.not_a_field = 1
+
+    def test_type_claim_unknown_doctype(self):
+        """Test that unknown or missing document types fall back to DocType.DEFAULT."""
+        claim = type_claim({
+            "filenumber": 1,
+            "docfiles": [
+                {"doctype": "Brand New Category", "filename": "a.pdf"},
+                {"filename": "b.pdf"},
+                {"doctype": "Police Report"},
+            ],
+            "logtrail": None,
+        })
+
+        self.assertEqual([doc.doctype for doc in claim.docfiles], [DocType.DEFAULT, DocType.DEFAULT, DocType.POLICE_REPORT])
+        self.assertEqual(claim.docfiles[0].filename, "a.pdf")
+        self.assertEqual(claim.logtrail, [])
+
+    def test_type_claim_missing_fields(self):
+        """Test that fields absent from the payload are None, matching the previous decoder."""
+        claim = type_claim({"filenumber": 1, "settlement_pd": 100.5})
+
+        self.assertEqual(claim, Claim(filenumber=1, settlement_pd=100.5))
+        self.assertEqual(type_claim({}), Claim())
+
     def test_client_debug_mode(self):
         """Test client initialization in debug mode."""
         debug_client = HawkeyeClient("test-token", debug_mode=True)
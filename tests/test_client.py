@@ -0,0 +1,82 @@
+import unittest
+import asyncio
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, AsyncHawkeyeClient, TransportSettings
+
+
+class TestHawkeyeClient(unittest.TestCase):
+    def test_context_manager_closes_pool(self):
+        """Test that leaving the with block closes the underlying httpx client."""
+        with HawkeyeClient("test-auth-token") as client:
+            self.assertFalse(client._http_client.is_closed)
+
+        self.assertTrue(client._http_client.is_closed)
+
+    def test_close(self):
+        """Test that close() is a real method on the client."""
+        client = HawkeyeClient("test-auth-token")
+        client.close()
+
+        self.assertTrue(client._http_client.is_closed)
+
+    def test_default_transport_settings(self):
+        """Test that the defaults keep the previous 60 second timeout."""
+        client = HawkeyeClient("test-auth-token")
+
+        self.assertEqual(client._http_client.timeout, httpx.Timeout(60.0))
+        self.assertIsInstance(client._http_client._transport, httpx.HTTPTransport)
+
+    def test_per_phase_timeouts_and_limits(self):
+        """Test that timeouts and pool limits come from TransportSettings."""
+        settings = TransportSettings(
+            max_connections=50,
+            max_keepalive_connections=10,
+            keepalive_expiry=30.0,
+            connect_timeout=2.0,
+            read_timeout=120.0,
+            write_timeout=10.0,
+            pool_timeout=None,
+        )
+        client = HawkeyeClient("test-auth-token", transport_settings=settings)
+
+        self.assertEqual(client._http_client.timeout, httpx.Timeout(connect=2.0, read=120.0, write=10.0, pool=None))
+        self.assertEqual(settings.limits(), httpx.Limits(max_connections=50, max_keepalive_connections=10, keepalive_expiry=30.0))
+        self.assertIs(client.settings.transport, settings)
+
+    def test_custom_transport(self):
+        """Test that a custom transport receives every module's requests."""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            self.assertEqual(request.headers["Authorization"], "Bearer test-auth-token")
+            if request.url.path.endswith("/inscompanies"):
+                return httpx.Response(200, json={"data": [{"id": 1, "name": "GEICO"}]})
+            return httpx.Response(200, json=[{"filenumber": 7}])
+
+        settings = TransportSettings(transport=httpx.MockTransport(handler))
+        with HawkeyeClient("test-auth-token", transport_settings=settings) as client:
+            claim = client.claims.get_single_claim(7)
+            companies = client.inscompanies.get_insurance_companies()
+
+        self.assertEqual(paths, ["/api/getclaims/7", "/api/inscompanies"])
+        self.assertEqual(claim.filenumber, 7)
+        self.assertEqual(companies[0].name, "GEICO")
+
+    def test_custom_async_transport(self):
+        """Test that the async client uses the async custom transport."""
+        async def handler(request):
+            return httpx.Response(200, json=[{"filenumber": 8}])
+
+        async def run():
+            settings = TransportSettings(async_transport=httpx.MockTransport(handler))
+            async with AsyncHawkeyeClient("test-auth-token", transport_settings=settings) as client:
+                return await client.claims.get_single_claim(8)
+
+        self.assertEqual(asyncio.run(run()).filenumber, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
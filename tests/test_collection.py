@@ -0,0 +1,100 @@
+import unittest
+from datetime import date
+from unittest.mock import patch, Mock
+
+from hawkeye_sdk_for_python import HawkeyeClient, Claim, ClaimCollection
+from hawkeye_sdk_for_python.collection import parse_date
+
+
+def make_claims():
+    return ClaimCollection([
+        Claim(filenumber=1, vin="1HGCM82633A004352", claimnumber="CLM-1", ranumber="RA1", platenumber="ABC123",
+              insurancecompany="GEICO", hc_adj="Ann", dateofloss="01/15/2025", estimateamount=1200.0),
+        Claim(filenumber=2, vin="2T1BURHE0JC034317", claimnumber="CLM-2", insurancecompany="Progressive",
+              hc_adj="Bob", dateofloss="02/20/2025", estimateamount=800.0),
+        Claim(filenumber=3, vin="1HGCM82633A004352", clientclaimno="CC-3", insurancecompany="GEICO",
+              hc_adj="Bob", dateofloss="2025-03-05", estimateamount=None),
+        Claim(filenumber=4, vin=None, insurancecompany=None, hc_adj="Ann", dateofloss=None, estimateamount=50.0),
+    ])
+
+
+class TestClaimCollection(unittest.TestCase):
+    def setUp(self):
+        self.claims = make_claims()
+
+    def test_indexed_lookups(self):
+        """Test that identifier lookups ignore case and whitespace and return every match."""
+        self.assertEqual([claim.filenumber for claim in self.claims.by_vin(" 1hgcm82633a004352 ")], [1, 3])
+        self.assertEqual(self.claims.get("claimnumber", "clm-2").filenumber, 2)
+        self.assertEqual(self.claims.get("filenumber", "3").clientclaimno, "CC-3")
+        self.assertEqual(self.claims.get("platenumber", "abc123").filenumber, 1)
+        self.assertIsNone(self.claims.get("ranumber", "missing"))
+        with self.assertRaises(ValueError):
+            self.claims.find("rentername", "Jane")
+
+    def test_index_is_built_once(self):
+        """Test that an index is built on first use and reused afterwards."""
+        self.assertEqual(self.claims._indexes, {})
+        self.claims.by_vin("x")
+        index = self.claims._indexes["vin"]
+        self.claims.by_vin("y")
+
+        self.assertIs(self.claims._indexes["vin"], index)
+        self.assertEqual(list(self.claims._indexes), ["vin"])
+
+    def test_filter_ranges(self):
+        """Test equality, amount ranges and date ranges across date formats."""
+        geico = self.claims.filter(insurancecompany="GEICO")
+        q1 = self.claims.filter(dateofloss__between=("01/01/2025", date(2025, 3, 31)))
+        february_on = self.claims.filter(dateofloss__gte="2025-02-01", estimateamount__lt=1000)
+        by_vin = self.claims.filter(vin="1hgcm82633a004352", estimateamount__gte=1000)
+
+        self.assertEqual([claim.filenumber for claim in geico], [1, 3])
+        self.assertEqual([claim.filenumber for claim in q1], [1, 2, 3])
+        self.assertEqual([claim.filenumber for claim in february_on], [2])
+        self.assertEqual([claim.filenumber for claim in by_vin], [1])
+        self.assertEqual(len(self.claims.filter(hc_adj__in={"Bob"}, claimnumber="CLM-2")), 1)
+        with self.assertRaises(ValueError):
+            self.claims.filter(estimateamount__approx=1)
+
+    def test_group_by_and_sum(self):
+        """Test grouping by insurer and adjuster and summing amounts."""
+        by_insurer = self.claims.group_by("insurancecompany")
+        by_adjuster = self.claims.group_by("hc_adj")
+
+        self.assertEqual(list(by_insurer), ["GEICO", "Progressive", None])
+        self.assertEqual(by_insurer["GEICO"].sum("estimateamount"), 1200.0)
+        self.assertEqual({name: len(group) for name, group in by_adjuster.items()}, {"Ann": 2, "Bob": 2})
+
+    def test_sequence_behaviour(self):
+        """Test that the collection behaves like the list it replaces."""
+        self.assertEqual(len(self.claims), 4)
+        self.assertEqual(self.claims[0].filenumber, 1)
+        self.assertIsInstance(self.claims[1:3], ClaimCollection)
+        self.assertEqual([claim.filenumber for claim in self.claims[1:3]], [2, 3])
+        self.assertEqual(self.claims, list(make_claims()))
+
+    def test_parse_date(self):
+        """Test the supported date formats."""
+        self.assertEqual(parse_date("01/15/2025"), date(2025, 1, 15))
+        self.assertEqual(parse_date("2025-01-15T10:30:00"), date(2025, 1, 15))
+        self.assertIsNone(parse_date(""))
+        self.assertIsNone(parse_date("soon"))
+
+    @patch('httpx.Client.get')
+    def test_get_claims_as_collection(self, mock_get):
+        """Test that get_claims can return a ClaimCollection."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.is_error = False
+        mock_response.json.return_value = [{"filenumber": 1, "vin": "VIN1"}, {"filenumber": 2, "vin": "VIN2"}]
+        mock_get.return_value = mock_response
+
+        claims = HawkeyeClient("test-auth-token").claims.get_claims(as_collection=True)
+
+        self.assertIsInstance(claims, ClaimCollection)
+        self.assertEqual(claims.by_vin("vin2")[0].filenumber, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
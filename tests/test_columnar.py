@@ -0,0 +1,129 @@
+import unittest
+import importlib.util
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, TransportSettings
+from hawkeye_sdk_for_python.columnar import claims_to_columns, claims_to_numpy, claims_to_arrow, claims_table
+
+from helpers import SAMPLE_CLAIMS
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+PORTAL_CLAIMS = [
+    {"filenumber": 1, "insurancecompany": "GEICO", "estimateamount": 1200.5, "settlement_pd": 900.0, "dv_amt": 100.0,
+     "totalloss": True, "vehyear": 2021, "dateofloss": "01/15/2025", "docfiles": [{"filename": "a.pdf"}]},
+    {"filenumber": 2, "insurancecompany": "Progressive", "estimateamount": None, "settlement_pd": 250.0,
+     "totalloss": False, "vehyear": None, "dateofloss": "2025-02-01"},
+    {"filenumber": 3, "insurancecompany": None, "estimateamount": 300, "dateofloss": "", "datefileclosed": "03/01/2025"},
+]
+
+
+class TestColumnarExport(unittest.TestCase):
+    def test_claims_to_columns(self):
+        """Test that the payload is transposed with dates parsed and children left out."""
+        columns = claims_to_columns(PORTAL_CLAIMS)
+
+        self.assertEqual(columns["filenumber"], [1, 2, 3])
+        self.assertEqual(columns["dateofloss"], [date(2025, 1, 15), date(2025, 2, 1), None])
+        self.assertEqual(columns["settlement_dv"], [None, None, None])
+        self.assertNotIn("docfiles", columns)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_claims_to_numpy(self):
+        """Test that NumPy columns are typed and support vectorised sums."""
+        import numpy as np
+        arrays = claims_to_numpy(PORTAL_CLAIMS)
+
+        self.assertEqual(arrays["estimateamount"].dtype, np.float64)
+        self.assertEqual(np.nansum(arrays["estimateamount"]), 1500.5)
+        self.assertEqual(np.nansum(arrays["settlement_pd"] + np.nan_to_num(arrays["dv_amt"])), 1250.0)
+        self.assertEqual(arrays["filenumber"].dtype, np.int64)
+        self.assertEqual(arrays["vehyear"].dtype, np.float64)
+        self.assertEqual(arrays["totalloss"].tolist(), [True, False, False])
+        self.assertEqual(arrays["dateofloss"].dtype, np.dtype("datetime64[D]"))
+        self.assertTrue(np.isnat(arrays["dateofloss"][2]))
+        self.assertEqual(arrays["insurancecompany"].tolist(), ["GEICO", "Progressive", None])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_claims_to_arrow(self):
+        """Test that the Arrow table keeps types and nulls."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        table = claims_to_arrow(PORTAL_CLAIMS)
+
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.schema.field("estimateamount").type, pa.float64())
+        self.assertEqual(table.schema.field("totalloss").type, pa.bool_())
+        self.assertEqual(table.schema.field("dateofloss").type, pa.date32())
+        self.assertEqual(pc.sum(table["estimateamount"]).as_py(), 1500.5)
+        self.assertEqual(table["totalloss"].to_pylist(), [True, False, None])
+        self.assertEqual(table["vehyear"].null_count, 2)
+
+    def test_values_that_do_not_fit_the_annotation_become_text(self):
+        """Test that dates the API sends in flag fields such as liabilityaccepted are kept as text."""
+        columns = claims_to_columns(SAMPLE_CLAIMS)
+
+        self.assertEqual(columns["liabilityaccepted"], ["2025-02-19", None])
+        self.assertEqual(columns["firstparty"], [True, True])
+        self.assertEqual(columns["dateofloss"], [date(2024, 12, 22), date(2025, 7, 25)])
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_sample_claims_to_numpy(self):
+        """Test that the NumPy export of real API claims keeps dates in flag fields instead of turning them into True."""
+        import numpy as np
+        arrays = claims_to_numpy(SAMPLE_CLAIMS)
+
+        self.assertEqual(arrays["liabilityaccepted"].dtype, np.dtype(object))
+        self.assertEqual(arrays["liabilityaccepted"].tolist(), ["2025-02-19", None])
+        self.assertEqual(arrays["firstparty"].dtype, np.bool_)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_get_claims_table_from_sample_claims(self):
+        """Test that get_claims_table builds an Arrow table from real API claims."""
+        import pyarrow as pa
+        client = HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=SAMPLE_CLAIMS))),
+        )
+
+        table = client.claims.get_claims_table()
+
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema.field("liabilityaccepted").type, pa.string())
+        self.assertEqual(table["liabilityaccepted"].to_pylist(), ["2025-02-19", None])
+        self.assertEqual(table.schema.field("firstparty").type, pa.bool_())
+        self.assertEqual(table.schema.field("estimateamount").type, pa.float64())
+
+    def test_missing_backend_package(self):
+        """Test that a clear ImportError names the package to install."""
+        with patch.dict("sys.modules", {"numpy": None, "pyarrow": None}):
+            with self.assertRaisesRegex(ImportError, "pip install numpy"):
+                claims_to_numpy(PORTAL_CLAIMS)
+            with self.assertRaisesRegex(ImportError, "pip install pyarrow"):
+                claims_to_arrow(PORTAL_CLAIMS)
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            claims_table(PORTAL_CLAIMS, "pandas")
+
+    def test_get_claims_table_skips_claim_objects(self):
+        """Test that get_claims_table never builds Claim objects."""
+        client = HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=PORTAL_CLAIMS))),
+        )
+
+        with patch("hawkeye_sdk_for_python.modules.claims.type_claim") as type_claim:
+            columns = client.claims.get_claims_table(include_inactive=True, backend="columns")
+
+        type_claim.assert_not_called()
+        self.assertEqual(columns["insurancecompany"], ["GEICO", "Progressive", None])
+
+
+if __name__ == "__main__":
+    unittest.main()
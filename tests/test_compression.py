@@ -0,0 +1,154 @@
+import unittest
+import asyncio
+import gzip
+import json
+from unittest.mock import patch
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, AsyncHawkeyeClient, CompressionSettings, TransportSettings
+from hawkeye_sdk_for_python.compression import TransferStats
+
+from helpers import client_for
+
+CLAIMS = [{"filenumber": n, "rentername": f"Renter {n}", "insurancecompany": "GEICO"} for n in range(50)]
+CLAIMS_BODY = json.dumps(CLAIMS).encode()
+
+
+class CompressingApi:
+    """Stand-in for an API that gzips its responses and can refuse gzip-encoded request bodies."""
+
+    def __init__(self, accept_gzip_bodies=True):
+        self.accept_gzip_bodies = accept_gzip_bodies
+        self.requests = []
+
+    def __call__(self, request):
+        body = request.content
+        encoding = request.headers.get("Content-Encoding")
+        self.requests.append((request.url.path, request.headers.get("Accept-Encoding"), encoding))
+        if encoding == "gzip":
+            if not self.accept_gzip_bodies:
+                return httpx.Response(415, json={"message": "Unsupported Content-Encoding"})
+            body = gzip.decompress(body)
+        if request.url.path.startswith("/api/getclaims/"):
+            return httpx.Response(200, headers={"Content-Encoding": "gzip"}, content=gzip.compress(CLAIMS_BODY))
+        return httpx.Response(200, json={"filenumber": json.loads(body)["filenumber"], "message": "ok", "error": 0, "success": True})
+
+
+class TestCompressionSettings(unittest.TestCase):
+    def test_accept_encoding_lists_installed_decoders(self):
+        """Test that codings without an installed decoder are left out of Accept-Encoding."""
+        with patch("hawkeye_sdk_for_python.compression.find_spec", return_value=None):
+            self.assertEqual(CompressionSettings().accept_encoding_header(), "gzip, deflate")
+            self.assertEqual(CompressionSettings(accept_encoding=("zstd", "gzip")).accept_encoding_header(), "gzip")
+        with patch("hawkeye_sdk_for_python.compression.find_spec", return_value=object()):
+            self.assertEqual(CompressionSettings().accept_encoding_header(), "zstd, br, gzip, deflate")
+
+    def test_empty_accept_encoding_asks_for_identity(self):
+        """Test that an empty coding list disables response compression."""
+        self.assertEqual(CompressionSettings(accept_encoding=()).accept_encoding_header(), "identity")
+
+    def test_unknown_coding_is_rejected(self):
+        """Test that misspelt codings fail fast."""
+        with self.assertRaises(ValueError):
+            CompressionSettings(accept_encoding=("gzip", "lz4"))
+
+    def test_small_bodies_are_not_compressed(self):
+        """Test that only bodies of at least request_min_size are compressed."""
+        settings = CompressionSettings(compress_requests=True, request_min_size=100)
+
+        self.assertIsNone(settings.compress(b"x" * 99))
+        self.assertEqual(gzip.decompress(settings.compress(b"x" * 100)), b"x" * 100)
+        self.assertIsNone(CompressionSettings().compress(b"x" * 10_000))
+
+
+class TestCompressionTransport(unittest.TestCase):
+    def test_negotiates_and_measures_responses(self):
+        """Test that compressed responses are decoded and counted per endpoint in wire and decoded bytes."""
+        api = CompressingApi()
+        client = client_for(api, compression=CompressionSettings(accept_encoding=("gzip",)))
+
+        claims = client.claims.get_claims()
+
+        self.assertEqual(len(claims), 50)
+        self.assertEqual(api.requests[0][1], "gzip")
+        transfer = client.transfer_stats.endpoints["/getclaims"]
+        self.assertEqual(transfer.responses, 1)
+        self.assertEqual(transfer.decoded_bytes, len(CLAIMS_BODY))
+        self.assertEqual(transfer.wire_bytes, len(gzip.compress(CLAIMS_BODY)))
+        self.assertGreater(transfer.compression_ratio, 3)
+
+    def test_streamed_responses_are_measured(self):
+        """Test that iter_claims is counted once the stream has been read through."""
+        client = client_for(CompressingApi(), compression=CompressionSettings())
+
+        self.assertEqual(sum(1 for _ in client.claims.iter_claims()), 50)
+        self.assertEqual(client.transfer_stats.endpoints["/getclaims"].decoded_bytes, len(CLAIMS_BODY))
+
+    def test_large_request_bodies_are_gzipped(self):
+        """Test that bodies above the threshold are sent gzip-encoded and small ones as-is."""
+        api = CompressingApi()
+        client = client_for(api, compression=CompressionSettings(compress_requests=True, request_min_size=500))
+
+        client.claims.update_claim(filenumber=1, note="x" * 2000)
+        client.claims.update_claim(filenumber=2, note="short")
+
+        self.assertEqual([encoding for _, _, encoding in api.requests], ["gzip", None])
+        transfer = client.transfer_stats.endpoints["/updateclaim"]
+        self.assertEqual(transfer.compressed_requests, 1)
+        self.assertLess(transfer.body_wire_bytes, transfer.body_bytes)
+
+    def test_rejected_compression_falls_back(self):
+        """Test that a 415 answer to a gzip body resends it uncompressed and stops compressing."""
+        api = CompressingApi(accept_gzip_bodies=False)
+        client = client_for(api, compression=CompressionSettings(compress_requests=True, request_min_size=500))
+
+        first = client.claims.update_claim(filenumber=1, note="x" * 2000)
+        client.claims.update_claim(filenumber=2, note="y" * 2000)
+
+        self.assertTrue(first["success"])
+        self.assertEqual([encoding for _, _, encoding in api.requests], ["gzip", None, None])
+
+    def test_disabled_by_default(self):
+        """Test that clients without CompressionSettings keep httpx's defaults and collect no stats."""
+        client = HawkeyeClient("test-auth-token")
+
+        self.assertIsNone(client.transfer_stats)
+        self.assertIsInstance(client._http_client._transport, httpx.HTTPTransport)
+
+    def test_total_sums_endpoints(self):
+        """Test that total adds up every endpoint."""
+        stats = TransferStats()
+        stats.record_response("/getclaims", 100, 600)
+        stats.record_response("/inscompanies", 10, 40)
+        stats.record_request("/updateclaim", 2000, 300)
+
+        total = stats.total
+        self.assertEqual((total.responses, total.wire_bytes, total.decoded_bytes), (2, 110, 640))
+        self.assertEqual(total.saved_bytes, 530 + 1700)
+
+    def test_async_client_measures_responses(self):
+        """Test negotiation and accounting through AsyncHawkeyeClient."""
+        api = CompressingApi()
+
+        async def handler(request):
+            return api(request)
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+                compression=CompressionSettings(compress_requests=True, request_min_size=500),
+            ) as client:
+                await client.claims.get_claims()
+                await client.claims.update_claim(filenumber=1, note="x" * 2000)
+                return client.transfer_stats.endpoints
+
+        endpoints = asyncio.run(run())
+
+        self.assertEqual(endpoints["/getclaims"].decoded_bytes, len(CLAIMS_BODY))
+        self.assertEqual(endpoints["/updateclaim"].compressed_requests, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
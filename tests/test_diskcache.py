@@ -0,0 +1,195 @@
+import unittest
+import os
+import sqlite3
+import tempfile
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, DiskCache, TransportSettings, DocType
+from hawkeye_sdk_for_python.cache import Validators
+
+from helpers import FakeApi, FakeClock
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.db")
+        self.clock = FakeClock(1000.0)
+        self.caches = []
+
+    def tearDown(self):
+        for cache in self.caches:
+            cache.close()
+        self.directory.cleanup()
+
+    def open(self, **options):
+        cache = DiskCache(self.path, clock=self.clock, **options)
+        self.caches.append(cache)
+        return cache
+
+    def test_entries_survive_reopening(self):
+        """Test that a new instance on the same file reads what an earlier one stored."""
+        self.open().set(("claim", "1"), {"filenumber": 1})
+
+        cache = self.open()
+
+        self.assertEqual(cache.get(("claim", "1")), {"filenumber": 1})
+        self.assertEqual(cache.stats.hits, 1)
+
+    def test_ttl_expiry(self):
+        """Test that entries without validators are dropped once their TTL has passed."""
+        cache = self.open(ttl=10)
+        cache.set("a", 1)
+
+        self.clock.now += 9.9
+        self.assertEqual(cache.get("a"), 1)
+        self.clock.now += 0.1
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats.expirations, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_expired_entry_with_validators_can_be_revalidated(self):
+        """Test that an expired entry with validators is kept for a conditional request."""
+        cache = self.open(ttl=10)
+        cache.set("a", [1, 2], Validators(etag='"v1"'))
+        self.clock.now += 20
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stale("a"), ([1, 2], Validators(etag='"v1"')))
+        cache.revalidate("a", Validators(etag='"v2"'))
+        self.assertEqual(cache.get("a"), [1, 2])
+        self.assertEqual(cache.stale("a")[1].etag, '"v2"')
+
+    def test_size_bounded_lru_eviction(self):
+        """Test that the least recently used entries are evicted once the stored bodies exceed max_bytes."""
+        cache = self.open(max_bytes=3500, compress=False)
+        for key in ("a", "b", "c"):
+            cache.set(key, b"x" * 1000)
+            self.clock.now += 1
+        self.clock.now += 1
+        cache.get("a")
+        self.clock.now += 1
+        cache.set("d", b"x" * 1000)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertIsNotNone(cache.get("d"))
+        self.assertLessEqual(cache.size, 3500)
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_hits_do_not_write_until_flushed(self):
+        """Test that cache hits are served without writing to the file and their access times are saved on close."""
+        cache = self.open()
+        cache.set("a", 1)
+        changes = cache._conn.total_changes
+        self.clock.now += 5
+
+        for _ in range(10):
+            self.assertEqual(cache.get("a"), 1)
+
+        self.assertEqual(cache._conn.total_changes, changes)
+        cache.close()
+        self.caches.remove(cache)
+        conn = sqlite3.connect(self.path)
+        (accessed_at,) = conn.execute("SELECT accessed_at FROM entries").fetchone()
+        conn.close()
+        self.assertEqual(accessed_at, self.clock.now)
+
+    def test_large_bodies_are_compressed(self):
+        """Test that bodies above compress_min_size are stored compressed and read back intact."""
+        cache = self.open()
+        value = [{"filenumber": n, "rentername": "Renter"} for n in range(200)]
+        cache.set("big", value)
+        cache.set("small", 1)
+
+        with sqlite3.connect(self.path) as conn:
+            rows = dict(conn.execute("SELECT key, compressed FROM entries"))
+
+        self.assertEqual(rows, {repr("big"): 1, repr("small"): 0})
+        self.assertEqual(cache.get("big"), value)
+        self.assertLess(cache.size, 2000)
+
+    def test_unreadable_entry_is_dropped(self):
+        """Test that a body that cannot be unpickled counts as a miss and is removed."""
+        cache = self.open()
+        cache.set("a", 1)
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("UPDATE entries SET value = ?", (b"not a pickle",))
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_format_change_discards_old_entries(self):
+        """Test that a file written with another format version is emptied on open."""
+        self.open().set("a", 1)
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("PRAGMA user_version = 0")
+
+        self.assertEqual(len(self.open()), 0)
+
+
+class TestClientDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.db")
+        self.api = FakeApi()
+        self.caches = []
+
+    def tearDown(self):
+        for cache in self.caches:
+            cache.close()
+        self.directory.cleanup()
+
+    def new_client(self):
+        """Builds a client with a fresh DiskCache on the shared file, like a new run of a cron job."""
+        cache = DiskCache(self.path)
+        self.caches.append(cache)
+        return HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(self.api)),
+            cache=cache,
+        )
+
+    def test_reads_are_reused_across_clients(self):
+        """Test that claims and insurer lookups fetched by one run are served from disk in the next."""
+        first = self.new_client()
+        first.claims.get_single_claim(12345)
+        first.inscompanies.get_insurance_companies(query="geico")
+
+        second = self.new_client()
+        claim = second.claims.get_single_claim(12345)
+        companies = second.inscompanies.get_insurance_companies(query="geico")
+
+        self.assertEqual(claim.rentername, "Renter")
+        self.assertEqual(companies[0].name, "GEICO")
+        self.assertEqual(self.api.paths(), ["/api/getclaims/12345", "/api/inscompanies"])
+
+    def test_writes_invalidate_across_clients(self):
+        """Test that update_claim and upload_file drop the claim from the shared file."""
+        self.new_client().claims.get_single_claim(1)
+        self.new_client().claims.update_claim(filenumber=1, note="x")
+        self.new_client().claims.get_single_claim(1)
+        self.new_client().docfiles.upload_file(1, "https://example.com/a.pdf", DocType.INVOICE)
+        self.new_client().claims.get_single_claim(1)
+
+        self.assertEqual(self.api.count("/api/getclaims/1"), 3)
+
+    def test_compact_records_round_trip(self):
+        """Test that slotted compact claims can be stored and read back."""
+        cache = DiskCache(self.path)
+        self.caches.append(cache)
+        client = HawkeyeClient(
+            "test-auth-token",
+            compact_records=True,
+            transport_settings=TransportSettings(transport=httpx.MockTransport(self.api)),
+            cache=cache,
+        )
+        stored = client.claims.get_single_claim(7)
+
+        self.assertEqual(self.new_client().claims.get_single_claim(7).rentername, stored.rentername)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,12 @@
 import unittest
 from unittest.mock import patch, Mock
+import asyncio
 import json
 from datetime import datetime
 
-from hawkeye_sdk_for_python import HawkeyeClient
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, AsyncHawkeyeClient, APIError, TransportSettings
 from hawkeye_sdk_for_python.types import DocType
 
 
@@ -275,6 +278,58 @@ class TestDocfilesModule(unittest.TestCase):
 
         self.assertIn("Network error", str(context.exception))
 
+    def _savefile_server(self):
+        posted = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            posted.append(body)
+            if body["link"].endswith("broken.pdf"):
+                return httpx.Response(400, json={"message": "Unreachable link"})
+            return httpx.Response(200, json={"message": "File uploaded successfully", "success": True, "error": 0})
+        return handler, posted
+
+    def test_upload_files_dedupes_and_reports_per_item(self):
+        """Test that repeated (filenumber, link) pairs are posted once and every item gets a result."""
+        handler, posted = self._savefile_server()
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(handler)))
+        items = [
+            (1, "https://example.com/a.pdf", DocType.INVOICE),
+            {"filenumber": 2, "fileurl": "https://example.com/b.jpg", "category": DocType.IMAGES, "visibleToClient": True},
+            ("1", "https://example.com/a.pdf"),
+            (3, "https://example.com/broken.pdf", DocType.OTHER, False, "retry me"),
+        ]
+        seen = []
+
+        results = client.docfiles.upload_files(items, max_concurrency=2, on_result=seen.append)
+
+        self.assertEqual(len(posted), 3)
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertEqual([result.ok for result in results], [True, True, True, False])
+        self.assertIsInstance(results[3].error, APIError)
+        self.assertEqual(results[2].item, (1, "https://example.com/a.pdf", DocType.INVOICE, False, ""))
+        self.assertEqual(sorted(result.index for result in seen), [0, 1, 3])
+        self.assertEqual(next(body for body in posted if body["filenumber"] == 2)["visibleToClient"], True)
+
+    def test_async_upload_files(self):
+        """Test upload_files on the async client."""
+        handler, posted = self._savefile_server()
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+            ) as client:
+                return await client.docfiles.upload_files(
+                    [(n % 3, f"https://example.com/{n % 3}.pdf") for n in range(9)], max_concurrency=3
+                )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(results), 9)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(len(posted), 3)
+
     def test_doctype_enum_values(self):
         """Test that DocType enum values are correctly mapped."""
         # Test a few key document types
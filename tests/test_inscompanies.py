@@ -1,8 +1,14 @@
 import unittest
 from unittest.mock import patch, Mock
+import asyncio
 import json
+import threading
+import time
 
-from hawkeye_sdk_for_python import HawkeyeClient, InsCompany
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, AsyncHawkeyeClient, APIError, InsCompany, TransportSettings
+from hawkeye_sdk_for_python.search import InsCompanyIndex, normalize_name
 
 
 class TestInsCompaniesModule(unittest.TestCase):
@@ -324,5 +330,248 @@ class TestInsCompaniesModule(unittest.TestCase):
         mock_get.assert_called_once_with("/inscompanies?q=test&limit=5")
 
 
+
+COMPANY_LIST = [
+    {"id": 1, "name": "State Farm Insurance"},
+    {"id": 2, "name": "Allstate Insurance Company"},
+    {"id": 3, "name": "GEICO"},
+    {"id": 4, "name": "Progressive Insurance"},
+    {"id": 5, "name": "Liberty Mutual Insurance"},
+    {"id": 6, "name": "Farmers Insurance"},
+]
+
+
+class TestLocalInsCompanyIndex(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+        self.companies = list(COMPANY_LIST)
+        self.release = threading.Event()
+        self.release.set()
+
+        def handler(request):
+            self.requests.append(dict(request.url.params))
+            self.release.wait(5)
+            return httpx.Response(200, json={"data": self.companies})
+
+        self.client = HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(handler)),
+        )
+
+    def wait_for_refresh(self):
+        deadline = time.monotonic() + 5
+        while self.client.inscompanies._local_index_refreshing and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_normalize_name(self):
+        """Test that punctuation and case do not affect matching."""
+        self.assertEqual(normalize_name("  State-Farm, Inc. "), "state farm inc")
+
+    def test_index_ranks_best_match_first(self):
+        """Test fuzzy ranking, including typos and partially typed names."""
+        index = InsCompanyIndex(InsCompany(**item) for item in COMPANY_LIST)
+
+        self.assertEqual(index.search("state farm")[0].id, 1)
+        self.assertEqual(index.search("prog")[0].id, 4)
+        self.assertEqual(index.search("libert mutul")[0].id, 5)
+        self.assertEqual(index.search("GEICO")[0].probability, 100)
+        self.assertEqual(index.search("xyzzy"), [])
+        self.assertEqual(index.search(""), [])
+
+    def test_scores_are_descending_and_limited(self):
+        """Test that results are ordered by probability and respect the limit."""
+        index = InsCompanyIndex(InsCompany(**item) for item in COMPANY_LIST)
+
+        results = index.search("insurance", limit=3)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual([r.probability for r in results], sorted((r.probability for r in results), reverse=True))
+        self.assertTrue(all(0 < r.probability <= 100 for r in results))
+
+    def test_local_mode_answers_without_round_trips(self):
+        """Test that after enabling the index, queries never hit the server."""
+        self.client.inscompanies.enable_local_index(refresh_interval=None)
+
+        for prefix in ("f", "fa", "far", "farm", "farme"):
+            results = self.client.inscompanies.get_insurance_companies(query=prefix, limit=30)
+        everything = self.client.inscompanies.get_insurance_companies()
+
+        self.assertEqual(self.requests, [{}])
+        self.assertEqual(results[0].name, "Farmers Insurance")
+        self.assertIsInstance(results[0], InsCompany)
+        self.assertEqual(len(everything), 6)
+
+    def test_background_refresh_when_stale(self):
+        """Test that a stale index is reloaded in the background while the old one keeps serving."""
+        self.client.inscompanies.enable_local_index(refresh_interval=0)
+        self.companies.append({"id": 7, "name": "Travelers"})
+
+        first = self.client.inscompanies.get_insurance_companies(query="travelers")
+        deadline = time.monotonic() + 5
+        while self.client.inscompanies._local_index_refreshing and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.client.inscompanies._local_index_refresh_interval = None
+        second = self.client.inscompanies.get_insurance_companies(query="travelers")
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertNotEqual(first[:1], [InsCompany(id=7, name="Travelers", probability=100)])
+        self.assertEqual(second[0], InsCompany(id=7, name="Travelers", probability=100))
+
+    def test_disable_local_index(self):
+        """Test that disabling the index sends queries to the server again."""
+        self.client.inscompanies.enable_local_index()
+        self.client.inscompanies.disable_local_index()
+        self.client.inscompanies.get_insurance_companies(query="geico")
+
+        self.assertEqual(self.requests, [{}, {"q": "geico", "limit": "5"}])
+
+    def test_disable_wins_over_background_refresh(self):
+        """Test that a reload still running when the index is disabled does not turn local mode back on."""
+        self.client.inscompanies.enable_local_index(refresh_interval=0)
+        self.release.clear()
+
+        self.client.inscompanies.get_insurance_companies(query="geico")
+        self.client.inscompanies.disable_local_index()
+        self.release.set()
+        self.wait_for_refresh()
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertIsNone(self.client.inscompanies.local_index)
+
+    def test_concurrent_queries_start_one_refresh(self):
+        """Test that threads finding the index stale together start a single background reload."""
+        self.client.inscompanies.enable_local_index(refresh_interval=0)
+        self.release.clear()
+
+        barrier = threading.Barrier(8)
+
+        def query():
+            barrier.wait(5)
+            self.client.inscompanies.get_insurance_companies(query="geico")
+        threads = [threading.Thread(target=query) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.release.set()
+        self.wait_for_refresh()
+
+        self.assertEqual(len(self.requests), 2)
+
+    def test_async_local_index(self):
+        """Test local index mode on the async client."""
+        async def handler(request):
+            self.requests.append(dict(request.url.params))
+            return httpx.Response(200, json={"data": self.companies})
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+            ) as client:
+                await client.inscompanies.enable_local_index()
+                return await client.inscompanies.get_insurance_companies(query="alstate")
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results[0].id, 2)
+        self.assertEqual(self.requests, [{}])
+
+
+class TestResolveMany(unittest.TestCase):
+    def setUp(self):
+        self.queries = []
+
+        def handler(request):
+            query = request.url.params["q"]
+            self.queries.append(query)
+            if query == "boom":
+                return httpx.Response(500, json={"message": "down"})
+            index = InsCompanyIndex(InsCompany(**item) for item in COMPANY_LIST)
+            matches = index.search(query, int(request.url.params["limit"]))
+            return httpx.Response(200, json={"suggestions": [
+                {"id": match.id, "name": match.name, "probability": match.probability} for match in matches
+            ]})
+
+        self.handler = handler
+        self.client = HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(handler)),
+        )
+
+    def test_dedupes_normalised_names(self):
+        """Test that spelling variants of one name are looked up once and results keep input order."""
+        resolved = self.client.inscompanies.resolve_many(["State Farm", "state-farm", "GEICO", "", "  STATE FARM  "])
+
+        self.assertEqual([result.value and result.value.id for result in resolved], [1, 1, 3, None, 1])
+        self.assertEqual([result.item for result in resolved][:2], ["State Farm", "state-farm"])
+        self.assertEqual(sorted(self.queries), ["geico", "state farm"])
+        self.assertEqual(resolved[2].value.probability, 100)
+
+    def test_memoizes_between_batches(self):
+        """Test that a second batch only looks up names it has not seen."""
+        self.client.inscompanies.resolve_many(["geico", "progressive"])
+        self.client.inscompanies.resolve_many(["Geico", "Allstate"])
+        self.client.inscompanies.clear_resolved_names()
+        self.client.inscompanies.resolve_many(["geico"])
+
+        self.assertEqual(sorted(self.queries), ["allstate", "geico", "geico", "progressive"])
+
+    def test_min_probability(self):
+        """Test that weak and missing matches resolve to None."""
+        resolved = self.client.inscompanies.resolve_many(["geico", "libert mutul", "xyzzy"], min_probability=90)
+
+        self.assertEqual(resolved[0].value.id, 3)
+        self.assertIsNone(resolved[1].value)
+        self.assertIsNone(resolved[2].value)
+        self.assertTrue(all(result.ok for result in resolved))
+
+    def test_failure_keeps_successful_lookups(self):
+        """Test that a failed lookup is reported on its names while the other names resolve and are memoized."""
+        geico, boom, again = self.client.inscompanies.resolve_many(["geico", "boom", "BOOM"])
+
+        self.assertEqual(geico.value.id, 3)
+        self.assertFalse(boom.ok)
+        self.assertIsInstance(boom.error, APIError)
+        self.assertIs(again.error, boom.error)
+        self.assertEqual((boom.index, again.index), (1, 2))
+        self.queries.clear()
+
+        geico, boom = self.client.inscompanies.resolve_many(["geico", "boom"])
+        self.assertTrue(geico.ok)
+        self.assertIsInstance(boom.error, APIError)
+        self.assertEqual(self.queries, ["boom"])
+
+    def test_uses_local_index(self):
+        """Test that names are matched in-process when the local index is enabled."""
+        client = HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"data": COMPANY_LIST})
+            )),
+        )
+        client.inscompanies.enable_local_index(refresh_interval=None)
+
+        resolved = client.inscompanies.resolve_many(["Progresive", "farmers"])
+
+        self.assertEqual([result.value.id for result in resolved], [4, 6])
+
+    def test_async_resolve_many(self):
+        """Test resolve_many on the async client."""
+        async def handler(request):
+            return self.handler(request)
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+            ) as client:
+                return await client.inscompanies.resolve_many(["Allstate", "allstate", "geico"], max_concurrency=2)
+
+        resolved = asyncio.run(run())
+
+        self.assertEqual([result.value.id for result in resolved], [2, 2, 3])
+        self.assertEqual(sorted(self.queries), ["allstate", "geico"])
+
 if __name__ == "__main__":
     unittest.main()
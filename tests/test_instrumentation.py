@@ -0,0 +1,231 @@
+import unittest
+import asyncio
+import json
+
+import httpx
+
+from hawkeye_sdk_for_python import (
+    HawkeyeClient,
+    AsyncHawkeyeClient,
+    APIError,
+    MetricsCollector,
+    OpenTelemetryHook,
+    ResponseCache,
+    RetryPolicy,
+    TransportSettings,
+)
+
+from helpers import client_for
+
+CLAIMS = [{"filenumber": n, "rentername": f"Renter {n}", "insurancecompany": "GEICO"} for n in range(20)]
+
+
+class FakeApi:
+    """Stand-in for the API that answers claim reads and writes, failing the first `failures` requests with 503."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+
+    def __call__(self, request):
+        if self.failures:
+            self.failures -= 1
+            return httpx.Response(503, json={"message": "Service unavailable"})
+        path = request.url.path
+        if path == "/api/getclaims/404":
+            return httpx.Response(404, json={"message": "Not found"})
+        if path.startswith("/api/getclaims/all/"):
+            return httpx.Response(200, json=CLAIMS)
+        if path.startswith("/api/getclaims/"):
+            return httpx.Response(200, json=[CLAIMS[0]])
+        return httpx.Response(200, json={"filenumber": json.loads(request.content)["filenumber"], "message": "ok", "error": 0, "success": True})
+
+
+class TestRequestEvents(unittest.TestCase):
+    def test_read_event(self):
+        """Test that a read reports its operation, endpoint, status, bytes and decode/typing time."""
+        events = []
+        client = client_for(FakeApi(), hooks=[events.append])
+
+        client.claims.get_claims()
+
+        (event,) = events
+        self.assertEqual(event.operation, "claims.get_claims")
+        self.assertEqual((event.endpoint, event.method, event.status_code), ("/getclaims", "GET", 200))
+        self.assertEqual((event.requests, event.retries, event.bytes_sent), (1, 0, 0))
+        self.assertEqual(event.bytes_received, len(httpx.Response(200, json=CLAIMS).content))
+        self.assertGreater(event.decode_seconds, 0)
+        self.assertGreater(event.typing_seconds, 0)
+        self.assertGreaterEqual(event.duration, event.decode_seconds + event.typing_seconds)
+        self.assertTrue(event.ok)
+
+    def test_write_event_counts_request_body(self):
+        """Test that a write reports the bytes of its request body."""
+        events = []
+        client = client_for(FakeApi(), hooks=[events.append])
+
+        client.claims.update_claim(filenumber=1, note="x" * 100)
+
+        self.assertEqual(events[0].operation, "claims.update_claim")
+        self.assertEqual(events[0].endpoint, "/updateclaim")
+        self.assertGreater(events[0].bytes_sent, 100)
+
+    def test_retries_are_counted(self):
+        """Test that retried attempts are reported on one event with the final status."""
+        events = []
+        client = client_for(FakeApi(failures=2), hooks=[events.append], retry_policy=RetryPolicy(backoff_factor=0, jitter=False))
+
+        client.claims.get_single_claim(1)
+
+        self.assertEqual((events[0].requests, events[0].retries, events[0].status_code), (1, 2, 200))
+
+    def test_error_event(self):
+        """Test that a failing call is reported with its exception and the exception still propagates."""
+        events = []
+        client = client_for(FakeApi(), hooks=[events.append])
+
+        with self.assertRaises(APIError):
+            client.claims.get_single_claim(404)
+
+        self.assertEqual(events[0].status_code, 404)
+        self.assertIsInstance(events[0].error, APIError)
+        self.assertFalse(events[0].ok)
+
+    def test_cache_hit_makes_no_request(self):
+        """Test that a call answered from the cache is reported with requests == 0."""
+        events = []
+        client = client_for(FakeApi(), hooks=[events.append], cache=ResponseCache())
+
+        client.claims.get_single_claim(1)
+        client.claims.get_single_claim(1)
+
+        self.assertEqual([event.requests for event in events], [1, 0])
+        self.assertIsNone(events[1].endpoint)
+
+    def test_streamed_read_is_reported_when_exhausted(self):
+        """Test that iter_claims is reported once, after the last claim has been yielded."""
+        events = []
+        client = client_for(FakeApi(), hooks=[events.append])
+
+        claims = client.claims.iter_claims()
+        next(claims)
+        self.assertEqual(events, [])
+        self.assertEqual(sum(1 for _ in claims), len(CLAIMS) - 1)
+
+        self.assertEqual(events[0].operation, "claims.iter_claims")
+        self.assertGreater(events[0].typing_seconds, 0)
+
+    def test_failing_hook_is_ignored(self):
+        """Test that an exception raised by a hook is logged and does not affect the call or later hooks."""
+        events = []
+
+        def broken(event):
+            raise RuntimeError("hook failed")
+
+        client = client_for(FakeApi(), hooks=[broken, events.append])
+
+        with self.assertLogs("hawkeye_sdk_for_python.instrumentation", level="ERROR"):
+            claim = client.claims.get_single_claim(1)
+
+        self.assertEqual(claim.filenumber, 0)
+        self.assertEqual(len(events), 1)
+
+    def test_disabled_by_default(self):
+        """Test that clients without hooks keep the plain transport."""
+        client = HawkeyeClient("test-auth-token")
+
+        self.assertIsInstance(client._http_client._transport, httpx.HTTPTransport)
+
+    def test_async_events(self):
+        """Test that AsyncHawkeyeClient reports coroutine and async generator calls."""
+        events = []
+        api = FakeApi()
+
+        async def handler(request):
+            return api(request)
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+                hooks=[events.append],
+            ) as client:
+                await client.claims.get_single_claim(1)
+                async for _ in client.claims.iter_claims():
+                    pass
+
+        asyncio.run(run())
+
+        self.assertEqual([event.operation for event in events], ["claims.get_single_claim", "claims.iter_claims"])
+        self.assertEqual([event.requests for event in events], [1, 1])
+        self.assertEqual(events[0].endpoint, "/getclaims")
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def test_counts_and_renders(self):
+        """Test that calls, errors and bytes are counted per operation and rendered in Prometheus text format."""
+        metrics = MetricsCollector()
+        client = client_for(FakeApi(), hooks=[metrics])
+
+        client.claims.get_single_claim(1)
+        client.claims.get_single_claim(1)
+        with self.assertRaises(APIError):
+            client.claims.get_single_claim(404)
+
+        self.assertEqual(metrics.value("calls_total", operation="claims.get_single_claim", endpoint="/getclaims", status="200"), 2)
+        self.assertEqual(metrics.value("errors_total", operation="claims.get_single_claim"), 1)
+        self.assertEqual(metrics.value("requests_total", operation="claims.get_single_claim"), 3)
+        text = metrics.render()
+        self.assertIn("# TYPE hawkeye_call_duration_seconds histogram", text)
+        self.assertIn('hawkeye_call_duration_seconds_count{operation="claims.get_single_claim"} 3', text)
+        self.assertIn('hawkeye_call_duration_seconds_bucket{operation="claims.get_single_claim",le="+Inf"} 3', text)
+
+        metrics.reset()
+        self.assertEqual(metrics.render(), "")
+
+
+class TestOpenTelemetryHook(unittest.TestCase):
+    def setUp(self):
+        try:
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+            from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+            from opentelemetry.sdk.metrics import MeterProvider
+            from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+        except ImportError:
+            self.skipTest("opentelemetry-sdk is not installed")
+
+        self.exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[self.reader])
+        self.hook = OpenTelemetryHook(tracer=tracer_provider.get_tracer("test"), meter=meter_provider.get_meter("test"))
+
+    def test_spans_and_metrics(self):
+        """Test that each call becomes a CLIENT span with HTTP attributes and is recorded in the duration histogram."""
+        from opentelemetry.trace import SpanKind, StatusCode
+
+        client = client_for(FakeApi(), hooks=[self.hook])
+        client.claims.get_single_claim(1)
+        with self.assertRaises(APIError):
+            client.claims.get_single_claim(404)
+
+        ok, failed = self.exporter.get_finished_spans()
+        self.assertEqual((ok.name, ok.kind), ("claims.get_single_claim", SpanKind.CLIENT))
+        self.assertEqual(ok.attributes["http.response.status_code"], 200)
+        self.assertEqual(ok.attributes["hawkeye.endpoint"], "/getclaims")
+        self.assertLessEqual(ok.start_time, ok.end_time)
+        self.assertEqual(failed.status.status_code, StatusCode.ERROR)
+        self.assertEqual(failed.attributes["error.type"], "APIResourceNotFoundError")
+
+        metric_names = {
+            metric.name
+            for resource in self.reader.get_metrics_data().resource_metrics
+            for scope in resource.scope_metrics
+            for metric in scope.metrics
+        }
+        self.assertIn("hawkeye.client.call.duration", metric_names)
+
+
+if __name__ == "__main__":
+    unittest.main()
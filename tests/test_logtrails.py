@@ -1,9 +1,14 @@
 import unittest
 from unittest.mock import patch, Mock
+import asyncio
 import json
+import queue
+import threading
 from datetime import datetime
 
-from hawkeye_sdk_for_python import HawkeyeClient
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, AsyncHawkeyeClient, APIError, TransportSettings, WriteBehindQueue, AsyncWriteBehindQueue
 from hawkeye_sdk_for_python.types import ApiResponse
 
 
@@ -392,5 +397,157 @@ class TestLogtrailsModule(unittest.TestCase):
         )
 
 
+class TestWriteBehind(unittest.TestCase):
+    def setUp(self):
+        self.posted = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.release = threading.Event()
+        self.release.set()
+
+        def handler(request):
+            body = json.loads(request.content)
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.release.wait(5)
+            with self.lock:
+                self.in_flight -= 1
+                self.posted.append(body)
+            if body["activity"] == "fail":
+                return httpx.Response(500, json={"message": "down"})
+            return httpx.Response(200, json={"message": "Log trail entry created", "success": True, "error": 0})
+
+        self.handler = handler
+        self.client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(handler)))
+
+    def test_entries_are_queued_and_flushed(self):
+        """Test that create_log_trail returns immediately and flush waits for every entry."""
+        self.release.clear()
+        self.client.logtrails.enable_write_behind(max_concurrency=3)
+
+        results = [self.client.logtrails.create_log_trail(n, f"Step {n}") for n in range(20)]
+        self.assertLess(len(self.posted), 20)
+        self.release.set()
+
+        self.assertTrue(self.client.logtrails.flush(timeout=5))
+        self.assertEqual(results, [None] * 20)
+        self.assertEqual(sorted(body["filenumber"] for body in self.posted), list(range(20)))
+        self.assertLessEqual(self.max_in_flight, 3)
+        self.assertEqual(self.client.logtrails.write_behind.sent, 20)
+        self.assertEqual(self.posted[0]["date"], datetime.now().strftime("%m/%d/%Y"))
+
+    def test_failures_reach_on_error(self):
+        """Test that failed entries are reported to the callback and do not stop the queue."""
+        errors = []
+        self.client.logtrails.enable_write_behind(on_error=lambda payload, exc: errors.append((payload["filenumber"], exc)))
+
+        self.client.logtrails.create_log_trail(1, "fail")
+        self.client.logtrails.create_log_trail(2, "ok")
+        self.client.logtrails.flush()
+
+        self.assertEqual(len(self.posted), 2)
+        self.assertEqual([filenumber for filenumber, _ in errors], [1])
+        self.assertIsInstance(errors[0][1], APIError)
+        self.assertEqual(self.client.logtrails.write_behind.failed, 1)
+
+    def test_back_pressure_when_full(self):
+        """Test that put blocks, and times out, once the queue is full."""
+        self.release.clear()
+        started = threading.Event()
+
+        def send(item):
+            started.set()
+            self.release.wait(5)
+        write_behind = WriteBehindQueue(send, max_queue_size=1, max_concurrency=1)
+
+        write_behind.put(1)
+        started.wait(5)
+        write_behind.put(2)
+        with self.assertRaises(queue.Full):
+            write_behind.put(3, timeout=0.05)
+        self.release.set()
+
+        self.assertTrue(write_behind.close(timeout=5))
+        with self.assertRaises(RuntimeError):
+            write_behind.put(4)
+
+    def test_close_timeout_keeps_sending(self):
+        """Test that items still queued when close times out are sent in the background, then the workers stop."""
+        self.release.clear()
+        sent = []
+
+        def send(item):
+            self.release.wait(5)
+            sent.append(item)
+        write_behind = WriteBehindQueue(send, max_concurrency=2)
+        for n in range(5):
+            write_behind.put(n)
+
+        self.assertFalse(write_behind.close(timeout=0.01))
+        self.release.set()
+
+        self.assertTrue(write_behind.flush(timeout=5))
+        self.assertEqual(sorted(sent), list(range(5)))
+        for worker in write_behind._workers:
+            worker.join(5)
+            self.assertFalse(worker.is_alive())
+
+    def test_async_close_timeout_keeps_sending(self):
+        """Test that the async queue also keeps sending after a close timeout instead of dropping the items."""
+        sent = []
+
+        async def run():
+            release = asyncio.Event()
+
+            async def send(item):
+                await release.wait()
+                sent.append(item)
+            write_behind = AsyncWriteBehindQueue(send, max_concurrency=2)
+            for n in range(5):
+                await write_behind.put(n)
+
+            self.assertFalse(await write_behind.close(timeout=0.01))
+            release.set()
+            self.assertTrue(await write_behind.flush(timeout=5))
+            await asyncio.wait_for(asyncio.gather(*write_behind._workers, return_exceptions=True), 5)
+
+        asyncio.run(run())
+
+        self.assertEqual(sorted(sent), list(range(5)))
+
+    def test_close_drains_queue(self):
+        """Test that closing the client posts buffered entries first and sends later ones synchronously."""
+        self.client.logtrails.enable_write_behind()
+        for n in range(5):
+            self.client.logtrails.create_log_trail(n, "Closing")
+
+        self.client.close()
+
+        self.assertEqual(len(self.posted), 5)
+        self.assertIsNone(self.client.logtrails.write_behind)
+
+    def test_async_write_behind(self):
+        """Test write-behind mode on the async client."""
+        async def handler(request):
+            return self.handler(request)
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+            ) as client:
+                await client.logtrails.enable_write_behind(max_queue_size=2, max_concurrency=2)
+                for n in range(6):
+                    self.assertIsNone(await client.logtrails.create_log_trail(n, "Async step"))
+            return client
+
+        client = asyncio.run(run())
+
+        self.assertEqual(sorted(body["filenumber"] for body in self.posted), list(range(6)))
+        self.assertIsNone(client.logtrails.write_behind)
+
+
 if __name__ == '__main__':
     unittest.main()
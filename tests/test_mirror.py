@@ -0,0 +1,224 @@
+import unittest
+import asyncio
+import copy
+import os
+import tempfile
+from types import SimpleNamespace
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, AsyncHawkeyeClient, ClaimsMirror, TransportSettings, DocType
+from hawkeye_sdk_for_python.mirror import record_hash
+from hawkeye_sdk_for_python.utils import type_claim
+
+
+def portal_claim(filenumber, **overrides):
+    claim = {
+        "filenumber": filenumber,
+        "rentername": f"Renter {filenumber}",
+        "insurancecompany": "GEICO",
+        "estimateamount": 1000.0 + filenumber,
+        "totalloss": filenumber % 2 == 0,
+        "vehyear": 2020,
+        "docfiles": [{"doctype": "Invoice", "filename": f"{filenumber}.pdf", "user": "api"}],
+        "logtrail": [{"date": "01/01/2025", "activity": "Opened", "user": "api"}],
+    }
+    claim.update(overrides)
+    return claim
+
+
+class TestClaimsMirror(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.mirror = ClaimsMirror(os.path.join(self.directory.name, "mirror.db"))
+        self.portal = [portal_claim(n) for n in range(1, 6)]
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request.url.path)
+            if request.url.path.startswith("/api/getclaims/all/"):
+                return httpx.Response(200, json=self.portal)
+            filenumber = int(request.url.path.rsplit("/", 1)[1])
+            return httpx.Response(200, json=[claim for claim in self.portal if claim["filenumber"] == filenumber])
+
+        self.handler = handler
+        self.client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(handler)))
+
+    def tearDown(self):
+        self.mirror.close()
+        self.directory.cleanup()
+
+    def test_initial_sync_round_trips_claims(self):
+        """Test that a first sync stores claims and their children faithfully."""
+        stats = self.mirror.sync(self.client)
+
+        self.assertEqual((stats.inserted, stats.updated, stats.unchanged, stats.deleted), (5, 0, 0, 0))
+        self.assertEqual(self.requests, ["/api/getclaims/all/true"])
+        self.assertEqual(len(self.mirror), 5)
+        self.assertEqual(self.mirror.get(2), type_claim(self.portal[1]))
+        self.assertIs(self.mirror.get(2).totalloss, True)
+        self.assertEqual(self.mirror.get(3).docfiles[0].doctype, DocType.INVOICE)
+        self.assertIsNone(self.mirror.get(99))
+
+    def test_incremental_sync_only_rewrites_changes(self):
+        """Test that unchanged claims are skipped and changed, new and vanished claims are applied."""
+        self.mirror.sync(self.client)
+        self.portal[0]["estimateamount"] = 5.0
+        self.portal[1]["logtrail"].append({"date": "02/01/2025", "activity": "Closed", "user": "api"})
+        self.portal.pop()
+        self.portal.append(portal_claim(9))
+
+        stats = self.mirror.sync(self.client)
+
+        self.assertEqual((stats.inserted, stats.updated, stats.unchanged, stats.deleted), (1, 2, 2, 1))
+        self.assertEqual(self.mirror.get(1).estimateamount, 5.0)
+        self.assertEqual([entry.activity for entry in self.mirror.get(2).logtrail], ["Opened", "Closed"])
+        self.assertIsNone(self.mirror.get(5))
+        self.assertEqual([claim.filenumber for claim in self.mirror.claims()], [1, 2, 3, 4, 9])
+
+    def test_active_only_sync_does_not_prune(self):
+        """Test that claims missing from an active-only pull are kept."""
+        self.mirror.sync(self.client)
+        self.portal.pop()
+
+        stats = self.mirror.sync(self.client, include_inactive=False)
+
+        self.assertEqual(stats.deleted, 0)
+        self.assertEqual(len(self.mirror), 5)
+
+    def test_sync_claim_and_query(self):
+        """Test refreshing one claim and running SQL against the mirror."""
+        self.mirror.sync(self.client)
+        self.portal[2]["insurancecompany"] = "Progressive"
+
+        stats = self.mirror.sync_claim(self.client, 3)
+        rows = self.mirror.query(
+            "SELECT insurancecompany, COUNT(*) AS claims, SUM(estimateamount) AS total FROM claims GROUP BY insurancecompany ORDER BY insurancecompany"
+        )
+
+        self.assertEqual(stats.updated, 1)
+        self.assertEqual([(row["insurancecompany"], row["claims"]) for row in rows], [("GEICO", 4), ("Progressive", 1)])
+        self.assertEqual(rows[1]["total"], 1003.0)
+
+    def test_record_hash_detects_child_changes(self):
+        """Test that the hash covers documents and log entries, not just claim fields."""
+        original = type_claim(self.portal[0])
+        changed = copy.deepcopy(self.portal[0])
+        changed["docfiles"][0]["notes"] = "Updated"
+
+        self.assertEqual(record_hash(original), record_hash(type_claim(copy.deepcopy(self.portal[0]))))
+        self.assertNotEqual(record_hash(original), record_hash(type_claim(changed)))
+        self.assertEqual(record_hash(original), record_hash(type_claim(self.portal[0], compact=True)))
+
+    def test_failed_sync_rolls_back(self):
+        """Test that an error part-way through a sync leaves the mirror unchanged."""
+        self.mirror.sync(self.client)
+        self.portal[0]["estimateamount"] = 1.0
+        self.portal.append("not a claim")
+
+        with self.assertRaises(Exception):
+            self.mirror.sync(self.client)
+
+        self.assertEqual(self.mirror.get(1).estimateamount, 1001.0)
+
+    def test_claims_without_filenumber_are_skipped(self):
+        """Test that a claim with no filenumber is counted as skipped instead of aborting the sync."""
+        self.portal.append({**portal_claim(6), "filenumber": None})
+
+        stats = self.mirror.sync(self.client)
+
+        self.assertEqual((stats.inserted, stats.skipped), (5, 1))
+        self.assertEqual(len(self.mirror), 5)
+
+    def test_sync_releases_the_lock_between_pages(self):
+        """Test that reads are not blocked while sync waits for the next claims from the API."""
+        self.mirror.sync(self.client)
+        probes = []
+
+        def iter_claims(include_inactive):
+            for n, claim in enumerate(self.portal):
+                if n == 2:
+                    # Same thread as the sync, so probe without blocking: a held lock would deadlock here.
+                    if self.mirror._lock.acquire(blocking=False):
+                        self.mirror._lock.release()
+                        probes.append(len(self.mirror))
+                yield type_claim(claim)
+        client = SimpleNamespace(claims=SimpleNamespace(iter_claims=iter_claims))
+
+        stats = self.mirror.sync(client)
+
+        self.assertEqual(probes, [5])
+        self.assertEqual(stats.unchanged, 5)
+
+    def test_async_sync(self):
+        """Test syncing through AsyncHawkeyeClient."""
+        async def handler(request):
+            return self.handler(request)
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+            ) as client:
+                return await self.mirror.async_sync(client)
+
+        stats = asyncio.run(run())
+
+        self.assertEqual(stats.inserted, 5)
+        self.assertEqual(self.mirror.get(5).rentername, "Renter 5")
+
+    def test_reads_during_async_sync_do_not_block_the_loop(self):
+        """Test that another task can read the mirror while an async sync waits on the API."""
+        self.mirror.sync(self.client)
+        seen = []
+
+        async def run():
+            read_done = asyncio.Event()
+
+            async def handler(request):
+                await read_done.wait()
+                return self.handler(request)
+
+            async def reader():
+                await asyncio.sleep(0)
+                # Probe with a timeout so a regression fails the test instead of hanging the event loop.
+                if self.mirror._lock.acquire(timeout=5):
+                    self.mirror._lock.release()
+                    seen.append((len(self.mirror), self.mirror.get(1).rentername))
+                read_done.set()
+
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+            ) as client:
+                stats, _ = await asyncio.gather(self.mirror.async_sync(client), reader())
+                return stats
+
+        stats = asyncio.run(run())
+
+        self.assertEqual(seen, [(5, "Renter 1")])
+        self.assertEqual(stats.unchanged, 5)
+
+    def test_string_filenumbers_are_matched_on_resync(self):
+        """Test that filenumbers sent as strings match the stored integer keys instead of being re-inserted and pruned."""
+        self.portal = [{**portal_claim(n), "filenumber": str(n)} for n in range(1, 4)]
+
+        self.mirror.sync(self.client)
+        stats = self.mirror.sync(self.client)
+
+        self.assertEqual((stats.inserted, stats.unchanged, stats.deleted), (0, 3, 0))
+        self.assertEqual(len(self.mirror), 3)
+
+    def test_date_valued_flags_round_trip(self):
+        """Test that the dates the API sends in liabilityaccepted are read back as dates, not True."""
+        self.portal[0]["liabilityaccepted"] = "2025-02-19"
+
+        self.mirror.sync(self.client)
+
+        self.assertEqual(self.mirror.get(1).liabilityaccepted, "2025-02-19")
+        self.assertIsNone(self.mirror.get(2).liabilityaccepted)
+        self.assertIs(self.mirror.get(2).totalloss, True)
+
+
+if __name__ == "__main__":
+    unittest.main()
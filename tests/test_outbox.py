@@ -0,0 +1,250 @@
+import unittest
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, AsyncHawkeyeClient, Outbox, TransportSettings, DocType, ClientSettings
+from hawkeye_sdk_for_python.modules import OutboxModule
+
+from helpers import FakeClock
+
+
+NEW_CLAIM = dict(
+    rentername="Jane Doe", inscompaniesid="1", dateofloss="01/02/2025",
+    vehmake="Ford", vehmodel="Transit", vehcolor="White", vehvin="1FTBW3XM6HKA12345",
+)
+
+
+class RecordingApi:
+    """Accepts every write, unless a status is scripted for its url, and records what it received."""
+
+    def __init__(self):
+        self.requests = []
+        self.statuses = {}
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        self.requests.append((request.url.path, request.headers.get("Idempotency-Key"), body))
+        status = self.statuses.get(request.url.path, 200)
+        # Like the API, /createclaim answers with the filenumber it assigned.
+        filenumber = "24111756" if request.url.path == "/api/createclaim" else str(body.get("filenumber", ""))
+        return httpx.Response(status, json={
+            "filenumber": filenumber, "message": "ok" if status == 200 else "failed", "error": 0, "success": status == 200,
+        })
+
+    def paths(self):
+        return [path for path, _, _ in self.requests]
+
+
+class TestOutbox(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "outbox.db")
+        self.clock = FakeClock(1000.0)
+        self.outbox = Outbox(self.path, backoff_factor=10, clock=self.clock)
+        self.api = RecordingApi()
+        self.module = OutboxModule(
+            httpx.Client(base_url="https://example.com/api", transport=httpx.MockTransport(self.api)),
+            ClientSettings(auth_token="test-auth-token", dev_env=False, base_url="https://example.com/api", outbox=self.outbox),
+        )
+
+    def tearDown(self):
+        self.outbox.close()
+        self.directory.cleanup()
+
+    def test_writes_are_durable_before_sending(self):
+        """Test that queued writes survive reopening the database and are replayed with their keys."""
+        key = self.module.update_claim(filenumber=12345, note="Reviewed")
+        self.module.create_log_trail(file_number=12345, activity="Reviewed", date="01/02/2025")
+        self.module.upload_file(filenumber=12345, fileurl="https://example.com/a.pdf", category=DocType.INVOICE)
+        self.outbox.close()
+
+        self.outbox = Outbox(self.path, clock=self.clock)
+        self.module._settings.outbox = self.outbox
+        self.assertEqual(len(self.outbox), 3)
+        self.assertEqual(self.module.drain(), 3)
+
+        self.assertEqual(self.api.paths(), ["/api/updateclaim", "/api/createLogTrailEntry", "/api/savefile"])
+        self.assertEqual(self.api.requests[0][1:], (key, {"filenumber": 12345, "note": "Reviewed"}))
+        self.assertEqual(self.api.requests[2][2]["category"], "Invoice")
+        self.assertEqual(len(self.outbox), 0)
+
+    def test_duplicate_idempotency_key_is_ignored(self):
+        """Test that queuing the same key twice sends the write once."""
+        self.module.create_log_trail(idempotency_key="step-1", file_number=1, activity="Opened")
+        self.module.create_log_trail(idempotency_key="step-1", file_number=1, activity="Opened")
+
+        self.module.drain()
+
+        self.assertEqual(len(self.api.requests), 1)
+
+    def test_invalid_arguments_fail_at_enqueue(self):
+        """Test that arguments are checked against the module signature before anything is stored."""
+        with self.assertRaises(TypeError):
+            self.module.create_claim(rentername="Jane", vehcolour="Red")
+        with self.assertRaises(TypeError):
+            self.module.update_claim(note="no filenumber")
+
+        self.assertEqual(len(self.outbox), 0)
+
+    def test_outage_is_retried_with_backoff(self):
+        """Test that retryable failures are rescheduled and later writes to the claim wait their turn."""
+        self.api.statuses["/api/updateclaim"] = 503
+        self.module.update_claim(filenumber=1, note="first")
+        self.module.create_log_trail(file_number=1, activity="second")
+        self.module.create_log_trail(file_number=2, activity="other claim")
+
+        self.assertEqual(self.module.drain(), 0)
+        self.assertEqual(self.module.drain(), 1)
+        self.assertEqual(self.api.paths(), ["/api/updateclaim", "/api/createLogTrailEntry"])
+        self.assertEqual(self.api.requests[1][2]["filenumber"], 2)
+
+        del self.api.statuses["/api/updateclaim"]
+        self.clock.now += 10
+        self.assertEqual(self.module.drain(), 2)
+        self.assertEqual([body.get("note") or body["activity"] for _, _, body in self.api.requests[2:]], ["first", "second"])
+
+    def test_due_skips_held_claims_and_respects_limit(self):
+        """Test that due returns the first due entries in order, skipping claims behind an entry that is waiting."""
+        for n in range(6):
+            self.outbox.add("update_claim", "/updateclaim", {"n": n}, filenumber=n % 2)
+        waiting = self.outbox.entries()[1]
+        self.outbox.mark_failed(waiting, RuntimeError("down"), retryable=True)
+
+        due = self.outbox.due(limit=2)
+
+        self.assertEqual([entry.payload["n"] for entry in due], [0, 2])
+        self.assertEqual([entry.payload["n"] for entry in self.outbox.due()], [0, 2, 4])
+        self.clock.now += 10
+        self.assertEqual([entry.payload["n"] for entry in self.outbox.due()], list(range(6)))
+
+    def test_rejected_write_is_marked_dead(self):
+        """Test that a 4xx rejection is not retried, and dead entries can be requeued."""
+        self.api.statuses["/api/createclaim"] = 400
+        self.module.create_claim(rentername="Jane", inscompaniesid="1", dateofloss="01/01/2025",
+                                 vehmake="Ford", vehmodel="F-150", vehcolor="Red", vehvin="VIN")
+
+        self.assertTrue(self.module.flush(timeout=1))
+        dead = self.outbox.entries("dead")
+        self.assertEqual([entry.operation for entry in dead], ["create_claim"])
+        self.assertIn("400", dead[0].last_error)
+
+        del self.api.statuses["/api/createclaim"]
+        self.assertEqual(self.outbox.requeue_dead(), 1)
+        self.assertEqual(self.module.drain(), 1)
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_max_attempts(self):
+        """Test that a write is given up on after max_attempts retryable failures."""
+        self.outbox.max_attempts = 2
+        self.api.statuses["/api/savefile"] = 500
+        self.module.upload_file(filenumber=1, fileurl="https://example.com/a.pdf")
+
+        self.module.drain()
+        self.clock.now += 10
+        self.module.drain()
+
+        self.assertEqual(len(self.api.requests), 2)
+        self.assertEqual(len(self.outbox.entries("dead")), 1)
+
+
+class TestClientOutbox(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "outbox.db")
+        self.api = RecordingApi()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_background_drainer(self):
+        """Test that the client's drainer thread replays queued writes on its own."""
+        outbox = Outbox(self.path)
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(self.api)), outbox=outbox)
+
+        for n in range(5):
+            client.outbox.create_log_trail(file_number=n, activity="Intake")
+        deadline = time.monotonic() + 5
+        while len(outbox) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        client.close()
+        outbox.close()
+
+        self.assertEqual(len(self.api.requests), 5)
+
+    def test_assigned_filenumber_reaches_on_sent(self):
+        """Test that on_sent receives the API's response to a queued create_claim, including the new filenumber."""
+        sent = []
+        outbox = Outbox(self.path, on_sent=lambda entry, response: sent.append((entry.idempotency_key, response)))
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(self.api)), outbox=outbox)
+        client.outbox.stop()
+
+        key = client.outbox.create_claim(**NEW_CLAIM)
+        client.outbox.flush(timeout=5)
+        client.close()
+        outbox.close()
+
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(sent[0][0], key)
+        self.assertEqual(sent[0][1]["filenumber"], "24111756")
+
+    def test_failing_on_sent_does_not_block_delivery(self):
+        """Test that an exception in on_sent is logged and the entry is still removed."""
+        def on_sent(entry, response):
+            raise RuntimeError("callback failed")
+
+        outbox = Outbox(self.path, on_sent=on_sent)
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(self.api)), outbox=outbox)
+        client.outbox.stop()
+
+        client.outbox.update_claim(filenumber=1, note="x")
+        with self.assertLogs("hawkeye_sdk_for_python.modules.outbox", level="ERROR"):
+            client.outbox.drain()
+        client.close()
+
+        self.assertEqual(len(outbox), 0)
+        outbox.close()
+
+    def test_client_without_outbox(self):
+        """Test that client.outbox is only available when an outbox is configured."""
+        self.assertIsNone(HawkeyeClient("test-auth-token").outbox)
+
+    def test_module_without_outbox_raises(self):
+        """Test that an OutboxModule built without an outbox fails with a clear error."""
+        module = OutboxModule(httpx.Client(base_url="https://example.com/api"), None)
+
+        with self.assertRaisesRegex(RuntimeError, "No outbox is configured"):
+            module.update_claim(filenumber=1, note="x")
+
+    def test_async_outbox(self):
+        """Test queuing and flushing through AsyncHawkeyeClient."""
+        async def handler(request):
+            return self.api(request)
+
+        sent = []
+        outbox = Outbox(self.path, on_sent=lambda entry, response: sent.append(response["filenumber"]))
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+                outbox=outbox,
+            ) as client:
+                keys = [await client.outbox.update_claim(filenumber=n, note="Async") for n in range(3)]
+                keys.append(await client.outbox.create_claim(**NEW_CLAIM))
+                self.assertTrue(await client.outbox.flush(timeout=5))
+                return keys
+
+        keys = asyncio.run(run())
+        outbox.close()
+
+        self.assertEqual(sorted(key for _, key, _ in self.api.requests), sorted(keys))
+        self.assertEqual(sorted(sent), ["0", "1", "2", "24111756"])
+
+
+if __name__ == "__main__":
+    unittest.main()
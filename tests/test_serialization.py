@@ -0,0 +1,95 @@
+import unittest
+from unittest.mock import patch, Mock
+import importlib.util
+import json
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, Claim
+from hawkeye_sdk_for_python.serialization import JsonCodec, OrjsonCodec, MsgspecCodec, get_json_codec
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+HAS_MSGSPEC = importlib.util.find_spec("msgspec") is not None
+
+
+class TestJsonCodecs(unittest.TestCase):
+    def test_default_backend_is_stdlib(self):
+        """Test that the client uses the stdlib codec unless told otherwise."""
+        client = HawkeyeClient("test-auth-token")
+
+        self.assertEqual(client.settings.json_codec.name, "stdlib")
+
+    def test_auto_backend_prefers_installed_library(self):
+        """Test that auto picks orjson, then msgspec, then stdlib."""
+        expected = "orjson" if HAS_ORJSON else "msgspec" if HAS_MSGSPEC else "stdlib"
+
+        self.assertEqual(get_json_codec("auto").name, expected)
+
+    def test_auto_backend_falls_back_to_stdlib(self):
+        """Test that auto falls back to stdlib when no fast library can be imported."""
+        with patch.dict("sys.modules", {"orjson": None, "msgspec": None}):
+            self.assertEqual(get_json_codec("auto").name, "stdlib")
+
+    def test_missing_backend_raises_import_error(self):
+        """Test that explicitly requesting an uninstalled backend fails loudly."""
+        with patch.dict("sys.modules", {"orjson": None}):
+            with self.assertRaises(ImportError) as context:
+                HawkeyeClient("test-auth-token", json_backend="orjson")
+
+        self.assertIn("pip install orjson", str(context.exception))
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            get_json_codec("simplejson")
+
+    def test_stdlib_codec_uses_httpx_json(self):
+        """Test that the stdlib codec keeps httpx's json= handling."""
+        codec = JsonCodec()
+        response = Mock()
+        response.json.return_value = {"data": []}
+
+        self.assertEqual(codec.request_kwargs({"a": 1}), {"json": {"a": 1}})
+        self.assertEqual(codec.decode_response(response), {"data": []})
+
+    def _round_trip(self, backend: str):
+        seen = {}
+
+        def handler(request):
+            if request.url.path.endswith("/updateclaim"):
+                seen["content_type"] = request.headers["Content-Type"]
+                seen["body"] = json.loads(request.content)
+                return httpx.Response(200, json={"filenumber": "1", "message": "ok", "error": 0, "success": True})
+            return httpx.Response(200, json=[{"filenumber": 1, "vin": "VIN1", "docfiles": [{"doctype": "Invoice"}]}])
+
+        client = HawkeyeClient("test-auth-token", json_backend=backend)
+        client.claims._client = httpx.Client(
+            base_url=client.settings.base_url,
+            headers={"Content-Type": "application/json"},
+            transport=httpx.MockTransport(handler),
+        )
+
+        response = client.claims.update_claim(filenumber=1, note="Café")
+        claims = client.claims.get_claims()
+
+        self.assertEqual(seen["content_type"], "application/json")
+        self.assertEqual(seen["body"], {"filenumber": 1, "note": "Café"})
+        self.assertTrue(response["success"])
+        self.assertIsInstance(claims[0], Claim)
+        self.assertEqual(claims[0].vin, "VIN1")
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_orjson_round_trip(self):
+        """Test that requests and responses go through orjson."""
+        self.assertIsInstance(get_json_codec("orjson"), OrjsonCodec)
+        self._round_trip("orjson")
+
+    @unittest.skipUnless(HAS_MSGSPEC, "msgspec is not installed")
+    def test_msgspec_round_trip(self):
+        """Test that requests and responses go through msgspec."""
+        self.assertIsInstance(get_json_codec("msgspec"), MsgspecCodec)
+        self._round_trip("msgspec")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+import unittest
+import asyncio
+import threading
+import time
+
+import httpx
+
+from hawkeye_sdk_for_python import HawkeyeClient, AsyncHawkeyeClient, TransportSettings
+from hawkeye_sdk_for_python.exceptions import APIError
+from hawkeye_sdk_for_python.singleflight import SingleFlight, AsyncSingleFlight
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for condition")
+        time.sleep(0.001)
+
+
+class GatedApi:
+    """Holds every request until released, so callers pile up behind the first one."""
+
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.requests = []
+        self.release = threading.Event()
+
+    def __call__(self, request):
+        self.requests.append((request.url.path, dict(request.url.params)))
+        self.release.wait(5)
+        path = request.url.path
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"message": "Server error"})
+        if path.startswith("/api/getclaims/"):
+            return httpx.Response(200, json=[{"filenumber": int(path.rsplit("/", 1)[1])}])
+        return httpx.Response(200, json={"suggestions": [{"id": 1, "name": "GEICO", "probability": 90}]})
+
+
+class TestSingleFlight(unittest.TestCase):
+    def run_concurrently(self, client, call, count=10):
+        results, errors = [], []
+
+        def worker():
+            try:
+                results.append(call())
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        stats = client.settings.single_flight.stats
+        wait_for(lambda: stats.executed + stats.shared == count)
+        return threads, results, errors
+
+    def test_concurrent_claim_reads_share_one_request(self):
+        """Test that concurrent reads of one claim send a single request and share its result."""
+        api = GatedApi()
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(api)))
+
+        threads, results, errors = self.run_concurrently(client, lambda: client.claims.get_single_claim(7))
+        api.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(api.requests, [("/api/getclaims/7", {})])
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(client.settings.single_flight.stats.shared, 9)
+
+    def test_error_is_shared_with_waiting_callers(self):
+        """Test that every concurrent caller receives the error of the shared request."""
+        api = GatedApi(status_code=500)
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(api)))
+
+        threads, results, errors = self.run_concurrently(client, lambda: client.claims.get_single_claim(7), count=5)
+        api.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(api.requests), 1)
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 5)
+        self.assertTrue(all(isinstance(error, APIError) for error in errors))
+
+    def test_insurance_company_reads_return_separate_lists(self):
+        """Test that coalesced company searches share one request but each caller gets its own list."""
+        api = GatedApi()
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(api)))
+
+        threads, results, _ = self.run_concurrently(
+            client, lambda: client.inscompanies.get_insurance_companies("geico"), count=4
+        )
+        api.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(api.requests), 1)
+        self.assertEqual([[company.name for company in result] for result in results], [["GEICO"]] * 4)
+        self.assertIsNot(results[0], results[1])
+
+    def test_sequential_reads_are_not_coalesced(self):
+        """Test that a finished request is not reused by later callers."""
+        api = GatedApi()
+        api.release.set()
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(api)))
+
+        client.claims.get_single_claim(7)
+        client.claims.get_single_claim(7)
+        client.claims.get_single_claim("8")
+
+        self.assertEqual(len(api.requests), 3)
+
+    def test_can_be_disabled(self):
+        """Test that coalesce_reads=False leaves every call to make its own request."""
+        client = HawkeyeClient("test-auth-token", coalesce_reads=False)
+
+        self.assertIsNone(client.settings.single_flight)
+
+    def test_leader_exception_does_not_leak_key(self):
+        """Test that a failed call releases its key so the next call runs again."""
+        flight = SingleFlight()
+
+        with self.assertRaises(ValueError):
+            flight.do("key", lambda: (_ for _ in ()).throw(ValueError("boom")))
+
+        self.assertEqual(flight.do("key", lambda: 42), 42)
+        self.assertEqual(flight.stats.executed, 2)
+
+
+class TestAsyncSingleFlight(unittest.TestCase):
+    def test_gathered_claim_reads_share_one_request(self):
+        """Test that gathered reads of one claim on the async client send a single request."""
+        requests = []
+
+        async def handler(request):
+            requests.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=[{"filenumber": 7}])
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+            ) as client:
+                return await asyncio.gather(*(client.claims.get_single_claim(7) for _ in range(20)))
+
+        results = asyncio.run(run())
+
+        self.assertEqual(requests, ["/api/getclaims/7"])
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_gathered_errors_are_shared(self):
+        """Test that every gathered caller receives the shared request's error."""
+        requests = []
+
+        async def handler(request):
+            requests.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(500, json={"message": "Server error"})
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+            ) as client:
+                return await asyncio.gather(
+                    *(client.claims.get_single_claim(7) for _ in range(3)), return_exceptions=True
+                )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(requests), 1)
+        self.assertTrue(all(isinstance(result, APIError) for result in results))
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that cancelling the caller that started a shared read leaves the callers that joined it unaffected."""
+        requests = []
+
+        async def handler(request):
+            requests.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=[{"filenumber": 7}])
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+            ) as client:
+                leader = asyncio.create_task(client.claims.get_single_claim(7))
+                await asyncio.sleep(0.01)
+                follower = asyncio.create_task(client.claims.get_single_claim(7))
+                await asyncio.sleep(0.01)
+                leader.cancel()
+                claim = await follower
+                return leader, follower, claim
+
+        leader, follower, claim = asyncio.run(run())
+
+        self.assertTrue(leader.cancelled())
+        self.assertFalse(follower.cancelled())
+        self.assertEqual(claim.filenumber, 7)
+        self.assertEqual(requests, ["/api/getclaims/7"])
+
+    def test_key_is_released_when_every_caller_is_cancelled(self):
+        """Test that a call whose callers were all cancelled still finishes and frees its key."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        async def run():
+            caller = asyncio.create_task(flight.do("key", fetch))
+            await asyncio.sleep(0)
+            caller.cancel()
+            await asyncio.sleep(0.05)
+            return await flight.do("key", fetch)
+
+        self.assertEqual(asyncio.run(run()), 2)
+        self.assertEqual(flight.stats.executed, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,299 @@
+import unittest
+import asyncio
+import threading
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from hawkeye_sdk_for_python import (
+    HawkeyeClient,
+    AsyncHawkeyeClient,
+    APIError,
+    RetryPolicy,
+    TransportSettings,
+    RateLimiter,
+    TokenBucket,
+)
+from hawkeye_sdk_for_python.ratelimit import endpoint_for
+from hawkeye_sdk_for_python.transports import RetryTransport, AsyncRetryTransport, RateLimitTransport, parse_retry_after
+
+from helpers import FakeClock
+
+
+def scripted(*outcomes):
+    """Returns a handler that replays the given statuses or exceptions in order and records each request."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        outcome = outcomes[min(len(calls), len(outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        body = [{"filenumber": 1}] if status == 200 else {"message": "try later"}
+        return httpx.Response(status, json=body, headers=headers)
+
+    return handler, calls
+
+
+class TestRetryTransport(unittest.TestCase):
+    def setUp(self):
+        self.sleeps = []
+
+    def _transport(self, handler, **policy):
+        policy.setdefault("jitter", False)
+        return RetryTransport(httpx.MockTransport(handler), RetryPolicy(**policy), sleep=self.sleeps.append)
+
+    def test_retries_server_errors_with_exponential_backoff(self):
+        """Test that 5xx responses are retried with doubling delays."""
+        handler, calls = scripted(503, 502, 200)
+        transport = self._transport(handler, max_attempts=3, backoff_factor=1.0)
+
+        response = transport.handle_request(httpx.Request("GET", "https://example.com/api/getclaims/1"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(self.sleeps, [1.0, 2.0])
+
+    def test_gives_up_after_max_attempts(self):
+        """Test that the last failing response is returned once attempts run out."""
+        handler, calls = scripted(500)
+        transport = self._transport(handler, max_attempts=4, backoff_factor=0.1, max_backoff=0.15)
+
+        response = transport.handle_request(httpx.Request("GET", "https://example.com/api/getclaims/1"))
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(self.sleeps, [0.1, 0.15, 0.15])
+
+    def test_honours_retry_after(self):
+        """Test that Retry-After overrides the computed backoff."""
+        handler, calls = scripted((429, {"Retry-After": "7"}), 200)
+        transport = self._transport(handler)
+
+        response = transport.handle_request(httpx.Request("GET", "https://example.com/api/inscompanies"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.sleeps, [7.0])
+
+    def test_gives_up_when_retry_after_exceeds_limit(self):
+        """Test that a Retry-After longer than max_retry_after returns the response instead of waiting."""
+        handler, calls = scripted((503, {"Retry-After": "3600"}), 200)
+        transport = self._transport(handler, max_retry_after=60)
+
+        response = transport.handle_request(httpx.Request("GET", "https://example.com/api/getclaims/1"))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {"message": "try later"})
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_does_not_retry_mutations_by_default(self):
+        """Test that POST requests are not retried unless retry_mutations is set."""
+        handler, calls = scripted(503, 200)
+        transport = self._transport(handler)
+
+        response = transport.handle_request(httpx.Request("POST", "https://example.com/api/createclaim", json={}))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(calls), 1)
+
+    def test_retries_mutations_when_opted_in(self):
+        """Test that POST requests are retried and resend the same body when opted in."""
+        handler, calls = scripted(503, 200)
+        transport = self._transport(handler, retry_mutations=True)
+
+        response = transport.handle_request(httpx.Request("POST", "https://example.com/api/savefile", json={"link": "x"}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([call.content for call in calls], [b'{"link":"x"}'] * 2)
+
+    def test_retries_transport_errors(self):
+        """Test that connection failures are retried and re-raised when attempts run out."""
+        handler, calls = scripted(httpx.ConnectError("refused"), 200)
+        transport = self._transport(handler)
+
+        self.assertEqual(transport.handle_request(httpx.Request("GET", "https://example.com/api/getclaims/1")).status_code, 200)
+
+        handler, calls = scripted(httpx.ReadTimeout("slow"))
+        transport = self._transport(handler, max_attempts=2)
+        with self.assertRaises(httpx.ReadTimeout):
+            transport.handle_request(httpx.Request("GET", "https://example.com/api/getclaims/1"))
+        self.assertEqual(len(calls), 2)
+
+    def test_jitter_stays_within_backoff(self):
+        """Test that full jitter never exceeds the exponential delay."""
+        policy = RetryPolicy(backoff_factor=1.0, jitter=True)
+
+        for attempt in range(1, 6):
+            self.assertLessEqual(policy.backoff(attempt), 2 ** (attempt - 1))
+            self.assertGreaterEqual(policy.backoff(attempt), 0)
+
+    def test_parse_retry_after(self):
+        """Test both Retry-After formats and garbage input."""
+        future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+        self.assertEqual(parse_retry_after("12"), 12.0)
+        self.assertAlmostEqual(parse_retry_after(future), 30, delta=2)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class TestClientRetries(unittest.TestCase):
+    def test_client_without_policy_fails_fast(self):
+        """Test that without a retry policy a 503 surfaces immediately as APIError."""
+        handler, calls = scripted(503, 200)
+        client = HawkeyeClient("test-auth-token", transport_settings=TransportSettings(transport=httpx.MockTransport(handler)))
+
+        with self.assertRaises(APIError):
+            client.claims.get_single_claim(1)
+        self.assertEqual(len(calls), 1)
+
+    def test_client_with_policy_recovers(self):
+        """Test that a retry policy on the client absorbs a short outage."""
+        handler, calls = scripted(503, 429, 200)
+        client = HawkeyeClient(
+            "test-auth-token",
+            transport_settings=TransportSettings(transport=httpx.MockTransport(handler)),
+            retry_policy=RetryPolicy(backoff_factor=0, jitter=False),
+        )
+
+        self.assertEqual(client.claims.get_single_claim(1).filenumber, 1)
+        self.assertEqual(len(calls), 3)
+
+    def test_async_retry_transport(self):
+        """Test that the async transport retries with an awaited sleep."""
+        handler, calls = scripted(500, 200)
+        sleeps = []
+
+        async def sleep(delay):
+            sleeps.append(delay)
+
+        async def run():
+            transport = AsyncRetryTransport(httpx.MockTransport(handler), RetryPolicy(jitter=False), sleep=sleep)
+            return await transport.handle_async_request(httpx.Request("GET", "https://example.com/api/getclaims/1"))
+
+        self.assertEqual(asyncio.run(run()).status_code, 200)
+        self.assertEqual(sleeps, [0.5])
+
+    def test_async_gives_up_when_retry_after_exceeds_limit(self):
+        """Test that the async transport also returns a response whose Retry-After exceeds the limit."""
+        handler, calls = scripted((429, {"Retry-After": "600"}), 200)
+        sleeps = []
+
+        async def sleep(delay):
+            sleeps.append(delay)
+
+        async def run():
+            transport = AsyncRetryTransport(httpx.MockTransport(handler), RetryPolicy(max_retry_after=120), sleep=sleep)
+            return await transport.handle_async_request(httpx.Request("GET", "https://example.com/api/getclaims/1"))
+
+        self.assertEqual(asyncio.run(run()).status_code, 429)
+        self.assertEqual((len(calls), sleeps), (1, []))
+
+    def test_async_client_with_policy(self):
+        """Test that AsyncHawkeyeClient wires the retry policy into its transport."""
+        handler, calls = scripted(502, 200)
+
+        async def run():
+            async with AsyncHawkeyeClient(
+                "test-auth-token",
+                transport_settings=TransportSettings(async_transport=httpx.MockTransport(handler)),
+                retry_policy=RetryPolicy(backoff_factor=0),
+            ) as client:
+                return await client.claims.get_single_claim(1)
+
+        self.assertEqual(asyncio.run(run()).filenumber, 1)
+        self.assertEqual(len(calls), 2)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_token_bucket_burst_then_rate(self):
+        """Test that a bucket allows its burst immediately and then spaces requests at the rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.5, 1.0, 1.5])
+
+        clock.now = 10.0
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_token_bucket_is_thread_safe(self):
+        """Test that concurrent reservations never hand out the same slot twice."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=1, clock=clock)
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(100):
+                delay = bucket.reserve()
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(delays), [n / 10 for n in range(800)])
+
+    def test_endpoint_for(self):
+        """Test that request paths map to their endpoint under the /api prefix."""
+        self.assertEqual(endpoint_for("/api/getclaims/all/true"), "/getclaims")
+        self.assertEqual(endpoint_for("/api/createLogTrailEntry"), "/createLogTrailEntry")
+        self.assertIsNone(endpoint_for("/api/unknown"))
+
+    def test_rejects_unknown_endpoint(self):
+        """Test that misspelt endpoint budgets are caught early."""
+        with self.assertRaises(ValueError):
+            RateLimiter(endpoints={"/getclaim": TokenBucket(rate=1)})
+
+    def test_per_endpoint_budget(self):
+        """Test that endpoint buckets only apply to their endpoint and combine with the default bucket."""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            default=TokenBucket(rate=100, burst=100, clock=clock),
+            endpoints={"/createclaim": TokenBucket(rate=1, burst=1, clock=clock)},
+        )
+
+        self.assertEqual(limiter.reserve("/api/createclaim"), 0.0)
+        self.assertEqual(limiter.reserve("/api/createclaim"), 1.0)
+        self.assertEqual(limiter.reserve("/api/getclaims/1"), 0.0)
+
+    def test_transport_sleeps_for_reservation(self):
+        """Test that the transport waits out the reserved delay before sending."""
+        clock = FakeClock()
+        sleeps = []
+        handler, calls = scripted(200)
+        transport = RateLimitTransport(
+            httpx.MockTransport(handler),
+            RateLimiter(endpoints={"/getclaims": TokenBucket(rate=4, burst=1, clock=clock)}),
+            sleep=sleeps.append,
+        )
+
+        for _ in range(3):
+            transport.handle_request(httpx.Request("GET", "https://example.com/api/getclaims/1"))
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(sleeps, [0.25, 0.5])
+
+    def test_limiter_shared_between_clients(self):
+        """Test that two clients drawing from one limiter share its budget."""
+        clock = FakeClock()
+        limiter = RateLimiter(default=TokenBucket(rate=1000, burst=2, clock=clock))
+        handler, calls = scripted(200)
+        settings = TransportSettings(transport=httpx.MockTransport(handler))
+        first = HawkeyeClient("test-auth-token", transport_settings=settings, rate_limiter=limiter)
+        second = HawkeyeClient("test-auth-token", transport_settings=settings, rate_limiter=limiter)
+
+        first.claims.get_single_claim(1)
+        second.claims.get_single_claim(1)
+
+        self.assertGreater(limiter.default.reserve(), 0)
+
+if __name__ == "__main__":
+    unittest.main()